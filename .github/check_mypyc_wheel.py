@@ -0,0 +1,25 @@
+"""Check that an installed ``array_api`` wheel is compiled and works."""  # noqa: INP001
+
+import os
+import subprocess
+import sys
+
+import numpy as np
+
+import array_api as ap
+from array_api._mypyc import is_compiled
+
+if not is_compiled():
+    sys.exit("array_api was not compiled with mypyc")
+
+x = np.linspace(0, 1, num=5)
+assert (ap.cos(x) == np.cos(x)).all()  # noqa: S101
+assert (ap.multiply(x, 2.0) == x * 2.0).all()  # noqa: S101
+
+# The pure-Python modules must still be importable from the wheel.
+code = "from array_api._mypyc import is_compiled; assert not is_compiled()"
+subprocess.run(  # noqa: S603
+    [sys.executable, "-c", code],
+    env={**os.environ, "ARRAYAPI_PURE_PYTHON": "1"},
+    check=True,
+)
@@ -0,0 +1,14 @@
+"""
+Benchmarks for `array_api`.
+
+The benchmarks are written for `asv <https://asv.readthedocs.io>`_, which
+tracks them across commits. From the repository root::
+
+    asv run                    # benchmark the latest commit
+    asv continuous main HEAD   # compare against ``main``
+    asv publish && asv preview # browse the history
+
+To run the dispatch benchmarks for a single function::
+
+    asv run --bench "dispatch.TimeWrappers.time_dispatch" --python=same
+"""
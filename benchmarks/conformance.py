@@ -0,0 +1,87 @@
+"""
+Benchmarks for protocol conformance checks.
+
+Compares the memoized :func:`array_api._conformance.conforms` against the
+``runtime_checkable`` :func:`isinstance` check that it replaces. Run directly
+for a quick comparison::
+
+    python -m benchmarks.conformance
+"""
+
+from __future__ import annotations
+
+import timeit
+from typing import Protocol, runtime_checkable
+
+import numpy as np
+
+from array_api import Array, ArrayAPINamespace, validate_namespace
+from array_api._conformance import conforms, protocol_members
+
+
+def _member(*_: object) -> None:
+    return None
+
+
+# A class providing every member of the `Array` protocol.
+ConformingArray = type(
+    "ConformingArray",
+    (),
+    {name: _member for name in protocol_members(Array)},
+)
+
+INPUTS = {"array": ConformingArray, "scalar": float}
+
+
+@runtime_checkable
+class CheckableNamespace(ArrayAPINamespace, Protocol):
+    """`ArrayAPINamespace`, checkable with `isinstance`."""
+
+
+class TimeArrayConformance:
+    """Check an object against the full `Array` protocol."""
+
+    params = tuple(INPUTS)
+    param_names = ("input",)
+
+    def setup(self, kind: str) -> None:
+        """Create the input and warm the conformance cache."""
+        self.x = INPUTS[kind]()
+        conforms(self.x, Array)
+
+    def time_isinstance(self, kind: str) -> None:  # noqa: ARG002
+        """Time the ``runtime_checkable`` check."""
+        isinstance(self.x, Array)
+
+    def time_conforms(self, kind: str) -> None:  # noqa: ARG002
+        """Time the memoized check."""
+        conforms(self.x, Array)
+
+
+class TimeNamespaceValidation:
+    """Check NumPy against the full `ArrayAPINamespace` protocol."""
+
+    def setup(self) -> None:
+        """Warm the validation cache."""
+        validate_namespace(np)
+
+    def time_isinstance(self) -> None:
+        """Time the ``runtime_checkable`` check."""
+        isinstance(np, CheckableNamespace)
+
+    def time_validate_namespace(self) -> None:
+        """Time the memoized check."""
+        validate_namespace(np)
+
+
+if __name__ == "__main__":
+    number = 100_000
+    for kind, cls in INPUTS.items():
+        for name in ("isinstance", "conforms"):
+            t = timeit.timeit(
+                f"{name}(x, Array)",
+                globals={**globals(), "x": cls()},
+                number=number,
+            )
+            msg = f"{name:>10} {kind:>6}: {t / number * 1e9:9.1f} ns"
+            print(msg)  # noqa: T201
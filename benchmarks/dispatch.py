@@ -0,0 +1,310 @@
+"""
+Benchmarks of the dispatch overhead of every public wrapper.
+
+Each wrapper in ``array_api.__all__`` and ``array_api.linalg.__all__`` is
+timed three ways, for small arrays (where dispatch dominates) and large arrays
+(where the backend kernel dominates):
+
+- ``time_dispatch``: ``array_api.<name>(...)``.
+- ``time_namespace``: ``x.__array_namespace__().<name>(...)``.
+- ``time_kernel``: the backend function, looked up in advance.
+
+The backends are local reference implementations of the standard. Backends
+that are not installed are skipped.
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable
+from math import isqrt
+from typing import Any
+
+import array_api
+import array_api.linalg
+from array_api import ArrayAPINamespace
+from array_api._conformance import protocol_members
+from array_api.linalg import ArrayAPILinAlgNamespace
+
+BACKENDS = ("array_api_strict", "numpy")
+SIZES = {"small": 16, "large": 2**20}
+# Integer inputs are in ``[0, 8)``. Booleans are whether they exceed the middle.
+INT_RANGE = 8
+# Matrices are square. Large ones are smaller as linear algebra is O(n^3).
+MATRIX_SIDES = {"small": 4, "large": 256}
+
+# The wrappers, i.e. the public functions that are part of the standard.
+FUNCTIONS = tuple(
+    name
+    for name in array_api.__all__
+    if name in protocol_members(ArrayAPINamespace)
+    and callable(getattr(array_api, name))
+)
+LINALG_FUNCTIONS = tuple(
+    name
+    for name in array_api.linalg.__all__
+    if name in protocol_members(ArrayAPILinAlgNamespace)
+    and callable(getattr(array_api.linalg, name))
+)
+
+
+class Inputs:
+    """Lazily created benchmark inputs for a namespace and size."""
+
+    def __init__(self, xp: Any, size: str) -> None:  # noqa: ANN401
+        """Make inputs for the namespace ``xp`` of a size in `SIZES`."""
+        self.xp = xp
+        self.n = SIZES[size]
+        self.side = MATRIX_SIDES[size]
+
+    @property
+    def x(self) -> Any:  # noqa: ANN401
+        """Floats in ``(0, 1)``, the domain of every elementwise function."""
+        return self.xp.linspace(0.1, 0.9, self.n)
+
+    @property
+    def x_above_one(self) -> Any:  # noqa: ANN401
+        """Floats above 1, the domain of `acosh`."""
+        return self.xp.linspace(1.1, 1.9, self.n)
+
+    @property
+    def x_sqrt(self) -> Any:  # noqa: ANN401
+        """Floats, for functions whose output has ``n**2`` elements."""
+        return self.xp.linspace(0.1, 0.9, isqrt(self.n))
+
+    @property
+    def x_row(self) -> Any:  # noqa: ANN401
+        """Floats with a leading singleton axis."""
+        return self.xp.reshape(self.x, (1, self.n))
+
+    @property
+    def i(self) -> Any:  # noqa: ANN401
+        """Small non-negative integers."""
+        return self.xp.arange(self.n) % INT_RANGE
+
+    @property
+    def b(self) -> Any:  # noqa: ANN401
+        """Booleans."""
+        return self.i >= INT_RANGE // 2
+
+    @property
+    def m(self) -> Any:  # noqa: ANN401
+        """A well-conditioned symmetric positive-definite matrix."""
+        xp = self.xp
+        # Near the identity, so the determinant does not overflow.
+        return xp.eye(self.side) + xp.ones((self.side, self.side)) / self.side
+
+    @property
+    def v3(self) -> Any:  # noqa: ANN401
+        """A stack of 3-vectors."""
+        return self.xp.reshape(
+            self.xp.linspace(0.1, 0.9, 3 * self.side), (-1, 3)
+        )
+
+
+_Case = Callable[[Inputs], tuple[tuple[Any, ...], dict[str, Any]]]
+
+
+def _args(*names: str, **kwargs: Any) -> _Case:  # noqa: ANN401
+    """Make a case calling a function with `Inputs` attributes as arguments."""
+
+    def case(inp: Inputs) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        return tuple(getattr(inp, name) for name in names), kwargs
+
+    return case
+
+
+UNARY = _args("x")
+BINARY = _args("x", "x")
+INTEGERS = _args("i", "i")
+BOOLEANS = _args("b", "b")
+MATRIX = _args("m")
+
+# Arguments of each function. Elementwise functions not listed are unary or
+# binary on floats in ``(0, 1)``.
+CASES: dict[str, _Case] = {
+    # creation
+    "empty_like": UNARY,
+    "full_like": lambda inp: ((inp.x, 1.0), {}),
+    "meshgrid": _args("x_sqrt", "x_sqrt"),
+    "ones_like": UNARY,
+    "tril": MATRIX,
+    "triu": MATRIX,
+    "zeros_like": UNARY,
+    # data types
+    "astype": lambda inp: ((inp.x, inp.xp.float32), {}),
+    "broadcast_arrays": _args("x", "x_row"),
+    "broadcast_to": lambda inp: ((inp.x,), {"shape": (2, inp.n)}),
+    # elementwise
+    "acosh": _args("x_above_one"),
+    "bitwise_and": INTEGERS,
+    "bitwise_invert": _args("i"),
+    "bitwise_left_shift": INTEGERS,
+    "bitwise_or": INTEGERS,
+    "bitwise_right_shift": INTEGERS,
+    "bitwise_xor": INTEGERS,
+    "logical_and": BOOLEANS,
+    "logical_not": _args("b"),
+    "logical_or": BOOLEANS,
+    "logical_xor": BOOLEANS,
+    # linear algebra
+    "matmul": _args("m", "m"),
+    "matrix_transpose": MATRIX,
+    "tensordot": lambda inp: ((inp.m, inp.m), {"axes": 1}),
+    "vecdot": BINARY,
+    # manipulation
+    "concat": lambda inp: (([inp.x, inp.x],), {}),
+    "expand_dims": lambda inp: ((inp.x,), {"axis": 0}),
+    "flip": UNARY,
+    "permute_dims": lambda inp: ((inp.m,), {"axes": (1, 0)}),
+    "reshape": lambda inp: ((inp.x,), {"shape": (2, -1)}),
+    "roll": lambda inp: ((inp.x,), {"shift": 1}),
+    "squeeze": lambda inp: ((inp.x_row,), {"axis": 0}),
+    "stack": lambda inp: (([inp.x, inp.x],), {}),
+    # searching
+    "where": _args("b", "x", "x"),
+}
+
+LINALG_CASES: dict[str, _Case] = {
+    "cholesky": MATRIX,
+    "cross": _args("v3", "v3"),
+    "det": MATRIX,
+    "diagonal": MATRIX,
+    "eigh": MATRIX,
+    "eigvalsh": MATRIX,
+    "inv": MATRIX,
+    "matmul": _args("m", "m"),
+    "matrix_norm": MATRIX,
+    "matrix_power": lambda inp: ((inp.m, 2), {}),
+    "matrix_rank": MATRIX,
+    "matrix_transpose": MATRIX,
+    "outer": _args("x_sqrt", "x_sqrt"),
+    "pinv": MATRIX,
+    "qr": MATRIX,
+    "slogdet": MATRIX,
+    "solve": _args("m", "m"),
+    "svd": MATRIX,
+    "svdvals": MATRIX,
+    "tensordot": lambda inp: ((inp.m, inp.m), {"axes": 1}),
+    "trace": MATRIX,
+    "vecdot": BINARY,
+    "vector_norm": UNARY,
+}
+
+
+BINARY_ELEMENTWISE = frozenset(
+    (
+        "add",
+        "atan2",
+        "bitwise_and",
+        "bitwise_left_shift",
+        "bitwise_or",
+        "bitwise_right_shift",
+        "bitwise_xor",
+        "divide",
+        "equal",
+        "floor_divide",
+        "greater",
+        "greater_equal",
+        "less",
+        "less_equal",
+        "logaddexp",
+        "logical_and",
+        "logical_or",
+        "logical_xor",
+        "multiply",
+        "not_equal",
+        "pow",
+        "remainder",
+        "subtract",
+    )
+)
+
+
+def _default_case(name: str) -> _Case:
+    """Arguments of a function that is not in `CASES`."""
+    return BINARY if name in BINARY_ELEMENTWISE else UNARY
+
+
+def _namespace(backend: str) -> Any:  # noqa: ANN401
+    """Import a backend, skipping the benchmark if it is not installed."""
+    try:
+        return importlib.import_module(backend)
+    except ImportError:
+        raise NotImplementedError from None
+
+
+class _TimeWrappers:
+    """Time a dispatch wrapper against calling the backend directly."""
+
+    module: Any
+    cases: dict[str, _Case]
+    param_names = ("backend", "function", "size")
+
+    def setup(self, backend: str, name: str, size: str) -> None:
+        """Create the inputs and look up the functions."""
+        xp = _namespace(backend)
+        case = self.cases.get(name) or _default_case(name)
+        self.args, self.kwargs = case(Inputs(xp, size))
+        self.name = name
+
+        # The first array argument, whose namespace `time_namespace` uses.
+        self.x = next(
+            a for a in self._flat_args() if hasattr(a, "__array_namespace__")
+        )
+        self.wrapper = getattr(self.module, name)
+        self.kernel = self._lookup(self.x.__array_namespace__(), name)
+        if self.kernel is None:
+            raise NotImplementedError  # not implemented by the backend
+
+        try:
+            self.wrapper(*self.args, **self.kwargs)  # warm the caches
+        except TypeError:
+            # The backend predates the signature in the standard, e.g. the
+            # ``descending`` keyword of `sort` in NumPy 1.x.
+            raise NotImplementedError from None
+
+    def _flat_args(self) -> list[Any]:
+        args = self.args[0] if isinstance(self.args[0], list) else self.args
+        return list(args)
+
+    @staticmethod
+    def _lookup(
+        xp: Any, name: str  # noqa: ANN401
+    ) -> Callable[..., Any] | None:
+        return getattr(xp, name, None)
+
+    def time_dispatch(self, *_: str) -> None:
+        """Time ``array_api.<name>(...)``."""
+        self.wrapper(*self.args, **self.kwargs)
+
+    def time_namespace(self, *_: str) -> None:
+        """Time ``x.__array_namespace__().<name>(...)``."""
+        xp = self.x.__array_namespace__()
+        self._lookup(xp, self.name)(*self.args, **self.kwargs)  # type: ignore[misc]
+
+    def time_kernel(self, *_: str) -> None:
+        """Time the backend function alone."""
+        self.kernel(*self.args, **self.kwargs)  # type: ignore[misc]
+
+
+class TimeWrappers(_TimeWrappers):
+    """Time the wrappers in ``array_api``."""
+
+    module = array_api
+    cases = CASES
+    params = (list(BACKENDS), list(FUNCTIONS), list(SIZES))
+
+
+class TimeLinalgWrappers(_TimeWrappers):
+    """Time the wrappers in ``array_api.linalg``."""
+
+    module = array_api.linalg
+    cases = LINALG_CASES
+    params = (list(BACKENDS), list(LINALG_FUNCTIONS), list(SIZES))
+
+    @staticmethod
+    def _lookup(
+        xp: Any, name: str  # noqa: ANN401
+    ) -> Callable[..., Any] | None:
+        return getattr(getattr(xp, "linalg", None), name, None)
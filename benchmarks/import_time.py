@@ -0,0 +1,80 @@
+"""
+Benchmarks for the import time of `array_api`.
+
+``import array_api`` imports submodules lazily, on first use of one of their
+names, unless ``ARRAYAPI_EAGER_IMPORT=1``. Run directly to compare the time
+spent importing ``array_api`` modules (as reported by ``python -X importtime``)
+in both modes::
+
+    python -m benchmarks.import_time
+"""
+
+from __future__ import annotations
+
+import os
+import statistics
+import subprocess
+import sys
+
+EAGER = "import os; os.environ['ARRAYAPI_EAGER_IMPORT'] = '1'\n"
+
+
+def timeraw_import() -> str:
+    """Time ``import array_api``."""
+    return "import array_api"
+
+
+def timeraw_import_and_call() -> str:
+    """Time importing `array_api` and looking up one elementwise function."""
+    return "import array_api; array_api.cos"
+
+
+def timeraw_import_eager() -> str:
+    """Time ``import array_api``, importing all submodules."""
+    return EAGER + "import array_api"
+
+
+def array_api_import_time(code: str, *, eager: bool = False) -> int:
+    """
+    Time spent importing ``array_api`` modules, in microseconds.
+
+    Parameters
+    ----------
+    code : str
+        The code to run in a fresh interpreter.
+    eager : bool, optional keyword-only
+        Whether to import all submodules of ``array_api`` up front.
+
+    Returns
+    -------
+    int
+        The summed self time of the ``array_api`` modules. Their dependencies
+        (e.g. `typing`), which any application already imports, are excluded.
+
+    """
+    env = {**os.environ, "ARRAYAPI_EAGER_IMPORT": "1" if eager else "0"}
+    stderr = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line.removeprefix("import time:").split("|")
+        if name.strip().startswith("array_api"):
+            total += int(self_us)
+    return total
+
+
+if __name__ == "__main__":
+    for code in ("import array_api", "import array_api; array_api.cos"):
+        for eager in (True, False):
+            times = [array_api_import_time(code, eager=eager) for _ in range(9)]
+            mode = "eager" if eager else "lazy"
+            msg = f"{code:35s} {mode:>5}: {statistics.median(times):6.0f} us"
+            print(msg)  # noqa: T201
@@ -0,0 +1,37 @@
+"""
+Benchmarks of reductions split into threads.
+
+NumPy releases the GIL in its reduction loops, so the pieces of a reduction run
+concurrently on as many cores as there are workers. With a single core, the
+benchmarks measure the overhead of splitting.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+import array_api
+
+SHAPE = (2048, 2048)
+WORKERS = (1, 4)
+
+
+class TimeParallelSum:
+    """Sum a large array along each axis."""
+
+    params = ((0, 1, None), WORKERS)
+    param_names = ("axis", "workers")
+
+    def setup(self, axis: int | None, workers: int) -> None:  # noqa: ARG002
+        """Make the array."""
+        self.x = np.random.default_rng(0).random(SHAPE)
+
+    def time_sum(self, axis: int | None, workers: int) -> None:
+        """Sum with `array_api.parallel_reductions`."""
+        with array_api.parallel_reductions(workers):
+            array_api.sum(self.x, axis=axis)
+
+    def time_var(self, axis: int | None, workers: int) -> None:
+        """Compute the variance with `array_api.parallel_reductions`."""
+        with array_api.parallel_reductions(workers):
+            array_api.var(self.x, axis=axis)
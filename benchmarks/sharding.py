@@ -0,0 +1,46 @@
+"""
+Benchmarks of elementwise functions sharded over processes.
+
+The pipeline is a chain of `array_api` wrappers, so that the dispatch of each
+call is part of what is sharded. With a single core, the benchmarks measure
+the overhead of copying to and from shared memory.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+import array_api
+
+SHAPE = (4096, 1024)
+WORKERS = (1, 4)
+
+
+def pipeline(x: Any, y: Any) -> Any:  # noqa: ANN401
+    """Chain elementwise functions."""
+    return array_api.exp(array_api.multiply(array_api.sin(x), y))
+
+
+class TimeMapShards:
+    """Compute a pipeline of elementwise functions."""
+
+    params = WORKERS
+    param_names = ("workers",)
+
+    def setup(self, workers: int) -> None:
+        """Make the inputs, and start the pool."""
+        rng = np.random.default_rng(0)
+        self.x, self.y = rng.random(SHAPE), rng.random(SHAPE)
+        array_api.map_shards(
+            pipeline, self.x[:8], self.y[:8], max_workers=workers
+        )
+
+    def time_direct(self, workers: int) -> None:  # noqa: ARG002
+        """Compute the pipeline in this process."""
+        pipeline(self.x, self.y)
+
+    def time_map_shards(self, workers: int) -> None:
+        """Compute the pipeline with `array_api.map_shards`."""
+        array_api.map_shards(pipeline, self.x, self.y, max_workers=workers)
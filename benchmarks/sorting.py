@@ -0,0 +1,76 @@
+"""
+Benchmarks of partial sorts and searches of sorted arrays.
+
+`array_api.topk` selects with NumPy's own `numpy.argpartition`, and with the
+fallback for namespaces without one, against a full `numpy.argsort`.
+`array_api.searchsorted` searches batches of rows at once, against a loop of
+`numpy.searchsorted`, which searches a single row.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+import array_api
+from array_api._selection import topk
+
+SIZES = (10**6, 10**7)
+K = 100
+
+
+class _WithoutPartition:
+    """NumPy, without its partitions, so that the fallback is used."""
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        if name in {"argpartition", "partition"}:
+            raise AttributeError(name)
+        return getattr(np, name)
+
+
+class TimeTopK:
+    """Select the greatest elements of a large array."""
+
+    params = (SIZES,)
+    param_names = ("size",)
+
+    def setup(self, size: int) -> None:
+        """Make the array."""
+        self.x = np.random.default_rng(0).random(size)
+        self.fallback = _WithoutPartition()
+
+    def time_topk(self, size: int) -> None:  # noqa: ARG002
+        """Select with `numpy.argpartition`."""
+        array_api.topk(self.x, K)
+
+    def time_topk_fallback(self, size: int) -> None:  # noqa: ARG002
+        """Select with the fallback."""
+        topk(self.fallback, self.x, K, -1, descending=True)  # type: ignore[arg-type]
+
+    def time_argsort(self, size: int) -> None:  # noqa: ARG002
+        """Sort fully, for comparison."""
+        np.argsort(self.x)[-K:]
+
+
+class TimeSearchSorted:
+    """Find the buckets of values in batches of sorted edges."""
+
+    params = ((10, 1000),)
+    param_names = ("edges",)
+
+    def setup(self, edges: int) -> None:
+        """Make the edges and the values."""
+        rng = np.random.default_rng(0)
+        rows = 10**6 // edges
+        self.edges = np.sort(rng.random((rows, edges)), axis=1)
+        self.values = rng.random((rows, 10))
+
+    def time_searchsorted(self, edges: int) -> None:  # noqa: ARG002
+        """Search all of the rows at once."""
+        array_api.searchsorted(self.edges, self.values)
+
+    def time_searchsorted_rows(self, edges: int) -> None:  # noqa: ARG002
+        """Search each row with `numpy.searchsorted`, for comparison."""
+        for e, v in zip(self.edges, self.values, strict=True):
+            np.searchsorted(e, v)
@@ -0,0 +1,86 @@
+"""
+Benchmarks of copying many arrays between devices.
+
+The arrays are of a stand-in namespace with CPU "devices", whose ``to_device``
+waits for a fixed latency, as a synchronous host-device round trip does, so
+the benchmarks run without a GPU. The latency is spent in `time.sleep`, which
+releases the GIL like the copies of GPU libraries do.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from typing import Any
+
+import numpy as np
+
+import array_api
+
+# The latency of each copy, in seconds.
+LATENCY = 1e-4
+N_ARRAYS = 64
+N_DEVICES = (1, 4)
+
+
+class StandInDevice:
+    """A CPU device, standing in for e.g. a GPU."""
+
+    def __init__(self, name: str) -> None:
+        """Make a device called ``name``."""
+        self.name = name
+
+    def __repr__(self) -> str:
+        """Return the representation of the device."""
+        return f"StandInDevice({self.name!r})"
+
+
+class StandInArray:
+    """A NumPy array on a `StandInDevice`."""
+
+    def __init__(self, array: np.ndarray, device: StandInDevice) -> None:
+        """Wrap ``array``, as on ``device``."""
+        self.array = array
+        self.device = device
+
+    def __array_namespace__(
+        self, *, api_version: str | None = None
+    ) -> Any:  # noqa: ANN401
+        """Return the namespace of the array, this module."""
+        return sys.modules[__name__]
+
+    def to_device(
+        self,
+        device: StandInDevice,
+        /,
+        *,
+        stream: Any = None,  # noqa: ANN401, ARG002
+    ) -> StandInArray:
+        """Copy the array to ``device``, taking `LATENCY`."""
+        time.sleep(LATENCY)
+        return StandInArray(self.array.copy(), device)
+
+
+class TimeToDeviceMany:
+    """Copy arrays from one or more devices to another."""
+
+    params = N_DEVICES
+    param_names = ("devices",)
+
+    def setup(self, devices: int) -> None:
+        """Make `N_ARRAYS` arrays spread over ``devices`` devices."""
+        sources = [StandInDevice(f"gpu:{i}") for i in range(devices)]
+        self.arrays = [
+            StandInArray(np.ones(1024), sources[i % devices])
+            for i in range(N_ARRAYS)
+        ]
+        self.host = StandInDevice("cpu")
+
+    def time_to_device(self, devices: int) -> None:  # noqa: ARG002
+        """Copy the arrays one at a time."""
+        for x in self.arrays:
+            x.to_device(self.host)
+
+    def time_to_device_many(self, devices: int) -> None:  # noqa: ARG002
+        """Copy the arrays with `array_api.to_device_many`."""
+        array_api.to_device_many(self.arrays, self.host)
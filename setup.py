@@ -6,7 +6,6 @@ import os
 import sys
 from pathlib import Path
 
-from mypyc.build import mypycify
 from setuptools import setup
 
 ##############################################################################
@@ -57,7 +56,10 @@ def find_python_files(
     return files
 
 
-# To compile with mypyc, a mypyc checkout must be present on the PYTHONPATH
+# To compile with mypyc, a mypyc checkout must be present on the PYTHONPATH.
+# Wheels are compiled with the `hatch-mypyc` build hook configured in
+# ``pyproject.toml``; this is for in-place builds with
+# ``ARRAYAPI_USE_MYPYC=1 python setup.py build_ext --inplace``.
 if os.getenv("ARRAYAPI_USE_MYPYC", None) == "1":
     USE_MYPYC = True
 
@@ -66,14 +68,28 @@ if not USE_MYPYC:
     ext_modules = []
 
 else:
+    from mypyc.build import mypycify
+
     print("BUILDING `array_api` WITH MYPYC")  # noqa: T201
 
+    # Keep in sync with `tool.hatch.build.targets.wheel.hooks.mypyc.exclude`.
     blocklist: list[str] = [
-        "array_api/setup_package.py",
+        "array_api/__init__.py",  # selects the compiled or pure-Python modules
+        "array_api/_mypyc.py",  # selects the compiled or pure-Python modules
+        "array_api/linalg/__init__.py",  # star re-exports
+        "array_api/_version.py",  # generated
         "array_api/_types.py",  # runtime_checkable protocols
-        "array_api/array.py",  # runtime_checkable protocols
-        "array_api/device.py",  # runtime_checkable protocols
-        "array_api/dtype.py",  # runtime_checkable protocols
+        "array_api/_array.py",  # runtime_checkable protocols
+        "array_api/_device.py",  # runtime_checkable protocols
+        "array_api/_dtype.py",  # runtime_checkable protocols
+        "array_api/_bound.py",  # slots computed from the protocols
+        # Proxies with `__getattr__`.
+        "array_api/_instrumentation.py",
+        "array_api/_lazy.py",
+        "array_api/_memmap.py",
+        "array_api/_parallel.py",
+        "array_api/_promotion.py",
+        "array_api/_sharding.py",
     ]
     discovered: list[Path] = []
     discovered.extend(find_python_files(SRC / "array_api"))
@@ -84,7 +100,14 @@ else:
     ]
 
     opt_level = os.getenv("MYPYC_OPT_LEVEL", "3")
-    ext_modules = mypycify(mypyc_targets, opt_level=opt_level, verbose=True)
+    debug_level = os.getenv("MYPYC_DEBUG_LEVEL", "1")
+    ext_modules = mypycify(
+        # The mypy overrides for the (absent) tests are otherwise an error.
+        ["--no-warn-unused-configs", *mypyc_targets],
+        opt_level=opt_level,
+        debug_level=debug_level,
+        verbose=True,
+    )
 
 
 setup(name="array_api", package_dir={"": "src"}, ext_modules=ext_modules)
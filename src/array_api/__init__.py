@@ -1,60 +1,260 @@
 """Array API."""
 
-from array_api import (
-    _array,
-    _constants,
-    _creation_functions,
-    _data_type_functions,
-    _device,
-    _dtype,
-    _elementwise_functions,
-    _linear_algebra_functions,
-    _manipulation_functions,
-    _namespace,
-    _namespace_api,
-    _searching_functions,
-    _set_functions,
-    _sorting_functions,
-    _statistical_functions,
-    _types,
-    _utility_functions,
-)
-from array_api._array import *
-from array_api._constants import *
-from array_api._creation_functions import *
-from array_api._data_type_functions import *
-from array_api._device import *
-from array_api._dtype import *
-from array_api._elementwise_functions import *
-from array_api._linear_algebra_functions import *
-from array_api._manipulation_functions import *
-from array_api._namespace import *
-from array_api._namespace_api import *
-from array_api._searching_functions import *
-from array_api._set_functions import *
-from array_api._sorting_functions import *
-from array_api._statistical_functions import *
-from array_api._types import *
-from array_api._utility_functions import *
-
-__all__ = []
-# From the Standard:
-__all__ += _constants.__all__
-__all__ += _types.__all__
-# functions
-__all__ += _creation_functions.__all__
-__all__ += _data_type_functions.__all__
-__all__ += _elementwise_functions.__all__
-__all__ += _linear_algebra_functions.__all__
-__all__ += _manipulation_functions.__all__
-__all__ += _searching_functions.__all__
-__all__ += _set_functions.__all__
-__all__ += _sorting_functions.__all__
-__all__ += _statistical_functions.__all__
-__all__ += _utility_functions.__all__
-# Additional types
-__all__ += _array.__all__
-__all__ += _device.__all__
-__all__ += _dtype.__all__
-__all__ += _namespace.__all__
-__all__ += _namespace_api.__all__
+from __future__ import annotations
+
+import os
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from array_api import _mypyc
+
+_mypyc.select_implementation()
+
+# The public names of each submodule, matching the submodule's ``__all__``.
+# Submodules are imported on first access of one of their names (see
+# `__getattr__`), so ``import array_api`` only loads what is used. Set
+# ``ARRAYAPI_EAGER_IMPORT=1`` to import every submodule up front instead.
+_SUBMODULE_ALL: dict[str, tuple[str, ...]] = {
+    # From the Standard:
+    "_constants": (
+        "e",
+        "inf",
+        "nan",
+        "newaxis",
+        "pi",
+    ),
+    "_types": (
+        "PyCapsule",
+        "SupportsBufferProtocol",
+        "finfo_object",
+        "iinfo_object",
+    ),
+    # functions
+    "_creation_functions": (
+        "empty_like",
+        "full_like",
+        "meshgrid",
+        "ones_like",
+        "tril",
+        "triu",
+        "zeros_like",
+    ),
+    "_data_type_functions": (
+        "astype",
+        "broadcast_arrays",
+        "broadcast_to",
+    ),
+    "_elementwise_functions": (
+        "abs",
+        "acos",
+        "acosh",
+        "add",
+        "asin",
+        "asinh",
+        "atan",
+        "atan2",
+        "atanh",
+        "bitwise_and",
+        "bitwise_left_shift",
+        "bitwise_invert",
+        "bitwise_or",
+        "bitwise_right_shift",
+        "bitwise_xor",
+        "ceil",
+        "cos",
+        "cosh",
+        "divide",
+        "equal",
+        "exp",
+        "expm1",
+        "floor",
+        "floor_divide",
+        "greater",
+        "greater_equal",
+        "isfinite",
+        "isinf",
+        "isnan",
+        "less",
+        "less_equal",
+        "log",
+        "log1p",
+        "log2",
+        "log10",
+        "logaddexp",
+        "logical_and",
+        "logical_not",
+        "logical_or",
+        "logical_xor",
+        "multiply",
+        "negative",
+        "not_equal",
+        "positive",
+        "pow",
+        "remainder",
+        "round",
+        "sign",
+        "sin",
+        "sinh",
+        "square",
+        "sqrt",
+        "subtract",
+        "tan",
+        "tanh",
+        "trunc",
+    ),
+    "_linear_algebra_functions": (
+        "matmul",
+        "matrix_transpose",
+        "tensordot",
+        "vecdot",
+    ),
+    "_manipulation_functions": (
+        "concat",
+        "expand_dims",
+        "flip",
+        "permute_dims",
+        "reshape",
+        "roll",
+        "squeeze",
+        "stack",
+    ),
+    "_searching_functions": (
+        "argmax",
+        "argmin",
+        "nonzero",
+        "searchsorted",
+        "where",
+    ),
+    "_set_functions": (
+        "unique_all",
+        "unique_counts",
+        "unique_inverse",
+        "unique_values",
+    ),
+    "_sorting_functions": (
+        "sort",
+        "argsort",
+        "argpartition",
+        "partition",
+        "topk",
+    ),
+    "_statistical_functions": (
+        "max",
+        "mean",
+        "min",
+        "prod",
+        "std",
+        "sum",
+        "var",
+    ),
+    "_utility_functions": (
+        "all",
+        "any",
+    ),
+    # Additional types
+    "_accumulators": (
+        "AllAccumulator",
+        "AnyAccumulator",
+        "MaxAccumulator",
+        "MeanAccumulator",
+        "MinAccumulator",
+        "ProdAccumulator",
+        "StdAccumulator",
+        "SumAccumulator",
+        "VarAccumulator",
+    ),
+    "_array": ("Array",),
+    "_bound": ("bind",),
+    "_capabilities": (
+        "Capabilities",
+        "capabilities",
+    ),
+    "_device": ("Device",),
+    "_docstrings": ("restore_docstrings",),
+    "_dtype": ("DType",),
+    "_instrumentation": ("DispatchRecorder",),
+    "_lazy": (
+        "LazyArray",
+        "lazy",
+        "materialize",
+    ),
+    "_memmap": (
+        "MemmapArray",
+        "open_memmap",
+    ),
+    "_namespace": (
+        "clear_namespace_cache",
+        "get_namespace",
+        "use_namespace",
+    ),
+    "_namespace_api": ("ArrayAPINamespace",),
+    "_parallel": ("parallel_reductions",),
+    "_promotion": ("promote_namespaces",),
+    "_sharding": (
+        "map_shards",
+        "sharded_elementwise",
+    ),
+    "_transfer": ("to_device_many",),
+    "_tree": ("tree_map",),
+    "_validation": (
+        "NamespaceReport",
+        "validate_namespace",
+    ),
+}
+_SUBMODULES = frozenset((*_SUBMODULE_ALL, "_conformance", "linalg"))
+_LAZY_ATTRS: dict[str, str] = {
+    name: module for module, names in _SUBMODULE_ALL.items() for name in names
+}
+
+__all__ = [name for names in _SUBMODULE_ALL.values() for name in names]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    module = _LAZY_ATTRS.get(name)
+    if module is not None:
+        value = getattr(import_module(f"{__name__}.{module}"), name)
+    elif name in _SUBMODULES:
+        value = import_module(f"{__name__}.{name}")
+    else:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    globals()[name] = value  # later lookups bypass `__getattr__`
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__, *_SUBMODULES})
+
+
+if TYPE_CHECKING or os.environ.get("ARRAYAPI_EAGER_IMPORT", "0") == "1":
+    from array_api._accumulators import *
+    from array_api._array import *
+    from array_api._bound import *
+    from array_api._capabilities import *
+    from array_api._constants import *
+    from array_api._creation_functions import *
+    from array_api._data_type_functions import *
+    from array_api._device import *
+    from array_api._docstrings import *
+    from array_api._dtype import *
+    from array_api._elementwise_functions import *
+    from array_api._instrumentation import *
+    from array_api._lazy import *
+    from array_api._linear_algebra_functions import *
+    from array_api._manipulation_functions import *
+    from array_api._memmap import *
+    from array_api._namespace import *
+    from array_api._namespace_api import *
+    from array_api._parallel import *
+    from array_api._promotion import *
+    from array_api._searching_functions import *
+    from array_api._set_functions import *
+    from array_api._sharding import *
+    from array_api._sorting_functions import *
+    from array_api._statistical_functions import *
+    from array_api._transfer import *
+    from array_api._tree import *
+    from array_api._types import *
+    from array_api._utility_functions import *
+    from array_api._validation import *
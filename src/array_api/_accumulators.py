@@ -0,0 +1,422 @@
+"""Statistics accumulated over chunks of arrays."""
+
+from __future__ import annotations
+
+__all__ = [
+    "AllAccumulator",
+    "AnyAccumulator",
+    "MaxAccumulator",
+    "MeanAccumulator",
+    "MinAccumulator",
+    "ProdAccumulator",
+    "StdAccumulator",
+    "SumAccumulator",
+    "VarAccumulator",
+]
+
+from math import prod
+from typing import TYPE_CHECKING, Any
+
+from array_api._namespace import get_namespace1
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from array_api._array import Array
+    from array_api._dtype import DType
+    from array_api._namespace_api import ArrayAPINamespace
+    from array_api._types import AxisT
+
+# The state of an accumulator: arrays, reduced with ``keepdims=True``, and,
+# for some statistics, the number of elements reduced, which is the same for
+# every element of the result.
+State = tuple[Any, ...]
+
+
+class _Accumulator:
+    """Base of the accumulators of a statistic over chunks."""
+
+    __slots__ = ("_axes", "_axis", "_keepdims", "_ndim", "_state")
+
+    def __init__(self, *, axis: AxisT = None, keepdims: bool = False) -> None:
+        self._axis = axis
+        self._keepdims = keepdims
+        self._ndim: int | None = None
+        self._axes: tuple[int, ...] = ()
+        self._state: State | None = None
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} axis={self._axis!r}>"
+
+    def _options(self) -> tuple[Any, ...]:
+        """Return what must be equal for accumulators to be merged."""
+        return (type(self), self._axis, self._keepdims)
+
+    def _reduce(self, xp: ArrayAPINamespace, chunk: Array) -> State:
+        """Return the state of the elements of ``chunk``."""
+        raise NotImplementedError
+
+    def _combine(self, xp: ArrayAPINamespace, a: State, b: State) -> State:
+        """Return the state of the elements of two states."""
+        raise NotImplementedError
+
+    def _finalize(
+        self, xp: ArrayAPINamespace, state: State  # noqa: ARG002
+    ) -> Array:
+        return state[0]  # type: ignore[no-any-return]
+
+    def _count(self, chunk: Array) -> int:
+        """Return the number of elements of ``chunk`` per element reduced."""
+        return prod(chunk.shape[a] for a in self._axes)  # type: ignore[misc]
+
+    def _set_ndim(self, ndim: int) -> None:
+        """Set the number of dimensions of the chunks, checking the axes."""
+        if self._ndim is not None:
+            if ndim != self._ndim:
+                msg = f"chunk has {ndim} dimensions, expected {self._ndim}"
+                raise ValueError(msg)
+            return
+
+        axis = self._axis
+        axes = (
+            tuple(range(ndim))
+            if axis is None
+            else (axis,) if isinstance(axis, int) else axis
+        )
+        if not all(-ndim <= a < ndim for a in axes):
+            msg = f"axis {axis!r} is out of bounds for {ndim} dimensions"
+            raise ValueError(msg)
+        self._axes = tuple(sorted({a % ndim for a in axes}))
+        self._ndim = ndim
+
+    def _accumulate(self, xp: ArrayAPINamespace, state: State) -> None:
+        if self._state is None:
+            self._state = state
+            return
+        if state[0].shape != self._state[0].shape:
+            msg = (
+                f"chunk reduces to shape {state[0].shape}, expected "
+                f"{self._state[0].shape}"
+            )
+            raise ValueError(msg)
+        self._state = self._combine(xp, self._state, state)
+
+    def update(self, chunk: Array, /) -> Self:
+        """
+        Accumulate the statistic of a chunk.
+
+        Parameters
+        ----------
+        chunk : Array
+            The chunk. Chunks are parts of one array, split along the axes that
+            are reduced, so their other axes must have the same sizes.
+
+        Returns
+        -------
+        Self
+            This accumulator.
+
+        Raises
+        ------
+        ValueError
+            If the chunk does not fit the chunks accumulated so far.
+
+        """
+        xp = get_namespace1(chunk)
+        self._set_ndim(chunk.ndim)
+        self._accumulate(xp, self._reduce(xp, chunk))
+        return self
+
+    def merge(self, other: Self, /) -> Self:
+        """
+        Accumulate the statistic accumulated by another accumulator.
+
+        This combines the partial results of, e.g., worker processes, to which
+        accumulators can be pickled.
+
+        Parameters
+        ----------
+        other : Self
+            An accumulator of the same type and options.
+
+        Returns
+        -------
+        Self
+            This accumulator.
+
+        Raises
+        ------
+        ValueError
+            If the accumulators have different options, or accumulated chunks
+            that do not fit together.
+
+        """
+        if other._options() != self._options():  # noqa: SLF001
+            msg = f"cannot merge {other!r} into {self!r}"
+            raise ValueError(msg)
+        state, ndim = other._state, other._ndim  # noqa: SLF001
+        if state is None or ndim is None:
+            return self
+
+        self._set_ndim(ndim)
+        self._accumulate(get_namespace1(state[0]), state)
+        return self
+
+    def result(self) -> Array:
+        """
+        Return the statistic of the chunks accumulated.
+
+        Returns
+        -------
+        Array
+            The statistic, as returned by the function of the namespace of the
+            chunks for the concatenation of the chunks.
+
+        Raises
+        ------
+        ValueError
+            If no chunk was accumulated.
+
+        """
+        if self._state is None:
+            msg = f"{self!r} has not accumulated any chunk"
+            raise ValueError(msg)
+        xp = get_namespace1(self._state[0])
+        out = self._finalize(xp, self._state)
+        if self._keepdims or not self._axes:
+            return out
+        return xp.squeeze(out, axis=self._axes)
+
+
+class SumAccumulator(_Accumulator):
+    """
+    Accumulate the sum of chunks of an array, as :func:`array_api.sum`.
+
+    The arguments are those of :func:`array_api.sum`. Integer sums are exact,
+    whereas floating-point sums are equal to those of the concatenated chunks
+    up to rounding, as the elements are summed in another order.
+
+    Examples
+    --------
+    >>> import array_api as ap
+    >>> acc = ap.SumAccumulator(axis=0)
+    >>> for chunk in chunks:  # doctest: +SKIP
+    ...     acc.update(chunk)
+    >>> acc.result()  # doctest: +SKIP
+
+    """
+
+    __slots__ = ("_dtype",)
+
+    def __init__(
+        self,
+        *,
+        axis: AxisT = None,
+        dtype: DType | None = None,
+        keepdims: bool = False,
+    ) -> None:
+        super().__init__(axis=axis, keepdims=keepdims)
+        self._dtype = dtype
+
+    def _options(self) -> tuple[Any, ...]:
+        return (*super()._options(), self._dtype)
+
+    def _reduce(self, xp: ArrayAPINamespace, chunk: Array) -> State:
+        return (
+            xp.sum(chunk, axis=self._axes, dtype=self._dtype, keepdims=True),
+        )
+
+    def _combine(self, xp: ArrayAPINamespace, a: State, b: State) -> State:
+        return (xp.add(a[0], b[0]),)
+
+
+class ProdAccumulator(SumAccumulator):
+    """
+    Accumulate the product of chunks of an array, as :func:`array_api.prod`.
+
+    The arguments are those of :func:`array_api.prod`. See
+    :class:`SumAccumulator`.
+    """
+
+    __slots__ = ()
+
+    def _reduce(self, xp: ArrayAPINamespace, chunk: Array) -> State:
+        return (
+            xp.prod(chunk, axis=self._axes, dtype=self._dtype, keepdims=True),
+        )
+
+    def _combine(self, xp: ArrayAPINamespace, a: State, b: State) -> State:
+        return (xp.multiply(a[0], b[0]),)
+
+
+class MinAccumulator(_Accumulator):
+    """
+    Accumulate the minimum of chunks of an array, as :func:`array_api.min`.
+
+    The arguments are those of :func:`array_api.min`. The result is exact. See
+    :class:`SumAccumulator`.
+    """
+
+    __slots__ = ()
+
+    def _reduce(self, xp: ArrayAPINamespace, chunk: Array) -> State:
+        return (xp.min(chunk, axis=self._axes, keepdims=True),)
+
+    def _combine(self, xp: ArrayAPINamespace, a: State, b: State) -> State:
+        # Reduced like the chunks, so that NaNs propagate the same way.
+        return (xp.min(xp.stack((a[0], b[0])), axis=0),)
+
+
+class MaxAccumulator(_Accumulator):
+    """
+    Accumulate the maximum of chunks of an array, as :func:`array_api.max`.
+
+    The arguments are those of :func:`array_api.max`. The result is exact. See
+    :class:`SumAccumulator`.
+    """
+
+    __slots__ = ()
+
+    def _reduce(self, xp: ArrayAPINamespace, chunk: Array) -> State:
+        return (xp.max(chunk, axis=self._axes, keepdims=True),)
+
+    def _combine(self, xp: ArrayAPINamespace, a: State, b: State) -> State:
+        return (xp.max(xp.stack((a[0], b[0])), axis=0),)
+
+
+class AllAccumulator(_Accumulator):
+    """
+    Accumulate if all elements of chunks are true, as :func:`array_api.all`.
+
+    The arguments are those of :func:`array_api.all`. The result is exact. See
+    :class:`SumAccumulator`.
+    """
+
+    __slots__ = ()
+
+    def _reduce(self, xp: ArrayAPINamespace, chunk: Array) -> State:
+        return (xp.all(chunk, axis=self._axes, keepdims=True),)
+
+    def _combine(self, xp: ArrayAPINamespace, a: State, b: State) -> State:
+        return (xp.logical_and(a[0], b[0]),)
+
+
+class AnyAccumulator(_Accumulator):
+    """
+    Accumulate if any element of chunks is true, as :func:`array_api.any`.
+
+    The arguments are those of :func:`array_api.any`. The result is exact. See
+    :class:`SumAccumulator`.
+    """
+
+    __slots__ = ()
+
+    def _reduce(self, xp: ArrayAPINamespace, chunk: Array) -> State:
+        return (xp.any(chunk, axis=self._axes, keepdims=True),)
+
+    def _combine(self, xp: ArrayAPINamespace, a: State, b: State) -> State:
+        return (xp.logical_or(a[0], b[0]),)
+
+
+class MeanAccumulator(_Accumulator):
+    """
+    Accumulate the mean of chunks of an array, as :func:`array_api.mean`.
+
+    The arguments are those of :func:`array_api.mean`. The sum and the number
+    of the elements are accumulated, so the result of a single chunk is that
+    of :func:`array_api.mean`. See :class:`SumAccumulator`.
+    """
+
+    __slots__ = ()
+
+    def _reduce(self, xp: ArrayAPINamespace, chunk: Array) -> State:
+        return (
+            xp.sum(chunk, axis=self._axes, keepdims=True),
+            self._count(chunk),
+        )
+
+    def _combine(self, xp: ArrayAPINamespace, a: State, b: State) -> State:
+        return (xp.add(a[0], b[0]), a[1] + b[1])
+
+    def _finalize(
+        self, xp: ArrayAPINamespace, state: State  # noqa: ARG002
+    ) -> Array:
+        return state[0] / state[1]  # type: ignore[no-any-return]
+
+
+class VarAccumulator(_Accumulator):
+    """
+    Accumulate the variance of chunks of an array, as :func:`array_api.var`.
+
+    The arguments are those of :func:`array_api.var`, for real-valued arrays.
+    The mean and the sum of squared deviations from it are computed per chunk
+    in two passes, and combined with the update of Chan et al., which is
+    numerically stable for chunks of any sizes. The result of a single chunk
+    is that of :func:`array_api.var`. See :class:`SumAccumulator`.
+
+    Examples
+    --------
+    >>> import array_api as ap
+    >>> acc = ap.VarAccumulator(axis=0, correction=1)
+    >>> for chunk in chunks:  # doctest: +SKIP
+    ...     acc.update(chunk)
+    >>> acc.merge(acc_of_another_worker).result()  # doctest: +SKIP
+
+    """
+
+    __slots__ = ("_correction",)
+
+    def __init__(
+        self,
+        *,
+        axis: AxisT = None,
+        correction: float = 0.0,
+        keepdims: bool = False,
+    ) -> None:
+        super().__init__(axis=axis, keepdims=keepdims)
+        self._correction = correction
+
+    def _options(self) -> tuple[Any, ...]:
+        return (*super()._options(), self._correction)
+
+    def _reduce(self, xp: ArrayAPINamespace, chunk: Array) -> State:
+        mean = xp.mean(chunk, axis=self._axes, keepdims=True)
+        deviation = chunk - mean
+        m2 = xp.sum(deviation * deviation, axis=self._axes, keepdims=True)
+        return (mean, m2, self._count(chunk))
+
+    def _combine(
+        self, xp: ArrayAPINamespace, a: State, b: State  # noqa: ARG002
+    ) -> State:
+        mean_a, m2_a, n_a = a
+        mean_b, m2_b, n_b = b
+        if n_b == 0:  # the mean of no elements is NaN
+            return a
+        if n_a == 0:
+            return b
+        n = n_a + n_b
+        delta = mean_b - mean_a
+        return (
+            mean_a + delta * (n_b / n),
+            m2_a + m2_b + delta * delta * (n_a * n_b / n),
+            n,
+        )
+
+    def _finalize(
+        self, xp: ArrayAPINamespace, state: State  # noqa: ARG002
+    ) -> Array:
+        return state[1] / max(state[2] - self._correction, 0)  # type: ignore[no-any-return]
+
+
+class StdAccumulator(VarAccumulator):
+    """
+    Accumulate the standard deviation of chunks, as :func:`array_api.std`.
+
+    The arguments are those of :func:`array_api.std`. See
+    :class:`VarAccumulator`.
+    """
+
+    __slots__ = ()
+
+    def _finalize(self, xp: ArrayAPINamespace, state: State) -> Array:
+        return xp.sqrt(super()._finalize(xp, state))
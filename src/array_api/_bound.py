@@ -0,0 +1,93 @@
+"""Namespaces bound once to an array library."""
+
+from __future__ import annotations
+
+__all__ = ["bind"]
+
+from typing import Any
+
+from array_api._conformance import protocol_members
+from array_api._namespace_api import ArrayAPINamespace
+from array_api.linalg import ArrayAPILinAlgNamespace
+
+_MISSING = object()
+
+
+def _bind_members(bound: Any, namespace: Any) -> None:  # noqa: ANN401
+    """Set the slots of ``bound`` from the members of ``namespace``."""
+    for name in bound.__slots__:
+        value = getattr(namespace, name, _MISSING)
+        if value is not _MISSING:
+            object.__setattr__(bound, name, value)
+
+
+class _BoundLinAlgNamespace:
+    """The linear algebra functions of a namespace, looked up once."""
+
+    __slots__ = tuple(sorted(protocol_members(ArrayAPILinAlgNamespace)))
+
+    def __init__(self, namespace: Any) -> None:  # noqa: ANN401
+        _bind_members(self, namespace)
+
+
+class _BoundNamespace:
+    """The functions and constants of a namespace, looked up once."""
+
+    __slots__ = (
+        *sorted(protocol_members(ArrayAPINamespace) - {"linalg"}),
+        "__wrapped__",
+        "linalg",
+    )
+    __wrapped__: Any
+
+    def __init__(self, namespace: Any) -> None:  # noqa: ANN401
+        _bind_members(self, namespace)
+        object.__setattr__(self, "__wrapped__", namespace)
+        linalg = getattr(namespace, "linalg", None)
+        if linalg is not None:
+            object.__setattr__(self, "linalg", _BoundLinAlgNamespace(linalg))
+
+    def __repr__(self) -> str:
+        return f"bind({self.__wrapped__!r})"
+
+    def __setattr__(self, name: str, value: object) -> None:
+        msg = f"cannot set {name!r} of a bound namespace"
+        raise AttributeError(msg)
+
+
+def bind(xp: ArrayAPINamespace, /) -> ArrayAPINamespace:
+    """
+    Bind the functions of `array_api` to a namespace.
+
+    The returned object has the functions and constants of `array_api` and
+    `array_api.linalg` as attributes, looked up once from ``xp``. Calling them
+    calls the functions of ``xp`` directly, with none of the dispatch of the
+    wrappers, so library code written against `array_api` can resolve the
+    namespace once, e.g. with :func:`get_namespace`, and then call
+    ``bound.add(...)`` instead of ``array_api.add(...)``.
+
+    As the calls bypass dispatch, dispatch hooks such as
+    :func:`use_namespace`, :func:`lazy` and `DispatchRecorder` do not apply.
+
+    Parameters
+    ----------
+    xp : ArrayAPINamespace
+        The namespace to bind.
+
+    Returns
+    -------
+    ArrayAPINamespace
+        The bound namespace. Functions that ``xp`` does not implement raise
+        `AttributeError` when accessed. The original namespace is available
+        as ``__wrapped__``.
+
+    Examples
+    --------
+    >>> import array_api as ap
+    >>> import numpy as np
+    >>> xp = ap.bind(np)
+    >>> xp.add(np.ones(2), 1.0)
+    array([2., 2.])
+
+    """
+    return _BoundNamespace(xp)  # type: ignore[return-value]
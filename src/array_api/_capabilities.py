@@ -0,0 +1,200 @@
+"""Capabilities of array API namespaces."""
+
+from __future__ import annotations
+
+__all__ = ["Capabilities", "capabilities"]
+
+import inspect
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+from array_api._conformance import protocol_methods
+from array_api._namespace_api import ArrayAPINamespace
+from array_api.linalg import ArrayAPILinAlgNamespace
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+# Maximum number of namespaces remembered.
+_CAPABILITIES_CACHE_MAXSIZE: int = 64
+
+# Functions that are not members of `ArrayAPINamespace`, but are used where a
+# namespace has them, e.g. by `array_api.partition`.
+_OPTIONAL_FUNCTIONS: tuple[str, ...] = (
+    "argpartition",
+    "partition",
+    "searchsorted",
+    "take",
+    "take_along_axis",
+    "topk",
+)
+
+_capabilities_cache: dict[int, tuple[Any, Capabilities]] = {}
+_capabilities_cache_lock = Lock()
+
+
+def _keywords(func: Callable[..., Any]) -> frozenset[str] | None:
+    """
+    Return the keyword arguments of ``func``.
+
+    `None` if they are unknown, i.e. ``func`` cannot be inspected or takes
+    ``**kwargs``, so that any keyword argument is assumed to be supported.
+    """
+    try:
+        parameters = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):  # e.g. NumPy ufuncs
+        return None
+    if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters):
+        return None
+    return frozenset(
+        p.name
+        for p in parameters
+        if p.kind
+        in (
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            inspect.Parameter.KEYWORD_ONLY,
+        )
+    )
+
+
+class Capabilities:
+    """
+    The functions and keyword arguments that a namespace implements.
+
+    Use :func:`capabilities` to get the cached capabilities of a namespace.
+
+    Attributes
+    ----------
+    functions : frozenset[str]
+        The functions of `ArrayAPINamespace` that the namespace has.
+    linalg : frozenset[str]
+        The functions of the ``linalg`` extension that the namespace has. Empty
+        if it does not have the extension.
+    missing : frozenset[str]
+        The functions that the namespace does not have, with those of the
+        ``linalg`` extension prefixed by ``"linalg."``.
+    keywords : Mapping[str, frozenset[str] | None]
+        The keyword arguments of each function, with those of the ``linalg``
+        extension prefixed by ``"linalg."``, or `None` if they cannot be
+        determined, e.g. for functions implemented in C or taking ``**kwargs``,
+        in which case any keyword argument is assumed to be supported. Also
+        includes the functions outside of `ArrayAPINamespace` that `array_api`
+        uses if the namespace has them, e.g. ``"partition"``.
+
+    """
+
+    __slots__ = ("functions", "keywords", "linalg", "missing")
+
+    def __init__(self, xp: Any) -> None:  # noqa: ANN401
+        keywords: dict[str, frozenset[str] | None] = {}
+        missing: set[str] = set()
+        for prefix, namespace, proto in (
+            ("", xp, ArrayAPINamespace),
+            ("linalg.", getattr(xp, "linalg", None), ArrayAPILinAlgNamespace),
+        ):
+            for name in protocol_methods(proto):
+                func = getattr(namespace, name, None)
+                if func is None:
+                    missing.add(prefix + name)
+                else:
+                    keywords[prefix + name] = _keywords(func)
+        self.functions = frozenset(n for n in keywords if "." not in n)
+        for name in _OPTIONAL_FUNCTIONS:
+            func = getattr(xp, name, None)
+            if func is not None:
+                keywords[name] = _keywords(func)
+
+        self.keywords: Mapping[str, frozenset[str] | None] = keywords
+        self.missing = frozenset(missing)
+        self.linalg = frozenset(
+            n.removeprefix("linalg.") for n in keywords if "." in n
+        )
+
+    def __repr__(self) -> str:
+        missing = sorted(self.missing)
+        return (
+            f"Capabilities(<{len(self.functions)} functions>, "
+            f"<{len(self.linalg)} linalg functions>, missing={missing})"
+        )
+
+    def supports(self, name: str, *keywords: str) -> bool:
+        """
+        Check whether the namespace has a function and keyword arguments.
+
+        Parameters
+        ----------
+        name : str
+            The name of the function, e.g. ``"sum"`` or ``"linalg.svd"``.
+        *keywords : str
+            Keyword arguments of the function. Keyword arguments of functions
+            whose signature cannot be determined are assumed to be supported.
+
+        Returns
+        -------
+        bool
+            Whether the namespace has the function and keyword arguments.
+
+        """
+        try:
+            known = self.keywords[name]
+        except KeyError:
+            return False
+        return known is None or known.issuperset(keywords)
+
+
+def capabilities(xp: ArrayAPINamespace, /) -> Capabilities:
+    """
+    Get the capabilities of a namespace.
+
+    The capabilities are determined once per namespace and cached, so that
+    checking whether a function is implemented is a dictionary lookup. Those of
+    a proxy with a ``__wrapped__`` attribute, e.g. as returned by a dispatch
+    hook, are those of the namespace it wraps, as the functions of proxies
+    usually take ``*args`` and ``**kwargs``, which would be assumed to support
+    any keyword argument.
+
+    Parameters
+    ----------
+    xp : ArrayAPINamespace
+        The namespace, e.g. from :func:`get_namespace`.
+
+    Returns
+    -------
+    Capabilities
+        The functions and keyword arguments that ``xp`` implements.
+
+    Examples
+    --------
+    >>> import array_api as ap
+    >>> import numpy as np
+    >>> ap.capabilities(np).supports("linalg.svd")
+    True
+
+    """
+    # Keyed by `id`, as namespaces need not be hashable. The namespace is kept
+    # alongside, so that its `id` is not reused while it is cached.
+    try:
+        namespace, caps = _capabilities_cache[id(xp)]
+    except KeyError:
+        pass
+    else:
+        if namespace is xp:
+            return caps
+
+    # Proxies are not cached, as there is usually one per call.
+    wrapped = getattr(xp, "__wrapped__", None)
+    if wrapped is not None:
+        return capabilities(wrapped)
+
+    caps = Capabilities(xp)
+    with _capabilities_cache_lock:
+        if len(_capabilities_cache) >= _CAPABILITIES_CACHE_MAXSIZE:
+            del _capabilities_cache[next(iter(_capabilities_cache))]
+        _capabilities_cache[id(xp)] = (xp, caps)
+    return caps
+
+
+def clear_capabilities_cache() -> None:
+    """Clear the cached capabilities."""
+    with _capabilities_cache_lock:
+        _capabilities_cache.clear()
@@ -0,0 +1,151 @@
+"""Fast protocol conformance checks."""
+
+from __future__ import annotations
+
+__all__: list[str] = []
+
+import typing
+from functools import cache
+from threading import Lock
+
+# Maximum number of ``(class, protocol)`` verdicts remembered.
+_CONFORMANCE_CACHE_MAXSIZE: int = 1024
+
+_MISSING = object()
+
+# For each ``(class, protocol)``: whether the class conforms, the protocol
+# members that instances must provide themselves, or `None` if the trait is not
+# a runtime-checkable protocol and `isinstance` must be used.
+_Verdict = bool | tuple[str, ...] | None
+_class_verdicts: dict[tuple[type, type], _Verdict] = {}
+_class_verdicts_lock = Lock()
+
+
+# The attributes that mypyc adds to the protocols it compiles.
+_MYPYC_ATTRS = frozenset({"__getstate__", "__mypyc_attrs__", "__setstate__"})
+
+
+@cache
+def protocol_members(proto: type) -> frozenset[str]:
+    """
+    Return the names of the members of a protocol.
+
+    Parameters
+    ----------
+    proto : type
+        A `typing.Protocol` class.
+
+    Returns
+    -------
+    frozenset[str]
+        The members that an object must have to conform to ``proto``.
+
+    """
+    members = getattr(proto, "__protocol_attrs__", None)  # Python 3.12+
+    if members is None:
+        members = typing._get_protocol_attrs(proto)  # type: ignore[attr-defined]  # noqa: SLF001
+    return frozenset(members) - _MYPYC_ATTRS
+
+
+@cache
+def protocol_methods(proto: type) -> frozenset[str]:
+    """
+    Return the names of the members of a protocol that are methods.
+
+    Parameters
+    ----------
+    proto : type
+        A `typing.Protocol` class.
+
+    Returns
+    -------
+    frozenset[str]
+        The members of ``proto`` that are callable, e.g. the functions of a
+        namespace protocol.
+
+    """
+    return frozenset(
+        name
+        for name in protocol_members(proto)
+        if callable(getattr(proto, name, None))
+    )
+
+
+def _static_lookup(cls: type, name: str) -> object:
+    """Look up ``name`` on ``cls`` without invoking descriptors."""
+    for base in cls.__mro__:
+        if name in base.__dict__:
+            return base.__dict__[name]
+    return _MISSING
+
+
+def _class_verdict(cls: type, trait: type) -> _Verdict:
+    """Check the members of ``trait`` against ``cls``."""
+    if not getattr(trait, "_is_runtime_protocol", False):
+        return None
+
+    methods = protocol_methods(trait)
+    missing = tuple(
+        name
+        for name in sorted(protocol_members(trait))
+        if (value := _static_lookup(cls, name)) is _MISSING
+        # Methods can be blocked by setting them to None.
+        or (value is None and name in methods)
+    )
+    if not missing:
+        return True
+    # Members missing from the class may still be set on the instance.
+    return missing if cls.__dictoffset__ != 0 else False
+
+
+def conforms(x: object, trait: type) -> bool:
+    """
+    Check whether ``x`` is an instance of ``trait``.
+
+    This is equivalent to ``isinstance(x, trait)``, but for runtime-checkable
+    protocols the members are looked up on the class of ``x`` once and the
+    verdict is memoized, so repeated checks are a dictionary lookup instead of
+    a ``hasattr`` per protocol member. Like `isinstance` on Python 3.12+,
+    members are looked up statically, so properties are not evaluated.
+
+    Parameters
+    ----------
+    x : object
+        The object to check.
+    trait : type
+        The class or protocol to check against.
+
+    Returns
+    -------
+    bool
+        Whether ``x`` conforms to ``trait``.
+
+    """
+    key = (type(x), trait)
+    try:
+        missing = _class_verdicts[key]
+    except KeyError:
+        missing = _class_verdict(type(x), trait)
+        with _class_verdicts_lock:
+            if len(_class_verdicts) >= _CONFORMANCE_CACHE_MAXSIZE:
+                del _class_verdicts[next(iter(_class_verdicts))]
+            _class_verdicts[key] = missing
+
+    if missing is True or missing is False:
+        return missing
+    if missing is None:
+        return isinstance(x, trait)
+
+    attrs = object.__getattribute__(x, "__dict__")
+    methods = protocol_methods(trait)
+    for name in missing:
+        value = attrs.get(name, _MISSING)
+        if value is _MISSING or (value is None and name in methods):
+            return False
+    return True
+
+
+def clear_conformance_cache() -> None:
+    """Clear the memoized conformance verdicts."""
+    with _class_verdicts_lock:
+        _class_verdicts.clear()
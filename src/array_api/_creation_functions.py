@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Protocol
 
-from array_api._namespace import get_namespace
+from array_api._namespace import get_namespace, get_namespace1
 
 if TYPE_CHECKING:
     from array_api._array import Array
@@ -48,7 +48,7 @@ def empty_like(
         data.
 
     """
-    return get_namespace(x).empty_like(x, dtype=dtype, device=device)
+    return get_namespace1(x).empty_like(x, dtype=dtype, device=device)
 
 
 def full_like(
@@ -97,7 +97,7 @@ def full_like(
         to ``fill_value``.
 
     """
-    return get_namespace(x).full_like(
+    return get_namespace1(x).full_like(
         x, fill_value=fill_value, dtype=dtype, device=device
     )
 
@@ -169,7 +169,7 @@ def ones_like(
         an array having the same shape as ``x`` and filled with ones.
 
     """
-    return get_namespace(x).ones_like(x, dtype=dtype, device=device)
+    return get_namespace1(x).ones_like(x, dtype=dtype, device=device)
 
 
 def tril(x: Array, /, *, k: int = 0) -> Array:
@@ -206,7 +206,7 @@ def tril(x: Array, /, *, k: int = 0) -> Array:
         allocated on the same device as ``x``.
 
     """
-    return get_namespace(x).tril(x, k=k)
+    return get_namespace1(x).tril(x, k=k)
 
 
 def triu(x: Array, /, *, k: int = 0) -> Array:
@@ -243,7 +243,7 @@ def triu(x: Array, /, *, k: int = 0) -> Array:
         allocated on the same device as ``x``.
 
     """
-    return get_namespace(x).triu(x, k=k)
+    return get_namespace1(x).triu(x, k=k)
 
 
 def zeros_like(
@@ -270,7 +270,7 @@ def zeros_like(
         an array having the same shape as ``x`` and filled with zeros.
 
     """
-    return get_namespace(x).zeros_like(x, dtype=dtype, device=device)
+    return get_namespace1(x).zeros_like(x, dtype=dtype, device=device)
 
 
 ###############################################################################
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Final, Protocol
 
-from array_api._namespace import get_namespace
+from array_api._namespace import get_namespace, get_namespace1
 
 if TYPE_CHECKING:
     from array_api._array import Array
@@ -57,7 +57,7 @@ def astype(x: Array, dtype: DType, /, *, copy: bool = True) -> Array:
         the same shape as ``x``.
 
     """
-    return get_namespace(x).astype(x, dtype, copy=copy)
+    return get_namespace1(x).astype(x, dtype, copy=copy)
 
 
 def broadcast_arrays(*arrays: Array) -> list[Array]:
@@ -100,7 +100,7 @@ def broadcast_to(x: Array, /, shape: tuple[int, ...]) -> Array:
         ``x``.
 
     """
-    return get_namespace(x).broadcast_to(x, shape=shape)
+    return get_namespace1(x).broadcast_to(x, shape=shape)
 
 
 ###############################################################################
@@ -0,0 +1,101 @@
+"""Docstrings of `array_api`, read from its sources on demand."""
+
+from __future__ import annotations
+
+__all__ = ["restore_docstrings"]
+
+import ast
+import pkgutil
+import sys
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+# Python 3.13 strips the indentation of docstrings when compiling.
+_CLEAN = sys.version_info >= (3, 13)
+
+
+def _set_doc(obj: Any, doc: str) -> bool:  # noqa: ANN401
+    """Set the docstring of ``obj`` if it has none, returning if it was set."""
+    if isinstance(obj, staticmethod | classmethod):
+        _set_doc(obj.__func__, doc)
+    elif isinstance(obj, property) and obj.fget is not None:
+        _set_doc(obj.fget, doc)
+    if obj.__doc__ is not None:
+        return False
+    try:
+        obj.__doc__ = doc
+    except (AttributeError, TypeError):  # e.g. compiled functions
+        return False
+    return True
+
+
+def _restore(obj: Any, node: ast.AST, module: str) -> int:  # noqa: ANN401
+    """Restore the docstrings of ``obj`` and its members from ``node``."""
+    count = 0
+    doc = ast.get_docstring(node, clean=_CLEAN)  # type: ignore[arg-type]
+    if doc is not None:
+        count += _set_doc(obj, doc)
+
+    # Functions are not recursed into, as what they define is not accessible.
+    if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+        return count
+    for child in node.body:  # type: ignore[attr-defined]
+        if not isinstance(
+            child, ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef
+        ):
+            continue
+        member = vars(obj).get(child.name)
+        func = getattr(member, "__func__", getattr(member, "fget", member))
+        # Skip names that were re-bound, e.g. to an object from elsewhere.
+        if getattr(func, "__module__", None) == module:
+            count += _restore(member, child, module)
+    return count
+
+
+def _restore_module(module: ModuleType) -> int:
+    """Restore the docstrings of ``module`` from its source."""
+    loader = getattr(module.__spec__, "loader", None)
+    try:
+        source = loader.get_source(module.__name__)  # type: ignore[union-attr]
+    except (AttributeError, ImportError):
+        return 0
+    if source is None:  # e.g. compiled modules, which keep their docstrings
+        return 0
+    return _restore(module, ast.parse(source), module.__name__)
+
+
+def restore_docstrings() -> int:
+    """
+    Restore the docstrings of `array_api` removed by ``python -OO``.
+
+    Most of the source of `array_api` is the docstrings of the array API
+    standard. Running Python with ``-OO`` leaves them out of the bytecode,
+    which saves each process the time and memory of loading them: with every
+    submodule imported, about 6 ms of import time and 250 KiB of resident
+    memory on CPython 3.11. The docstrings remain in the installed sources,
+    from which this function reads them, e.g. before calling `help`.
+
+    Every submodule is imported, so that all docstrings are restored. Objects
+    that have a docstring are left as they are, so this does nothing when
+    Python is run without ``-OO``.
+
+    Returns
+    -------
+    int
+        The number of docstrings restored.
+
+    Examples
+    --------
+    >>> import array_api as ap
+    >>> n = ap.restore_docstrings()  # with -OO, before help(ap.add)
+
+    """
+    package = import_module("array_api")
+    modules = [package] + [
+        import_module(info.name)
+        for info in pkgutil.walk_packages(package.__path__, "array_api.")
+    ]
+    return sum(_restore_module(module) for module in modules)
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Protocol
 
-from array_api._namespace import get_namespace
+from array_api._namespace import get_namespace1, get_namespace2
 
 if TYPE_CHECKING:
     from array_api._array import Array
+    from array_api._types import PyScalar
 
 __all__ = [
     "abs",
@@ -100,7 +101,7 @@ def abs(x: Array, /) -> Array:
         returned array must have the same data type as ``x``.
 
     """
-    return get_namespace(x).abs(x)
+    return get_namespace1(x).abs(x)
 
 
 def acos(x: Array, /) -> Array:
@@ -132,7 +133,7 @@ def acos(x: Array, /) -> Array:
         :ref:`type-promotion`.
 
     """
-    return get_namespace(x).acos(x)
+    return get_namespace1(x).acos(x)
 
 
 def acosh(x: Array, /) -> Array:
@@ -164,10 +165,10 @@ def acosh(x: Array, /) -> Array:
         determined by :ref:`type-promotion`.
 
     """
-    return get_namespace(x).acosh(x)
+    return get_namespace1(x).acosh(x)
 
 
-def add(x1: Array, x2: Array, /) -> Array:
+def add(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array:
     """
     Calculates the sum for each element ``x1_i`` of the input array ``x1`` with
     the respective element ``x2_i`` of the input array ``x2``.
@@ -231,7 +232,7 @@ def add(x1: Array, x2: Array, /) -> Array:
         a data type determined by :ref:`type-promotion`.
 
     """
-    return get_namespace(x1, x2).add(x1, x2)
+    return get_namespace2(x1, x2).add(x1, x2)
 
 
 def asin(x: Array, /) -> Array:
@@ -264,7 +265,7 @@ def asin(x: Array, /) -> Array:
         :ref:`type-promotion`.
 
     """
-    return get_namespace(x).asin(x)
+    return get_namespace1(x).asin(x)
 
 
 def asinh(x: Array, /) -> Array:
@@ -298,7 +299,7 @@ def asinh(x: Array, /) -> Array:
         determined by :ref:`type-promotion`.
 
     """
-    return get_namespace(x).asinh(x)
+    return get_namespace1(x).asinh(x)
 
 
 def atan(x: Array, /) -> Array:
@@ -333,10 +334,10 @@ def atan(x: Array, /) -> Array:
         :ref:`type-promotion`.
 
     """
-    return get_namespace(x).atan(x)
+    return get_namespace1(x).atan(x)
 
 
-def atan2(x1: Array, x2: Array, /) -> Array:
+def atan2(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array:
     """
     Calculates an implementation-dependent approximation of the inverse tangent
     of the quotient ``x1/x2``, having domain ``[-infinity, +infinity] x
@@ -431,7 +432,7 @@ def atan2(x1: Array, x2: Array, /) -> Array:
         :ref:`type-promotion`.
 
     """
-    return get_namespace(x1, x2).atan2(x1, x2)
+    return get_namespace2(x1, x2).atan2(x1, x2)
 
 
 def atanh(x: Array, /) -> Array:
@@ -466,10 +467,10 @@ def atanh(x: Array, /) -> Array:
         determined by :ref:`type-promotion`.
 
     """
-    return get_namespace(x).atanh(x)
+    return get_namespace1(x).atanh(x)
 
 
-def bitwise_and(x1: Array, x2: Array, /) -> Array:
+def bitwise_and(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array:
     """
     Computes the bitwise AND of the underlying binary representation of each
     element ``x1_i`` of the input array ``x1`` with the respective element
@@ -490,10 +491,10 @@ def bitwise_and(x1: Array, x2: Array, /) -> Array:
         have a data type determined by :ref:`type-promotion`.
 
     """
-    return get_namespace(x1, x2).bitwise_and(x1, x2)
+    return get_namespace2(x1, x2).bitwise_and(x1, x2)
 
 
-def bitwise_left_shift(x1: Array, x2: Array, /) -> Array:
+def bitwise_left_shift(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array:
     """
     Shifts the bits of each element ``x1_i`` of the input array ``x1`` to the
     left by appending ``x2_i`` (i.e., the respective element in the input array
@@ -515,7 +516,7 @@ def bitwise_left_shift(x1: Array, x2: Array, /) -> Array:
         have a data type determined by :ref:`type-promotion`.
 
     """
-    return get_namespace(x1, x2).bitwise_left_shift(x1, x2)
+    return get_namespace2(x1, x2).bitwise_left_shift(x1, x2)
 
 
 def bitwise_invert(x: Array, /) -> Array:
@@ -534,10 +535,10 @@ def bitwise_invert(x: Array, /) -> Array:
         have the same data type as ``x``.
 
     """
-    return get_namespace(x).bitwise_invert(x)
+    return get_namespace1(x).bitwise_invert(x)
 
 
-def bitwise_or(x1: Array, x2: Array, /) -> Array:
+def bitwise_or(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array:
     """
     Computes the bitwise OR of the underlying binary representation of each
     element ``x1_i`` of the input array ``x1`` with the respective element
@@ -558,10 +559,10 @@ def bitwise_or(x1: Array, x2: Array, /) -> Array:
         have a data type determined by :ref:`type-promotion`.
 
     """
-    return get_namespace(x1, x2).bitwise_or(x1, x2)
+    return get_namespace2(x1, x2).bitwise_or(x1, x2)
 
 
-def bitwise_right_shift(x1: Array, x2: Array, /) -> Array:
+def bitwise_right_shift(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array:
     """
     Shifts the bits of each element ``x1_i`` of the input array ``x1`` to the
     right according to the respective element ``x2_i`` of the input array
@@ -588,10 +589,10 @@ def bitwise_right_shift(x1: Array, x2: Array, /) -> Array:
         have a data type determined by :ref:`type-promotion`.
 
     """
-    return get_namespace(x1, x2).bitwise_right_shift(x1, x2)
+    return get_namespace2(x1, x2).bitwise_right_shift(x1, x2)
 
 
-def bitwise_xor(x1: Array, x2: Array, /) -> Array:
+def bitwise_xor(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array:
     """
     Computes the bitwise XOR of the underlying binary representation of each
     element ``x1_i`` of the input array ``x1`` with the respective element
@@ -612,7 +613,7 @@ def bitwise_xor(x1: Array, x2: Array, /) -> Array:
         have a data type determined by :ref:`type-promotion`.
 
     """
-    return get_namespace(x1, x2).bitwise_xor(x1, x2)
+    return get_namespace2(x1, x2).bitwise_xor(x1, x2)
 
 
 def ceil(x: Array, /) -> Array:
@@ -645,7 +646,7 @@ def ceil(x: Array, /) -> Array:
         returned array must have the same data type as ``x``.
 
     """
-    return get_namespace(x).ceil(x)
+    return get_namespace1(x).ceil(x)
 
 
 def cos(x: Array, /) -> Array:
@@ -679,7 +680,7 @@ def cos(x: Array, /) -> Array:
         :ref:`type-promotion`.
 
     """
-    return get_namespace(x).cos(x)
+    return get_namespace1(x).cos(x)
 
 
 def cosh(x: Array, /) -> Array:
@@ -712,10 +713,10 @@ def cosh(x: Array, /) -> Array:
         :ref:`type-promotion`.
 
     """
-    return get_namespace(x).cosh(x)
+    return get_namespace1(x).cosh(x)
 
 
-def divide(x1: Array, x2: Array, /) -> Array:
+def divide(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array:
     """
     Calculates the division for each element ``x1_i`` of the input array ``x1``
     with the respective element ``x2_i`` of the input array ``x2``.
@@ -798,10 +799,10 @@ def divide(x1: Array, x2: Array, /) -> Array:
         have a floating-point data type determined by :ref:`type-promotion`.
 
     """
-    return get_namespace(x1, x2).divide(x1, x2)
+    return get_namespace2(x1, x2).divide(x1, x2)
 
 
-def equal(x1: Array, x2: Array, /) -> Array:
+def equal(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array:
     """
     Computes the truth value of ``x1_i == x2_i`` for each element ``x1_i`` of
     the input array ``x1`` with the respective element ``x2_i`` of the input
@@ -822,7 +823,7 @@ def equal(x1: Array, x2: Array, /) -> Array:
         have a data type of ``bool``.
 
     """
-    return get_namespace(x1, x2).equal(x1, x2)
+    return get_namespace2(x1, x2).equal(x1, x2)
 
 
 def exp(x: Array, /) -> Array:
@@ -856,7 +857,7 @@ def exp(x: Array, /) -> Array:
         type determined by :ref:`type-promotion`.
 
     """
-    return get_namespace(x).exp(x)
+    return get_namespace1(x).exp(x)
 
 
 def expm1(x: Array, /) -> Array:
@@ -896,7 +897,7 @@ def expm1(x: Array, /) -> Array:
         :ref:`type-promotion`.
 
     """
-    return get_namespace(x).expm1(x)
+    return get_namespace1(x).expm1(x)
 
 
 def floor(x: Array, /) -> Array:
@@ -929,10 +930,10 @@ def floor(x: Array, /) -> Array:
         returned array must have the same data type as ``x``.
 
     """
-    return get_namespace(x).floor(x)
+    return get_namespace1(x).floor(x)
 
 
-def floor_divide(x1: Array, x2: Array, /) -> Array:
+def floor_divide(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array:
     r"""
     Rounds the result of dividing each element ``x1_i`` of the input array
     ``x1`` by the respective element ``x2_i`` of the input array ``x2`` to the
@@ -1050,10 +1051,10 @@ def floor_divide(x1: Array, x2: Array, /) -> Array:
         have a data type determined by :ref:`type-promotion`.
 
     """
-    return get_namespace(x1, x2).floor_divide(x1, x2)
+    return get_namespace2(x1, x2).floor_divide(x1, x2)
 
 
-def greater(x1: Array, x2: Array, /) -> Array:
+def greater(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array:
     """
     Computes the truth value of ``x1_i > x2_i`` for each element ``x1_i`` of the
     input array ``x1`` with the respective element ``x2_i`` of the input array
@@ -1074,10 +1075,10 @@ def greater(x1: Array, x2: Array, /) -> Array:
         have a data type of ``bool``.
 
     """
-    return get_namespace(x1, x2).greater(x1, x2)
+    return get_namespace2(x1, x2).greater(x1, x2)
 
 
-def greater_equal(x1: Array, x2: Array, /) -> Array:
+def greater_equal(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array:
     """
     Computes the truth value of ``x1_i >= x2_i`` for each element ``x1_i`` of
     the input array ``x1`` with the respective element ``x2_i`` of the input
@@ -1098,7 +1099,7 @@ def greater_equal(x1: Array, x2: Array, /) -> Array:
         have a data type of ``bool``.
 
     """
-    return get_namespace(x1, x2).greater_equal(x1, x2)
+    return get_namespace2(x1, x2).greater_equal(x1, x2)
 
 
 def isfinite(x: Array, /) -> Array:
@@ -1119,7 +1120,7 @@ def isfinite(x: Array, /) -> Array:
         a data type of ``bool``.
 
     """
-    return get_namespace(x).isfinite(x)
+    return get_namespace1(x).isfinite(x)
 
 
 def isinf(x: Array, /) -> Array:
@@ -1140,7 +1141,7 @@ def isinf(x: Array, /) -> Array:
         The returned array must have a data type of ``bool``.
 
     """
-    return get_namespace(x).isinf(x)
+    return get_namespace1(x).isinf(x)
 
 
 def isnan(x: Array, /) -> Array:
@@ -1161,10 +1162,10 @@ def isnan(x: Array, /) -> Array:
         have a data type of ``bool``.
 
     """
-    return get_namespace(x).isnan(x)
+    return get_namespace1(x).isnan(x)
 
 
-def less(x1: Array, x2: Array, /) -> Array:
+def less(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array:
     """
     Computes the truth value of ``x1_i < x2_i`` for each element ``x1_i`` of the
     input array ``x1`` with the respective element ``x2_i`` of the input array
@@ -1185,10 +1186,10 @@ def less(x1: Array, x2: Array, /) -> Array:
         have a data type of ``bool``.
 
     """
-    return get_namespace(x1, x2).less(x1, x2)
+    return get_namespace2(x1, x2).less(x1, x2)
 
 
-def less_equal(x1: Array, x2: Array, /) -> Array:
+def less_equal(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array:
     """
     Computes the truth value of ``x1_i <= x2_i`` for each element ``x1_i`` of
     the input array ``x1`` with the respective element ``x2_i`` of the input
@@ -1209,7 +1210,7 @@ def less_equal(x1: Array, x2: Array, /) -> Array:
         have a data type of ``bool``.
 
     """
-    return get_namespace(x1, x2).less_equal(x1, x2)
+    return get_namespace2(x1, x2).less_equal(x1, x2)
 
 
 def log(x: Array, /) -> Array:
@@ -1242,7 +1243,7 @@ def log(x: Array, /) -> Array:
         determined by :ref:`type-promotion`.
 
     """
-    return get_namespace(x).log(x)
+    return get_namespace1(x).log(x)
 
 
 def log1p(x: Array, /) -> Array:
@@ -1284,7 +1285,7 @@ def log1p(x: Array, /) -> Array:
         :ref:`type-promotion`.
 
     """
-    return get_namespace(x).log1p(x)
+    return get_namespace1(x).log1p(x)
 
 
 def log2(x: Array, /) -> Array:
@@ -1316,7 +1317,7 @@ def log2(x: Array, /) -> Array:
         determined by :ref:`type-promotion`.
 
     """
-    return get_namespace(x).log2(x)
+    return get_namespace1(x).log2(x)
 
 
 def log10(x: Array, /) -> Array:
@@ -1348,10 +1349,10 @@ def log10(x: Array, /) -> Array:
         determined by :ref:`type-promotion`.
 
     """
-    return get_namespace(x).log10(x)
+    return get_namespace1(x).log10(x)
 
 
-def logaddexp(x1: Array, x2: Array, /) -> Array:
+def logaddexp(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array:
     """
     Calculates the logarithm of the sum of exponentiations ``log(exp(x1) +
     exp(x2))`` for each element ``x1_i`` of the input array ``x1`` with the
@@ -1381,10 +1382,10 @@ def logaddexp(x1: Array, x2: Array, /) -> Array:
         have a floating-point data type determined by :ref:`type-promotion`.
 
     """
-    return get_namespace(x1, x2).logaddexp(x1, x2)
+    return get_namespace2(x1, x2).logaddexp(x1, x2)
 
 
-def logical_and(x1: Array, x2: Array, /) -> Array:
+def logical_and(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array:
     """
     Computes the logical AND for each element ``x1_i`` of the input array ``x1``
     with the respective element ``x2_i`` of the input array ``x2``.
@@ -1413,7 +1414,7 @@ def logical_and(x1: Array, x2: Array, /) -> Array:
         have a data type of `bool`.
 
     """
-    return get_namespace(x1, x2).logical_and(x1, x2)
+    return get_namespace2(x1, x2).logical_and(x1, x2)
 
 
 def logical_not(x: Array, /) -> Array:
@@ -1441,10 +1442,10 @@ def logical_not(x: Array, /) -> Array:
         have a data type of ``bool``.
 
     """
-    return get_namespace(x).logical_not(x)
+    return get_namespace1(x).logical_not(x)
 
 
-def logical_or(x1: Array, x2: Array, /) -> Array:
+def logical_or(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array:
     """
     Computes the logical OR for each element ``x1_i`` of the input array ``x1``
     with the respective element ``x2_i`` of the input array ``x2``.
@@ -1473,10 +1474,10 @@ def logical_or(x1: Array, x2: Array, /) -> Array:
         have a data type of ``bool``.
 
     """
-    return get_namespace(x1, x2).logical_or(x1, x2)
+    return get_namespace2(x1, x2).logical_or(x1, x2)
 
 
-def logical_xor(x1: Array, x2: Array, /) -> Array:
+def logical_xor(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array:
     """
     Computes the logical XOR for each element ``x1_i`` of the input array ``x1``
     with the respective element ``x2_i`` of the input array ``x2``.
@@ -1505,10 +1506,10 @@ def logical_xor(x1: Array, x2: Array, /) -> Array:
         have a data type of ``bool``.
 
     """
-    return get_namespace(x1, x2).logical_xor(x1, x2)
+    return get_namespace2(x1, x2).logical_xor(x1, x2)
 
 
-def multiply(x1: Array, x2: Array, /) -> Array:
+def multiply(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array:
     """
     Calculates the product for each element ``x1_i`` of the input array ``x1``
     with the respective element ``x2_i`` of the input array ``x2``.
@@ -1564,7 +1565,7 @@ def multiply(x1: Array, x2: Array, /) -> Array:
         have a data type determined by :ref:`type-promotion`.
 
     """
-    return get_namespace(x1, x2).multiply(x1, x2)
+    return get_namespace2(x1, x2).multiply(x1, x2)
 
 
 def negative(x: Array, /) -> Array:
@@ -1590,10 +1591,10 @@ def negative(x: Array, /) -> Array:
         :ref:`type-promotion`.
 
     """
-    return get_namespace(x).negative(x)
+    return get_namespace1(x).negative(x)
 
 
-def not_equal(x1: Array, x2: Array, /) -> Array:
+def not_equal(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array:
     """
     Computes the truth value of ``x1_i != x2_i`` for each element ``x1_i`` of
     the input array ``x1`` with the respective element ``x2_i`` of the input
@@ -1614,7 +1615,7 @@ def not_equal(x1: Array, x2: Array, /) -> Array:
         have a data type of ``bool``.
 
     """
-    return get_namespace(x1, x2).not_equal(x1, x2)
+    return get_namespace2(x1, x2).not_equal(x1, x2)
 
 
 def positive(x: Array, /) -> Array:
@@ -1634,10 +1635,10 @@ def positive(x: Array, /) -> Array:
         returned array must have the same data type as ``x``.
 
     """
-    return get_namespace(x).positive(x)
+    return get_namespace1(x).positive(x)
 
 
-def pow(x1: Array, x2: Array, /) -> Array:
+def pow(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array:
     """
     Calculates an implementation-dependent approximation of exponentiation by
     raising each element ``x1_i`` (the base) of the input array ``x1`` to the
@@ -1722,10 +1723,10 @@ def pow(x1: Array, x2: Array, /) -> Array:
         have a data type determined by :ref:`type-promotion`.
 
     """
-    return get_namespace(x1, x2).pow(x1, x2)
+    return get_namespace2(x1, x2).pow(x1, x2)
 
 
-def remainder(x1: Array, x2: Array, /) -> Array:
+def remainder(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array:
     """
     Returns the remainder of division for each element ``x1_i`` of the input
     array ``x1`` and the respective element ``x2_i`` of the input array ``x2``.
@@ -1811,7 +1812,7 @@ def remainder(x1: Array, x2: Array, /) -> Array:
         array must have a data type determined by :ref:`type-promotion`.
 
     """
-    return get_namespace(x1, x2).remainder(x1, x2)
+    return get_namespace2(x1, x2).remainder(x1, x2)
 
 
 def round(x: Array, /) -> Array:
@@ -1845,7 +1846,7 @@ def round(x: Array, /) -> Array:
         returned array must have the same data type as ``x``.
 
     """
-    return get_namespace(x).round(x)
+    return get_namespace1(x).round(x)
 
 
 def sign(x: Array, /) -> Array:
@@ -1871,7 +1872,7 @@ def sign(x: Array, /) -> Array:
         ``x``. The returned array must have the same data type as ``x``.
 
     """
-    return get_namespace(x).sign(x)
+    return get_namespace1(x).sign(x)
 
 
 def sin(x: Array, /) -> Array:
@@ -1905,7 +1906,7 @@ def sin(x: Array, /) -> Array:
         :ref:`type-promotion`.
 
     """
-    return get_namespace(x).sin(x)
+    return get_namespace1(x).sin(x)
 
 
 def sinh(x: Array, /) -> Array:
@@ -1938,7 +1939,7 @@ def sinh(x: Array, /) -> Array:
         :ref:`type-promotion`.
 
     """
-    return get_namespace(x).sinh(x)
+    return get_namespace1(x).sinh(x)
 
 
 def square(x: Array, /) -> Array:
@@ -1958,7 +1959,7 @@ def square(x: Array, /) -> Array:
         :ref:`type-promotion`.
 
     """
-    return get_namespace(x).square(x)
+    return get_namespace1(x).square(x)
 
 
 def sqrt(x: Array, /) -> Array:
@@ -1991,10 +1992,10 @@ def sqrt(x: Array, /) -> Array:
         :ref:`type-promotion`.
 
     """
-    return get_namespace(x).sqrt(x)
+    return get_namespace1(x).sqrt(x)
 
 
-def subtract(x1: Array, x2: Array, /) -> Array:
+def subtract(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array:
     """
     Calculates the difference for each element ``x1_i`` of the input array
     ``x1`` with the respective element ``x2_i`` of the input array ``x2``. The
@@ -2016,7 +2017,7 @@ def subtract(x1: Array, x2: Array, /) -> Array:
         must have a data type determined by :ref:`type-promotion`.
 
     """
-    return get_namespace(x1, x2).subtract(x1, x2)
+    return get_namespace2(x1, x2).subtract(x1, x2)
 
 
 def tan(x: Array, /) -> Array:
@@ -2050,7 +2051,7 @@ def tan(x: Array, /) -> Array:
         :ref:`type-promotion`.
 
     """
-    return get_namespace(x).tan(x)
+    return get_namespace1(x).tan(x)
 
 
 def tanh(x: Array, /) -> Array:
@@ -2083,7 +2084,7 @@ def tanh(x: Array, /) -> Array:
         :ref:`type-promotion`.
 
     """
-    return get_namespace(x).tanh(x)
+    return get_namespace1(x).tanh(x)
 
 
 def trunc(x: Array, /) -> Array:
@@ -2115,7 +2116,7 @@ def trunc(x: Array, /) -> Array:
         returned array must have the same data type as ``x``.
 
     """
-    return get_namespace(x).trunc(x)
+    return get_namespace1(x).trunc(x)
 
 
 ###############################################################################
@@ -2132,7 +2133,7 @@ class HasElementwiseFunctions(Protocol):
     def acosh(x: Array, /) -> Array: ...
 
     @staticmethod
-    def add(x1: Array, x2: Array, /) -> Array: ...
+    def add(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array: ...
 
     @staticmethod
     def asin(x: Array, /) -> Array: ...
@@ -2144,28 +2145,32 @@ class HasElementwiseFunctions(Protocol):
     def atan(x: Array, /) -> Array: ...
 
     @staticmethod
-    def atan2(x1: Array, x2: Array, /) -> Array: ...
+    def atan2(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array: ...
 
     @staticmethod
     def atanh(x: Array, /) -> Array: ...
 
     @staticmethod
-    def bitwise_and(x1: Array, x2: Array, /) -> Array: ...
+    def bitwise_and(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array: ...
 
     @staticmethod
-    def bitwise_left_shift(x1: Array, x2: Array, /) -> Array: ...
+    def bitwise_left_shift(
+        x1: Array | PyScalar, x2: Array | PyScalar, /
+    ) -> Array: ...
 
     @staticmethod
     def bitwise_invert(x: Array, /) -> Array: ...
 
     @staticmethod
-    def bitwise_or(x1: Array, x2: Array, /) -> Array: ...
+    def bitwise_or(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array: ...
 
     @staticmethod
-    def bitwise_right_shift(x1: Array, x2: Array, /) -> Array: ...
+    def bitwise_right_shift(
+        x1: Array | PyScalar, x2: Array | PyScalar, /
+    ) -> Array: ...
 
     @staticmethod
-    def bitwise_xor(x1: Array, x2: Array, /) -> Array: ...
+    def bitwise_xor(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array: ...
 
     @staticmethod
     def ceil(x: Array, /) -> Array: ...
@@ -2177,10 +2182,10 @@ class HasElementwiseFunctions(Protocol):
     def cosh(x: Array, /) -> Array: ...
 
     @staticmethod
-    def divide(x1: Array, x2: Array, /) -> Array: ...
+    def divide(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array: ...
 
     @staticmethod
-    def equal(x1: Array, x2: Array, /) -> Array: ...
+    def equal(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array: ...
 
     @staticmethod
     def exp(x: Array, /) -> Array: ...
@@ -2192,13 +2197,17 @@ class HasElementwiseFunctions(Protocol):
     def floor(x: Array, /) -> Array: ...
 
     @staticmethod
-    def floor_divide(x1: Array, x2: Array, /) -> Array: ...
+    def floor_divide(
+        x1: Array | PyScalar, x2: Array | PyScalar, /
+    ) -> Array: ...
 
     @staticmethod
-    def greater(x1: Array, x2: Array, /) -> Array: ...
+    def greater(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array: ...
 
     @staticmethod
-    def greater_equal(x1: Array, x2: Array, /) -> Array: ...
+    def greater_equal(
+        x1: Array | PyScalar, x2: Array | PyScalar, /
+    ) -> Array: ...
 
     @staticmethod
     def isfinite(x: Array, /) -> Array: ...
@@ -2210,10 +2219,10 @@ class HasElementwiseFunctions(Protocol):
     def isnan(x: Array, /) -> Array: ...
 
     @staticmethod
-    def less(x1: Array, x2: Array, /) -> Array: ...
+    def less(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array: ...
 
     @staticmethod
-    def less_equal(x1: Array, x2: Array, /) -> Array: ...
+    def less_equal(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array: ...
 
     @staticmethod
     def log(x: Array, /) -> Array: ...
@@ -2228,37 +2237,37 @@ class HasElementwiseFunctions(Protocol):
     def log10(x: Array, /) -> Array: ...
 
     @staticmethod
-    def logaddexp(x1: Array, x2: Array, /) -> Array: ...
+    def logaddexp(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array: ...
 
     @staticmethod
-    def logical_and(x1: Array, x2: Array, /) -> Array: ...
+    def logical_and(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array: ...
 
     @staticmethod
     def logical_not(x: Array, /) -> Array: ...
 
     @staticmethod
-    def logical_or(x1: Array, x2: Array, /) -> Array: ...
+    def logical_or(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array: ...
 
     @staticmethod
-    def logical_xor(x1: Array, x2: Array, /) -> Array: ...
+    def logical_xor(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array: ...
 
     @staticmethod
-    def multiply(x1: Array, x2: Array, /) -> Array: ...
+    def multiply(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array: ...
 
     @staticmethod
     def negative(x: Array, /) -> Array: ...
 
     @staticmethod
-    def not_equal(x1: Array, x2: Array, /) -> Array: ...
+    def not_equal(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array: ...
 
     @staticmethod
     def positive(x: Array, /) -> Array: ...
 
     @staticmethod
-    def pow(x1: Array, x2: Array, /) -> Array: ...
+    def pow(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array: ...
 
     @staticmethod
-    def remainder(x1: Array, x2: Array, /) -> Array: ...
+    def remainder(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array: ...
 
     @staticmethod
     def round(x: Array, /) -> Array: ...
@@ -2279,7 +2288,7 @@ class HasElementwiseFunctions(Protocol):
     def sqrt(x: Array, /) -> Array: ...
 
     @staticmethod
-    def subtract(x1: Array, x2: Array, /) -> Array: ...
+    def subtract(x1: Array | PyScalar, x2: Array | PyScalar, /) -> Array: ...
 
     @staticmethod
     def tan(x: Array, /) -> Array: ...
@@ -0,0 +1,332 @@
+"""Instrumentation of the dispatch overhead."""
+
+from __future__ import annotations
+
+__all__ = ["DispatchRecorder"]
+
+from contextvars import ContextVar
+from threading import Lock
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from array_api._conformance import protocol_methods
+from array_api._namespace import add_dispatch_hook, remove_dispatch_hook
+from array_api._namespace_api import ArrayAPINamespace
+from array_api.linalg import ArrayAPILinAlgNamespace
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+    from array_api._namespace import Resolver, TraitsT
+
+T = TypeVar("T")
+
+# The recorders that are recording, to which conversions are reported.
+_recording: tuple[DispatchRecorder, ...] = ()
+_recording_lock = Lock()
+
+# Whether calls are made by a function being recorded, see `recorded`.
+_nested: ContextVar[bool] = ContextVar("_nested", default=False)
+
+
+def _namespace_name(ns: Any) -> str:  # noqa: ANN401
+    return getattr(ns, "__name__", None) or repr(ns)
+
+
+def record_conversion(
+    source: ArrayAPINamespace,
+    target: ArrayAPINamespace,
+    *,
+    copied: bool,
+    seconds: float,
+) -> None:
+    """
+    Record the conversion of an array between namespaces.
+
+    Parameters
+    ----------
+    source, target : ArrayAPINamespace
+        The namespaces of the array and of the conversion.
+    copied : bool
+        Whether the data was copied.
+    seconds : float
+        The time taken by the conversion.
+
+    """
+    if not _recording:
+        return
+    name = f"{_namespace_name(source)} -> {_namespace_name(target)}"
+    for recorder in _recording:
+        recorder._record_conversion(name, copied, seconds)  # noqa: SLF001
+
+
+def recorded(
+    name: str, func: Callable[..., T], xp: Any  # noqa: ANN401
+) -> Callable[..., T]:
+    """
+    Record the calls of ``func`` as calls of the function ``name`` of ``xp``.
+
+    For the functions of `array_api` that are implemented with those of the
+    namespace, e.g. fallbacks, so that they are recorded under their own name.
+    The calls that ``func`` makes to the namespace are not recorded.
+
+    Parameters
+    ----------
+    name : str
+        The name to record the calls under, e.g. ``"topk"``.
+    func : Callable[..., T]
+        The function.
+    xp : Any
+        The namespace that ``func`` is called with, which is recorded if it is,
+        or wraps, the proxy of a recorder.
+
+    Returns
+    -------
+    Callable[..., T]
+        ``func``, timed by the recorders of ``xp``, if any.
+
+    """
+    if not _recording or _nested.get():
+        return func
+
+    def call(*args: Any, **kwargs: Any) -> T:  # noqa: ANN401
+        token = _nested.set(True)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _nested.reset(token)
+
+    timed: Callable[..., T] = func
+    while xp is not None:
+        if isinstance(xp, _RecordingNamespace):
+            timed = xp.timed(name, call if timed is func else timed)
+        xp = getattr(xp, "__wrapped__", None)
+    return timed
+
+
+class _RecordingNamespace:
+    """Proxy of a namespace that times calls to its functions."""
+
+    __slots__ = ("_dispatch_time", "_namespace", "_prefix", "_recorder")
+
+    def __init__(
+        self,
+        namespace: Any,  # noqa: ANN401
+        recorder: DispatchRecorder,
+        dispatch_time: float,
+        prefix: str = "",
+    ) -> None:
+        self._namespace = namespace
+        self._recorder = recorder
+        self._dispatch_time = dispatch_time
+        self._prefix = prefix
+
+    def __repr__(self) -> str:
+        return f"<recording {self._namespace!r}>"
+
+    @property
+    def __wrapped__(self) -> Any:  # noqa: ANN401
+        """The namespace proxied."""
+        return self._namespace
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        attr = getattr(self._namespace, name)
+        if _nested.get():
+            return attr
+        if not self._prefix and name == "linalg":
+            dispatch_time, self._dispatch_time = self._dispatch_time, 0.0
+            return _RecordingNamespace(
+                attr, self._recorder, dispatch_time, "linalg."
+            )
+
+        functions = protocol_methods(
+            ArrayAPILinAlgNamespace if self._prefix else ArrayAPINamespace
+        )
+        if name not in functions:
+            return attr
+        return self.timed(name, attr)
+
+    def timed(self, name: str, func: Callable[..., T]) -> Callable[..., T]:
+        """Wrap ``func`` to record its calls under the name ``name``."""
+        # The dispatch time is attributed to the first function looked up.
+        dispatch_time, self._dispatch_time = self._dispatch_time, 0.0
+        return self._recorder._timed(  # noqa: SLF001
+            self._prefix + name, func, dispatch_time
+        )
+
+
+class DispatchRecorder:
+    """
+    Record the time spent dispatching and in the backend, per function.
+
+    While recording, every wrapper (e.g. `array_api.sum` or
+    `array_api.linalg.svd`) counts its calls, the time spent resolving the
+    namespace, and the time spent in the backend function. Recording is
+    process-wide, i.e. calls from all threads are recorded. When no recorder
+    is active the only cost is a global lookup per call.
+
+    Examples
+    --------
+    >>> import array_api as ap
+    >>> with ap.DispatchRecorder() as recorder:  # doctest: +SKIP
+    ...     ap.sum(x)
+    >>> recorder.as_dict()  # doctest: +SKIP
+    {'sum': {'calls': 1, 'dispatch_time': 2.1e-07, 'backend_time': 3.2e-06}}
+
+    Conversions of arrays between namespaces, e.g. by
+    :func:`~array_api.promote_namespaces`, are also recorded. Their time is
+    part of the dispatch time of the function called.
+
+    """
+
+    def __init__(self) -> None:
+        # name -> [calls, dispatch time, backend time]
+        self._stats: dict[str, list[float]] = {}
+        # "source -> target" -> [arrays, copies, time]
+        self._conversions: dict[str, list[float]] = {}
+        self._lock = Lock()
+        self._active = False
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+    @property
+    def active(self) -> bool:
+        """Whether calls are being recorded."""
+        return self._active
+
+    def start(self) -> None:
+        """Start recording. Does nothing if already recording."""
+        global _recording  # noqa: PLW0603
+
+        with self._lock:
+            if not self._active:
+                add_dispatch_hook(self._hook)
+                with _recording_lock:
+                    _recording = (*_recording, self)
+                self._active = True
+
+    def stop(self) -> None:
+        """Stop recording. Does nothing if not recording."""
+        global _recording  # noqa: PLW0603
+
+        with self._lock:
+            if self._active:
+                remove_dispatch_hook(self._hook)
+                with _recording_lock:
+                    _recording = tuple(r for r in _recording if r is not self)
+                self._active = False
+
+    def reset(self) -> None:
+        """Discard the recorded statistics."""
+        with self._lock:
+            self._stats.clear()
+            self._conversions.clear()
+
+    def as_dict(self) -> dict[str, dict[str, float]]:
+        """
+        Return the recorded statistics.
+
+        Returns
+        -------
+        dict[str, dict[str, float]]
+            For each function called, by name (e.g. ``"sum"`` or
+            ``"linalg.svd"``), a dictionary with the number of ``"calls"``, and
+            the cumulative ``"dispatch_time"`` and ``"backend_time"`` in
+            seconds.
+
+        """
+        with self._lock:
+            return {
+                name: {
+                    "calls": int(calls),
+                    "dispatch_time": dispatch_time,
+                    "backend_time": backend_time,
+                }
+                for name, (calls, dispatch_time, backend_time) in sorted(
+                    self._stats.items()
+                )
+            }
+
+    def conversions(self) -> dict[str, dict[str, float]]:
+        """
+        Return the recorded conversions of arrays between namespaces.
+
+        Returns
+        -------
+        dict[str, dict[str, float]]
+            For each pair of namespaces, by name (e.g. ``"numpy -> torch"``), a
+            dictionary with the number of ``"arrays"`` converted, how many of
+            them were ``"copies"``, and the cumulative ``"time"`` in seconds.
+
+        """
+        with self._lock:
+            return {
+                name: {"arrays": int(arrays), "copies": int(copies), "time": t}
+                for name, (arrays, copies, t) in sorted(
+                    self._conversions.items()
+                )
+            }
+
+    def _hook(
+        self,
+        xs: tuple[Any, ...],
+        array_traits: TraitsT,
+        api_version: str | None,
+        resolve: Resolver,
+    ) -> ArrayAPINamespace:
+        start = perf_counter()
+        ns = resolve(xs, array_traits, api_version)
+        dispatch_time = perf_counter() - start
+        return _RecordingNamespace(ns, self, dispatch_time)  # type: ignore[return-value]
+
+    def _timed(
+        self, name: str, func: Callable[..., Any], dispatch_time: float
+    ) -> Callable[..., Any]:
+        """Wrap ``func`` to record its calls under ``name``."""
+
+        def timed(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._record(name, dispatch_time, perf_counter() - start)
+
+        timed.__wrapped__ = func  # type: ignore[attr-defined]
+        return timed
+
+    def _record(
+        self, name: str, dispatch_time: float, backend_time: float
+    ) -> None:
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                self._stats[name] = [1, dispatch_time, backend_time]
+            else:
+                stats[0] += 1
+                stats[1] += dispatch_time
+                stats[2] += backend_time
+
+    def _record_conversion(
+        self, name: str, copied: bool, seconds: float  # noqa: FBT001
+    ) -> None:
+        with self._lock:
+            stats = self._conversions.get(name)
+            if stats is None:
+                self._conversions[name] = [1, int(copied), seconds]
+            else:
+                stats[0] += 1
+                stats[1] += copied
+                stats[2] += seconds
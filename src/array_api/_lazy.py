@@ -0,0 +1,517 @@
+"""Lazy evaluation of elementwise functions."""
+
+from __future__ import annotations
+
+__all__ = ["LazyArray", "lazy", "materialize"]
+
+import inspect
+import operator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from array_api._conformance import protocol_methods
+from array_api._elementwise_functions import HasElementwiseFunctions
+from array_api._namespace import (
+    _PYTHON_SCALARS,
+    dispatch_hook_scope,
+)
+from array_api._namespace_api import ArrayAPINamespace
+from array_api.linalg import ArrayAPILinAlgNamespace
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from array_api._namespace import Resolver, TraitsT
+
+# Whether elementwise functions are deferred in the current context.
+_lazy_mode: ContextVar[bool] = ContextVar("array_api_lazy_mode", default=False)
+
+
+class LazyArray:
+    """
+    A deferred call of an elementwise function.
+
+    Lazy arrays are returned by the elementwise functions, e.g. `array_api.add`,
+    inside a :func:`lazy` scope. Together they form an expression graph whose
+    leaves are arrays or Python scalars. The graph is evaluated by the array's
+    namespace on :meth:`compute`, :func:`materialize` or conversion to a NumPy
+    array, and the result is kept.
+
+    Lazy arrays are not arrays: other functions evaluate them when called in a
+    :func:`lazy` scope, but outside of one they must be materialized first.
+    """
+
+    __slots__ = ("_args", "_func", "_namespace", "_value")
+
+    def __init__(
+        self,
+        namespace: Any,  # noqa: ANN401
+        func: str,
+        args: tuple[Any, ...],
+    ) -> None:
+        self._namespace = namespace
+        self._func = func
+        self._args: tuple[Any, ...] | None = args
+        self._value: Any = None
+
+    def __repr__(self) -> str:
+        if self._args is None:
+            return f"LazyArray({self._value!r})"
+        return f"LazyArray({_expression(self)})"
+
+    def __array__(
+        self,
+        dtype: Any = None,  # noqa: ANN401
+        copy: bool | None = None,
+    ) -> Any:  # noqa: ANN401
+        import numpy as np
+
+        # NumPy 1 passes no ``copy``, and its `numpy.asarray` takes none.
+        if copy is None:
+            return np.asarray(self.compute(), dtype=dtype)
+        return np.asarray(self.compute(), dtype=dtype, copy=copy)
+
+    @property
+    def namespace(self) -> ArrayAPINamespace:
+        """The namespace that evaluates the expression."""
+        return self._namespace  # type: ignore[no-any-return]
+
+    def compute(self) -> Any:  # noqa: ANN401
+        """
+        Evaluate the expression.
+
+        Returns
+        -------
+        Array
+            The value of the expression, an array of :attr:`namespace`.
+
+        """
+        if self._args is not None:
+            self._value = _evaluate(self)
+            self._args = None  # release the graph
+        return self._value
+
+
+def _expression(node: LazyArray) -> str:
+    """Format the expression of a lazy array."""
+    if node._args is None:  # noqa: SLF001
+        return "<computed>"
+    args = ", ".join(
+        (
+            _expression(arg)
+            if isinstance(arg, LazyArray)
+            else (
+                repr(arg)
+                if type(arg) in _PYTHON_SCALARS
+                else f"<{type(arg).__name__}>"
+            )
+        )
+        for arg in node._args  # noqa: SLF001
+    )
+    return f"{node._func}({args})"  # noqa: SLF001
+
+
+# Functions whose result has the dtype of their arguments, if those are all
+# real floating-point arrays of that dtype or real Python scalars. Only the
+# results of these are written into scratch buffers.
+_FLOAT_PRESERVING = frozenset(
+    {
+        "abs",
+        "acos",
+        "acosh",
+        "add",
+        "asin",
+        "asinh",
+        "atan",
+        "atan2",
+        "atanh",
+        "ceil",
+        "cos",
+        "cosh",
+        "divide",
+        "exp",
+        "expm1",
+        "floor",
+        "floor_divide",
+        "log",
+        "log10",
+        "log1p",
+        "log2",
+        "logaddexp",
+        "multiply",
+        "negative",
+        "positive",
+        "pow",
+        "remainder",
+        "round",
+        "sign",
+        "sin",
+        "sinh",
+        "sqrt",
+        "square",
+        "subtract",
+        "tan",
+        "tanh",
+        "trunc",
+    }
+)
+
+# The in-place operators of the standard, for backends without ``out=``, and
+# whether the operation is commutative.
+_INPLACE: dict[str, tuple[Callable[[Any, Any], Any], bool]] = {
+    "add": (operator.iadd, True),
+    "divide": (operator.itruediv, False),
+    "floor_divide": (operator.ifloordiv, False),
+    "multiply": (operator.imul, True),
+    "pow": (operator.ipow, False),
+    "remainder": (operator.imod, False),
+    "subtract": (operator.isub, False),
+}
+
+_REAL_SCALARS = frozenset({bool, int, float})
+
+# Maximum number of functions remembered by `_accepts_out`.
+_ACCEPTS_OUT_CACHE_MAXSIZE: int = 256
+
+
+@lru_cache(maxsize=_ACCEPTS_OUT_CACHE_MAXSIZE)
+def _accepts_out(func: Callable[..., Any]) -> bool:
+    """
+    Whether ``func`` can write its result into an ``out=`` argument.
+
+    Called with the backend function, see `_unwrapped`, rather than the
+    wrappers of proxies, which are new on each lookup.
+    """
+    if hasattr(func, "nout"):  # NumPy-like ufunc
+        return True
+    try:
+        return "out" in inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def _layout(
+    namespace: Any,  # noqa: ANN401
+    args: list[Any],
+) -> tuple[Any, Any] | None:
+    """
+    Return the ``(shape, dtype)`` of elementwise ``args`` if it is preserved.
+
+    This is `None` unless the array arguments all have the same shape and the
+    same real floating-point dtype, and the other arguments are real Python
+    scalars, so that the result has that shape and dtype.
+    """
+    layout = None
+    for arg in args:
+        if type(arg) in _REAL_SCALARS:
+            continue
+        shape, dtype = getattr(arg, "shape", None), getattr(arg, "dtype", None)
+        if layout is None:
+            if not shape or dtype not in (namespace.float32, namespace.float64):
+                return None
+            layout = (shape, dtype)
+        elif shape != layout[0] or dtype != layout[1]:
+            return None
+    return layout
+
+
+def _schedule(root: LazyArray) -> tuple[list[LazyArray], dict[int, int]]:
+    """
+    Order the pending nodes of a graph so each comes after its arguments.
+
+    Returns
+    -------
+    list[LazyArray]
+        The nodes to evaluate, ending with ``root``.
+    dict[int, int]
+        The number of uses of each node, by `id`.
+
+    """
+    order: list[LazyArray] = []
+    uses: dict[int, int] = {}
+    stack: list[tuple[LazyArray, bool]] = [(root, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            order.append(node)
+            continue
+        if id(node) in uses:
+            uses[id(node)] += 1
+            continue
+        uses[id(node)] = 1
+        stack.append((node, True))
+        stack.extend(
+            (arg, False)
+            for arg in node._args or ()  # noqa: SLF001
+            if isinstance(arg, LazyArray)
+            and arg._args is not None  # noqa: SLF001
+        )
+    return order, uses
+
+
+def _call(
+    node: LazyArray,
+    args: list[Any],
+    dead: list[Any],
+    scratch: dict[tuple[Any, Any], list[Any]],
+) -> Any:  # noqa: ANN401
+    """
+    Call the function of ``node``, writing into a buffer where possible.
+
+    Parameters
+    ----------
+    node : LazyArray
+        The node to evaluate.
+    args : list[Any]
+        The evaluated arguments of the node.
+    dead : list[Any]
+        The intermediates among ``args`` that are not used by other nodes.
+    scratch : dict[tuple[Any, Any], list[Any]]
+        Released intermediates accepting ``out=``, by ``(shape, dtype)``.
+        Updated with the ``dead`` intermediates not holding the result.
+
+    Returns
+    -------
+    Array
+        The result.
+
+    """
+    namespace, name = node._namespace, node._func  # noqa: SLF001
+    func = getattr(namespace, name)
+    layout = _layout(namespace, args) if name in _FLOAT_PRESERVING else None
+    if layout is None:
+        return func(*args)
+
+    if _accepts_out(_unwrapped(func)):
+        pool = scratch.setdefault(layout, [])
+        pool.extend(d for d in dead if d.shape == layout[0])
+        return func(*args, out=pool.pop()) if pool else func(*args)
+
+    # The operators bypass the namespace, so not for proxies of it, e.g. of a
+    # recorder, which would miss the call.
+    if (
+        name in _INPLACE
+        and getattr(type(namespace), "__wrapped__", None) is None
+    ):
+        op, commutative = _INPLACE[name]
+        if any(args[0] is d for d in dead):
+            return op(args[0], args[1])
+        if commutative and any(args[1] is d for d in dead):
+            return op(args[1], args[0])
+    return func(*args)
+
+
+def _evaluate(root: LazyArray) -> Any:  # noqa: ANN401
+    """
+    Evaluate the expression graph of ``root``.
+
+    The graph is evaluated in one pass. Each intermediate array is released
+    after its last use or, if the next result has the same shape and
+    floating-point dtype, reused to hold that result: through ``out=`` if the
+    backend function accepts it, else through the in-place operators, unless
+    the namespace is a proxy, e.g. of a recorder, which must see the call. So
+    the peak memory of a chain of elementwise functions is independent of its
+    length. Arrays not created by the evaluation, e.g. the leaves, are never
+    written to.
+    """
+    order, uses = _schedule(root)
+    values: dict[int, Any] = {}
+    scratch: dict[tuple[Any, Any], list[Any]] = {}
+    # The intermediates that only the evaluation refers to, by `id`. A result
+    # that is an argument, e.g. from a `positive` returning its input, is not.
+    owned: set[int] = set()
+    for node in order:
+        args: list[Any] = []
+        dead: list[Any] = []  # intermediates used for the last time
+        for arg in node._args:  # type: ignore[union-attr]  # noqa: SLF001
+            if not isinstance(arg, LazyArray):
+                args.append(arg)
+            elif arg._args is None:  # noqa: SLF001
+                args.append(arg._value)  # noqa: SLF001
+            else:
+                key = id(arg)
+                uses[key] -= 1
+                if uses[key]:
+                    args.append(values[key])
+                else:
+                    args.append(values.pop(key))
+                    if id(args[-1]) in owned:
+                        dead.append(args[-1])
+        value = values[id(node)] = _call(node, args, dead, scratch)
+        if not any(value is arg for arg in args):
+            owned.add(id(value))
+        elif not any(value is d for d in dead):
+            owned.discard(id(value))
+    return values.pop(id(root))
+
+
+def materialize(x: Any) -> Any:  # noqa: ANN401
+    """
+    Evaluate ``x`` if it is a `LazyArray`.
+
+    Parameters
+    ----------
+    x : Any
+        A lazy array, or any other object.
+
+    Returns
+    -------
+    Any
+        The value of ``x`` if it is a lazy array, else ``x``.
+
+    """
+    return x.compute() if isinstance(x, LazyArray) else x
+
+
+def _materialize_all(arg: Any) -> Any:  # noqa: ANN401
+    """Evaluate ``arg``, or the lazy arrays in a list or tuple ``arg``."""
+    if isinstance(arg, LazyArray):
+        return arg.compute()
+    if isinstance(arg, list | tuple) and any(
+        isinstance(a, LazyArray) for a in arg
+    ):
+        return type(arg)(map(materialize, arg))
+    return arg
+
+
+def _materializing(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap ``func`` to evaluate lazy array arguments first."""
+
+    def call(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        return func(
+            *map(_materialize_all, args),
+            **{k: _materialize_all(v) for k, v in kwargs.items()},
+        )
+
+    return call
+
+
+class _LazyNamespace:
+    """Proxy of a namespace deferring its elementwise functions."""
+
+    __slots__ = ("_namespace",)
+
+    def __init__(self, namespace: Any) -> None:  # noqa: ANN401
+        self._namespace = namespace
+
+    def __repr__(self) -> str:
+        return f"<lazy {self._namespace!r}>"
+
+    @property
+    def __wrapped__(self) -> Any:  # noqa: ANN401
+        """The namespace proxied."""
+        return self._namespace
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        if name in protocol_methods(HasElementwiseFunctions):
+            namespace = self._namespace
+
+            def defer(*args: Any) -> LazyArray:  # noqa: ANN401
+                return LazyArray(namespace, name, args)
+
+            return defer
+
+        attr = getattr(self._namespace, name)
+        if name == "linalg":
+            return _MaterializingNamespace(attr)
+        if name in protocol_methods(ArrayAPINamespace):
+            return _materializing(attr)
+        return attr
+
+
+class _MaterializingNamespace:
+    """Proxy of a namespace evaluating lazy array arguments."""
+
+    __slots__ = ("_namespace",)
+
+    def __init__(self, namespace: Any) -> None:  # noqa: ANN401
+        self._namespace = namespace
+
+    @property
+    def __wrapped__(self) -> Any:  # noqa: ANN401
+        """The namespace proxied."""
+        return self._namespace
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        attr = getattr(self._namespace, name)
+        if name in protocol_methods(ArrayAPILinAlgNamespace):
+            return _materializing(attr)
+        return attr
+
+
+def _unwrapped(obj: Any) -> Any:  # noqa: ANN401
+    """
+    Return what ``obj`` wraps, following ``__wrapped__``.
+
+    E.g. the namespace of a proxy, or the function of a wrapper of a proxy.
+    """
+    while (wrapped := getattr(obj, "__wrapped__", None)) is not None:
+        obj = wrapped
+    return obj
+
+
+def _lazy_hook(
+    xs: tuple[Any, ...],
+    array_traits: TraitsT,
+    api_version: str | None,
+    resolve: Resolver,
+) -> ArrayAPINamespace:
+    """Dispatch hook deferring elementwise functions in `lazy` scopes."""
+    if not _lazy_mode.get():
+        return resolve(xs, array_traits, api_version)
+
+    # Lazy arrays carry their namespace, so only the other inputs are resolved.
+    namespaces = [
+        x._namespace for x in xs if isinstance(x, LazyArray)  # noqa: SLF001
+    ]
+    others = tuple(x for x in xs if not isinstance(x, LazyArray))
+    if not namespaces or any(type(x) not in _PYTHON_SCALARS for x in others):
+        namespaces.append(resolve(others, array_traits, api_version))
+    namespace = namespaces[-1]
+    if any(ns is not namespace for ns in namespaces):
+        # Proxies of other hooks, e.g. of a recorder, are made per resolution,
+        # so the namespaces they wrap are compared.
+        unwrapped = _unwrapped(namespace)
+        if any(_unwrapped(ns) is not unwrapped for ns in namespaces):
+            msg = f"Multiple namespaces for array inputs: {namespaces}"
+            raise ValueError(msg)
+    return _LazyNamespace(namespace)  # type: ignore[return-value]
+
+
+@contextmanager
+def lazy() -> Iterator[None]:
+    """
+    Defer elementwise functions within a scope.
+
+    In the scope, the elementwise functions (e.g. `array_api.add` or
+    `array_api.exp`) return a `LazyArray` instead of calling the backend.
+    Chains of elementwise functions build an expression graph, which is
+    evaluated at once when needed, so inputs are resolved once per graph
+    rather than once per call, and intermediate arrays are reused to hold later
+    results where the shape and dtype allow. Other functions evaluate lazy
+    array arguments.
+
+    The scope is local to the current thread or `asyncio` task.
+
+    Yields
+    ------
+    None
+
+    Examples
+    --------
+    >>> import array_api as ap
+    >>> with ap.lazy():  # doctest: +SKIP
+    ...     y = ap.exp(ap.multiply(ap.sin(x), x))
+    >>> y  # doctest: +SKIP
+    LazyArray(exp(multiply(sin(<Array>), <Array>)))
+    >>> ap.materialize(y)  # doctest: +SKIP
+
+    """
+    with dispatch_hook_scope(_lazy_hook):
+        token = _lazy_mode.set(True)
+        try:
+            yield
+        finally:
+            _lazy_mode.reset(token)
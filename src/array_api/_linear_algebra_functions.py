@@ -6,7 +6,7 @@ __all__ = ["matmul", "matrix_transpose", "tensordot", "vecdot"]
 
 from typing import TYPE_CHECKING, Protocol
 
-from array_api._namespace import get_namespace
+from array_api._namespace import get_namespace1, get_namespace2
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -107,7 +107,7 @@ def matmul(x1: Array, x2: Array, /) -> Array:
         having shape ``(..., L, N)``, and ``K != L``.
 
     """
-    return get_namespace(x1, x2).matmul(x1, x2)
+    return get_namespace2(x1, x2).matmul(x1, x2)
 
 
 def matrix_transpose(x: Array, /) -> Array:
@@ -128,7 +128,7 @@ def matrix_transpose(x: Array, /) -> Array:
         ``x``.
 
     """
-    return get_namespace(x).matrix_transpose(x)
+    return get_namespace1(x).matrix_transpose(x)
 
 
 def tensordot(
@@ -185,8 +185,7 @@ def tensordot(
         :ref:`type-promotion`.
 
     """
-    xp = get_namespace(x1, x2)
-    return xp.tensordot(x1, x2, axes=axes)
+    return get_namespace2(x1, x2).tensordot(x1, x2, axes=axes)
 
 
 def vecdot(x1: Array, x2: Array, /, *, axis: int = -1) -> Array:
@@ -228,8 +227,7 @@ def vecdot(x1: Array, x2: Array, /, *, axis: int = -1) -> Array:
         the same for both ``x1`` and ``x2``.
 
     """
-    xp = get_namespace(x1, x2)
-    return xp.vecdot(x1, x2, axis=axis)
+    return get_namespace2(x1, x2).vecdot(x1, x2, axis=axis)
 
 
 ####################################################################################################
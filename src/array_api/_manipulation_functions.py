@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Protocol
 
-from array_api._namespace import get_namespace
+from array_api._namespace import get_namespace, get_namespace1
 
 if TYPE_CHECKING:
     from array_api._array import Array
@@ -86,7 +86,7 @@ def expand_dims(x: Array, /, *, axis: int = 0) -> Array:
         an expanded output array having the same data type as ``x``.
 
     """
-    return get_namespace(x).expand_dims(x, axis=axis)
+    return get_namespace1(x).expand_dims(x, axis=axis)
 
 
 def flip(x: Array, /, *, axis: AxisT = None) -> Array:
@@ -111,7 +111,7 @@ def flip(x: Array, /, *, axis: AxisT = None) -> Array:
         elements, relative to ``x``, are reordered.
 
     """
-    return get_namespace(x).flip(x, axis=axis)
+    return get_namespace1(x).flip(x, axis=axis)
 
 
 def permute_dims(x: Array, /, axes: tuple[int, ...]) -> Array:
@@ -133,7 +133,7 @@ def permute_dims(x: Array, /, axes: tuple[int, ...]) -> Array:
         the same data type as ``x``.
 
     """
-    return get_namespace(x).permute_dims(x, axes=axes)
+    return get_namespace1(x).permute_dims(x, axes=axes)
 
 
 def reshape(
@@ -168,7 +168,7 @@ def reshape(
         an output array having the same data type and elements as ``x``.
 
     """
-    return get_namespace(x).reshape(x, shape=shape, copy=copy)
+    return get_namespace1(x).reshape(x, shape=shape, copy=copy)
 
 
 def roll(
@@ -205,7 +205,7 @@ def roll(
         relative to ``x``, are shifted.
 
     """
-    return get_namespace(x).roll(x, shift=shift, axis=axis)
+    return get_namespace1(x).roll(x, shift=shift, axis=axis)
 
 
 def squeeze(x: Array, /, axis: int | tuple[int, ...]) -> Array:
@@ -226,7 +226,7 @@ def squeeze(x: Array, /, axis: int | tuple[int, ...]) -> Array:
         an output array having the same data type and elements as ``x``.
 
     """
-    return get_namespace(x).squeeze(x, axis=axis)
+    return get_namespace1(x).squeeze(x, axis=axis)
 
 
 def stack(
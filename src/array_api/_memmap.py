@@ -0,0 +1,499 @@
+"""A reference namespace of arrays memory-mapped from files."""
+
+from __future__ import annotations
+
+__all__ = ["MemmapArray", "open_memmap"]
+
+import operator
+from math import prod
+from tempfile import TemporaryFile
+from typing import TYPE_CHECKING, Any
+
+from array_api._accumulators import (
+    AllAccumulator,
+    AnyAccumulator,
+    MaxAccumulator,
+    MeanAccumulator,
+    MinAccumulator,
+    ProdAccumulator,
+    StdAccumulator,
+    SumAccumulator,
+    VarAccumulator,
+)
+from array_api._capabilities import capabilities
+from array_api._conformance import protocol_methods
+from array_api._elementwise_functions import HasElementwiseFunctions
+from array_api._namespace_api import ArrayAPINamespace
+from array_api._sorting_functions import _argsort, _sort
+from array_api.linalg import ArrayAPILinAlgNamespace
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from os import PathLike
+
+    from array_api._accumulators import _Accumulator
+    from array_api._types import AxisT
+
+# The number of bytes of the inputs and output of a function processed at
+# once. Outputs larger than this are written to temporary files.
+_WINDOW_BYTES: int = 1 << 26
+
+# The accumulators of the reductions, streamed over windows of the reduced
+# leading axis.
+_ACCUMULATORS: dict[str, type[_Accumulator]] = {
+    "all": AllAccumulator,
+    "any": AnyAccumulator,
+    "max": MaxAccumulator,
+    "mean": MeanAccumulator,
+    "min": MinAccumulator,
+    "prod": ProdAccumulator,
+    "std": StdAccumulator,
+    "sum": SumAccumulator,
+    "var": VarAccumulator,
+}
+
+# The Python operators of the array, and the elementwise functions they call.
+_UNARY_OPERATORS: dict[str, str] = {
+    "__abs__": "abs",
+    "__invert__": "bitwise_invert",
+    "__neg__": "negative",
+    "__pos__": "positive",
+}
+_BINARY_OPERATORS: dict[str, str] = {
+    "add": "add",
+    "and": "bitwise_and",
+    "floordiv": "floor_divide",
+    "lshift": "bitwise_left_shift",
+    "mod": "remainder",
+    "mul": "multiply",
+    "or": "bitwise_or",
+    "pow": "pow",
+    "rshift": "bitwise_right_shift",
+    "sub": "subtract",
+    "truediv": "divide",
+    "xor": "bitwise_xor",
+}
+_COMPARISONS: dict[str, str] = {
+    "__eq__": "equal",
+    "__ge__": "greater_equal",
+    "__gt__": "greater",
+    "__le__": "less_equal",
+    "__lt__": "less",
+    "__ne__": "not_equal",
+}
+
+
+def _unwrap(x: Any) -> Any:  # noqa: ANN401
+    """Return the NumPy arrays of ``x``, a `MemmapArray` or a sequence."""
+    if isinstance(x, MemmapArray):
+        return x._data  # noqa: SLF001
+    if isinstance(x, list | tuple):
+        return type(x)(map(_unwrap, x))
+    return x
+
+
+def _wrap(x: Any) -> Any:  # noqa: ANN401
+    """Return the `MemmapArray` of the NumPy results ``x``."""
+    import numpy as np
+
+    if isinstance(x, np.ndarray | np.generic):
+        return MemmapArray(np.asarray(x))
+    if isinstance(x, tuple) and hasattr(x, "_fields"):  # e.g. of `unique_all`
+        return type(x)(*map(_wrap, x))
+    if isinstance(x, list | tuple):
+        return type(x)(map(_wrap, x))
+    return x
+
+
+def _empty(shape: tuple[int, ...], dtype: Any) -> Any:  # noqa: ANN401
+    """Return an uninitialized output, in a temporary file if large."""
+    import numpy as np
+
+    if prod(shape) * np.dtype(dtype).itemsize <= _WINDOW_BYTES:
+        return np.empty(shape, dtype)
+    # The file is deleted when closed, i.e. once the map is collected.
+    with TemporaryFile() as file:
+        return np.memmap(file, dtype=dtype, mode="w+", shape=shape)
+
+
+def _rows(shape: tuple[int, ...], row_bytes: int) -> int:
+    """Return the number of rows of the leading axis per window."""
+    return max(1, _WINDOW_BYTES // max(prod(shape[1:]) * row_bytes, 1))
+
+
+def _window(x: Any, ndim: int, start: int, stop: int) -> Any:  # noqa: ANN401
+    """Return the window of ``x`` broadcast to ``ndim`` dimensions."""
+    import numpy as np
+
+    if not isinstance(x, np.ndarray) or x.ndim != ndim or x.shape[0] == 1:
+        return x  # broadcast along the leading axis
+    return np.asarray(x[start:stop])  # a view, not a `numpy.memmap`
+
+
+def _elementwise(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Stream the elementwise ``func`` over windows of the leading axis."""
+    import numpy as np
+
+    def elementwise(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        data = [_unwrap(x) for x in args]
+        arrays = [x for x in data if isinstance(x, np.ndarray)]
+        shape = np.broadcast_shapes(*(x.shape for x in arrays))
+        # The output dtype is that of the function of an element.
+        probe = func(
+            *(
+                x[(slice(0, 1),) * x.ndim] if isinstance(x, np.ndarray) else x
+                for x in data
+            ),
+            **kwargs,
+        )
+        row_bytes = sum(x.itemsize for x in arrays) + probe.itemsize
+        if not shape or prod(shape) * row_bytes <= _WINDOW_BYTES:
+            return _wrap(func(*data, **kwargs))
+
+        out = _empty(shape, probe.dtype)
+        rows = _rows(shape, row_bytes)
+        for start in range(0, shape[0], rows):
+            stop = min(start + rows, shape[0])
+            out[start:stop] = func(
+                *(_window(x, len(shape), start, stop) for x in data), **kwargs
+            )
+        return MemmapArray(out)
+
+    return elementwise
+
+
+def _reduction(
+    name: str, func: Callable[..., Any]
+) -> Callable[..., MemmapArray]:
+    """Stream the reduction ``func`` over windows of the leading axis."""
+
+    def reduction(
+        x: MemmapArray,
+        /,
+        *,
+        axis: AxisT = None,
+        keepdims: bool = False,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> MemmapArray:
+        data = _unwrap(x)
+        options = {"axis": axis, "keepdims": keepdims, **kwargs}
+        if data.ndim == 0 or data.nbytes <= _WINDOW_BYTES:
+            return _wrap(func(data, **options))  # type: ignore[no-any-return]
+
+        rows = _rows(data.shape, data.itemsize)
+        windows = [
+            _window(data, data.ndim, start, min(start + rows, data.shape[0]))
+            for start in range(0, data.shape[0], rows)
+        ]
+        if axis is None or 0 in {
+            a % data.ndim for a in ((axis,) if isinstance(axis, int) else axis)
+        }:
+            # Windows of a reduced axis are combined like chunks.
+            accumulator = _ACCUMULATORS[name](**options)
+            for window in windows:
+                accumulator.update(window)
+            return _wrap(accumulator.result())  # type: ignore[no-any-return]
+
+        # Otherwise the leading axis is that of the output.
+        first = func(windows[0], **options)
+        out = _empty((data.shape[0], *first.shape[1:]), first.dtype)
+        out[: len(windows[0])] = first
+        start = len(windows[0])
+        for window in windows[1:]:
+            out[start : start + len(window)] = func(window, **options)
+            start += len(window)
+        return MemmapArray(out)
+
+    return reduction
+
+
+def _fallback(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Call the NumPy ``func`` on the mapped arrays."""
+
+    def call(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        args = tuple(map(_unwrap, args))
+        kwargs = {k: _unwrap(v) for k, v in kwargs.items()}
+        return _wrap(func(*args, **kwargs))
+
+    return call
+
+
+def _numpy_sorting(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Adapt ``func`` of `array_api._sorting_functions` to NumPy arrays."""
+
+    def call(
+        x: Any,  # noqa: ANN401
+        /,
+        *,
+        axis: int = -1,
+        descending: bool = False,
+        stable: bool = True,
+    ) -> Any:  # noqa: ANN401
+        import numpy as np
+
+        caps = capabilities(np)  # type: ignore[arg-type]
+        return func(np, caps, x, axis, descending=descending, stable=stable)
+
+    return call
+
+
+# The functions of the standard whose NumPy function has other parameters.
+_ADAPTED: dict[str, Callable[..., Any]] = {
+    "argsort": _numpy_sorting(_argsort),
+    "sort": _numpy_sorting(_sort),
+}
+
+
+class _LinAlgNamespace:
+    """The linear algebra functions of the namespace of `MemmapArray`."""
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        import numpy as np
+
+        attr = getattr(np.linalg, name)
+        if name in protocol_methods(ArrayAPILinAlgNamespace):
+            attr = _fallback(attr)
+        setattr(self, name, attr)  # later lookups bypass `__getattr__`
+        return attr
+
+
+class _MemmapNamespace:
+    """The namespace of `MemmapArray`."""
+
+    def __repr__(self) -> str:
+        return "<namespace of MemmapArray>"
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        import numpy as np
+
+        if name == "linalg":
+            attr: Any = _LinAlgNamespace()
+        elif name in protocol_methods(HasElementwiseFunctions):
+            attr = _elementwise(getattr(np, name))
+        elif name in _ACCUMULATORS:
+            attr = _reduction(name, getattr(np, name))
+        elif name in protocol_methods(ArrayAPINamespace):
+            attr = _fallback(_ADAPTED.get(name) or getattr(np, name))
+        else:  # constants and data types
+            attr = getattr(np, name)
+        setattr(self, name, attr)  # later lookups bypass `__getattr__`
+        return attr
+
+
+_namespace = _MemmapNamespace()
+
+
+class MemmapArray:
+    """
+    An array memory-mapped from a file, or an array in memory.
+
+    This is a reference implementation of the `Array` protocol, whose namespace
+    implements `ArrayAPINamespace` with NumPy, so that the functions of
+    `array_api` work on arrays in files larger than the memory. The
+    elementwise functions and the operators, and the reductions `sum`, `prod`,
+    `min`, `max`, `mean`, `var`, `std`, `all` and `any`, stream over windows
+    of the leading axis of at most about 64 MiB, so that only the pages of a
+    window need to be in memory at once. Outputs larger than a window are
+    written to temporary files, in `tempfile.gettempdir`. Reductions over the
+    leading axis combine the windows as the accumulators do, e.g.
+    `SumAccumulator`. The other functions are those of NumPy, on the mapped
+    arrays, and return arrays in memory.
+
+    Arrays are made with :func:`open_memmap`, or by the functions of the
+    namespace, e.g. ``x.__array_namespace__().asarray``.
+
+    Examples
+    --------
+    >>> import array_api as ap
+    >>> x = ap.open_memmap("data.npy")  # doctest: +SKIP
+    >>> ap.mean(ap.exp(x), axis=0)  # doctest: +SKIP
+
+    """
+
+    __slots__ = ("_data",)
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, data: Any, /) -> None:  # noqa: ANN401
+        self._data = data
+
+    def __repr__(self) -> str:
+        return f"MemmapArray({self._data!r})"
+
+    def __array__(
+        self,
+        dtype: Any = None,  # noqa: ANN401
+        copy: bool | None = None,
+    ) -> Any:  # noqa: ANN401
+        import numpy as np
+
+        # NumPy 1 passes no ``copy``, and its `numpy.asarray` takes none.
+        if copy is None:
+            return np.asarray(self._data, dtype=dtype)
+        return np.asarray(self._data, dtype=dtype, copy=copy)
+
+    def __array_namespace__(
+        self, /, *, api_version: str | None = None
+    ) -> ArrayAPINamespace:
+        """Return the namespace of memory-mapped arrays."""
+        return _namespace  # type: ignore[return-value]
+
+    @property
+    def dtype(self) -> Any:  # noqa: ANN401
+        """The data type of the array."""
+        return self._data.dtype
+
+    @property
+    def device(self) -> str:
+        """The device of the array, always the CPU."""
+        return "cpu"
+
+    @property
+    def ndim(self) -> int:
+        """The number of dimensions of the array."""
+        return self._data.ndim  # type: ignore[no-any-return]
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """The shape of the array."""
+        return self._data.shape  # type: ignore[no-any-return]
+
+    @property
+    def size(self) -> int:
+        """The number of elements of the array."""
+        return self._data.size  # type: ignore[no-any-return]
+
+    @property
+    def T(self) -> MemmapArray:  # noqa: N802
+        """The transpose of the matrix."""
+        return MemmapArray(self._data.T)
+
+    @property
+    def mT(self) -> MemmapArray:  # noqa: N802
+        """The transpose of the stack of matrices."""
+        return MemmapArray(self._data.mT)
+
+    def to_device(
+        self, device: Any, /, *, stream: Any = None  # noqa: ANN401, ARG002
+    ) -> MemmapArray:
+        """Return the array, which is on the CPU."""
+        if device != "cpu":
+            msg = f"unsupported device {device!r}"
+            raise ValueError(msg)
+        return self
+
+    def __dlpack__(self, /, **kwargs: Any) -> Any:  # noqa: ANN401
+        """Export the array with DLPack."""
+        return self._data.__dlpack__(**kwargs)
+
+    def __dlpack_device__(self, /) -> Any:  # noqa: ANN401
+        """Return the DLPack device of the array."""
+        return self._data.__dlpack_device__()
+
+    def __getitem__(self, key: Any, /) -> MemmapArray:  # noqa: ANN401
+        """Return a view of the array, which is not read."""
+        return MemmapArray(self._data[_unwrap(key)])
+
+    def __setitem__(self, key: Any, value: Any, /) -> None:  # noqa: ANN401
+        """Write to the array, if opened for writing."""
+        self._data[_unwrap(key)] = _unwrap(value)
+
+    def __bool__(self, /) -> bool:
+        return bool(self._data)
+
+    def __complex__(self, /) -> complex:
+        return complex(self._data)
+
+    def __float__(self, /) -> float:
+        return float(self._data)
+
+    def __index__(self, /) -> int:
+        return operator.index(self._data)
+
+    def __int__(self, /) -> int:
+        return int(self._data)
+
+    def __matmul__(self, other: MemmapArray, /) -> MemmapArray:
+        return _namespace.matmul(self, other)  # type: ignore[no-any-return]
+
+    def __rmatmul__(self, other: MemmapArray, /) -> MemmapArray:
+        return _namespace.matmul(other, self)  # type: ignore[no-any-return]
+
+
+def _unary_operator(name: str) -> Callable[[MemmapArray], MemmapArray]:
+    def method(self: MemmapArray, /) -> MemmapArray:
+        return getattr(_namespace, name)(self)  # type: ignore[no-any-return]
+
+    return method
+
+
+def _binary_operator(name: str, *, reflected: bool) -> Callable[..., Any]:
+    def method(self: MemmapArray, other: Any, /) -> Any:  # noqa: ANN401
+        if not isinstance(other, MemmapArray | bool | int | float | complex):
+            return NotImplemented
+        func = getattr(_namespace, name)
+        return func(other, self) if reflected else func(self, other)
+
+    return method
+
+
+for _dunder, _name in _UNARY_OPERATORS.items():
+    setattr(MemmapArray, _dunder, _unary_operator(_name))
+for _dunder, _name in _COMPARISONS.items():
+    setattr(MemmapArray, _dunder, _binary_operator(_name, reflected=False))
+for _op, _name in _BINARY_OPERATORS.items():
+    setattr(MemmapArray, f"__{_op}__", _binary_operator(_name, reflected=False))
+    setattr(MemmapArray, f"__r{_op}__", _binary_operator(_name, reflected=True))
+del _dunder, _name, _op
+
+
+def open_memmap(
+    filename: str | PathLike[str],
+    /,
+    *,
+    mode: str = "r",
+    dtype: Any = None,  # noqa: ANN401
+    shape: tuple[int, ...] | None = None,
+    offset: int = 0,
+) -> MemmapArray:
+    """
+    Map an array from a file.
+
+    Parameters
+    ----------
+    filename : str | PathLike[str]
+        The file. Without ``dtype``, a ``.npy`` file, whose header gives the
+        data type and shape of the array, as by `numpy.load`. Otherwise a file
+        of raw data, as by `numpy.memmap`.
+    mode : str, optional
+        How to open the file: ``"r"`` to read, ``"r+"`` to read and write,
+        ``"w+"`` to create or overwrite, or ``"c"`` to write to memory only.
+        By default ``"r"``.
+    dtype : DType | None, optional
+        The data type of a file of raw data.
+    shape : tuple[int, ...] | None, optional
+        The shape of a file of raw data, by default 1-dimensional.
+    offset : int, optional
+        The position of the array in a file of raw data, in bytes, by default
+        0.
+
+    Returns
+    -------
+    MemmapArray
+        The array. Pages of the file are read when accessed.
+
+    Examples
+    --------
+    >>> import array_api as ap
+    >>> x = ap.open_memmap("x", dtype="f4", shape=(2**30,))  # doctest: +SKIP
+    >>> ap.sum(x, axis=0)  # doctest: +SKIP
+
+    """
+    import numpy as np
+
+    if dtype is None:
+        data = np.load(filename, mmap_mode=mode)  # type: ignore[arg-type]
+    else:
+        data = np.memmap(  # type: ignore[call-overload]
+            filename, dtype=dtype, mode=mode, shape=shape, offset=offset
+        )
+    return MemmapArray(data)
@@ -0,0 +1,95 @@
+"""
+Selection of the compiled or pure-Python implementation.
+
+Wheels may ship the dispatch layer compiled with mypyc next to the Python
+sources. The compiled extension modules are used by default. The pure-Python
+modules are used instead if the environment variable ``ARRAYAPI_PURE_PYTHON``
+is set to ``1``, or if the compiled modules cannot be imported, e.g. because of
+an ABI mismatch.
+
+This module must not be compiled.
+"""
+
+from __future__ import annotations
+
+__all__: list[str] = []
+
+import os
+import sys
+from importlib.util import spec_from_file_location
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from importlib.machinery import ModuleSpec
+    from types import ModuleType
+
+PACKAGE = __name__.rpartition(".")[0]
+
+
+class _SourceFinder:
+    """
+    Finder that imports ``array_api`` submodules from their ``.py`` files.
+
+    This implements `importlib.abc.MetaPathFinder`, which is not subclassed,
+    nor is `pathlib` used, as importing them noticeably slows down
+    ``import array_api``.
+    """
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Sequence[str] | None,
+        target: ModuleType | None = None,  # noqa: ARG002
+    ) -> ModuleSpec | None:
+        if not fullname.startswith(PACKAGE + ".") or path is None:
+            return None
+
+        name = fullname.rpartition(".")[2]
+        for entry in path:
+            package = os.path.join(entry, name)  # noqa: PTH118
+            init = os.path.join(package, "__init__.py")  # noqa: PTH118
+            if os.path.isfile(init):  # noqa: PTH113
+                return spec_from_file_location(
+                    fullname, init, submodule_search_locations=[package]
+                )
+            if os.path.isfile(module := package + ".py"):  # noqa: PTH113
+                return spec_from_file_location(fullname, module)
+        return None
+
+
+def is_compiled() -> bool:
+    """
+    Check whether the dispatch layer is compiled with mypyc.
+
+    Returns
+    -------
+    bool
+        `True` if :func:`array_api.get_namespace` is a compiled function.
+
+    """
+    from array_api import _namespace
+
+    return not str(_namespace.__file__).endswith(".py")
+
+
+def use_pure_python() -> None:
+    """Import the remaining ``array_api`` submodules from Python sources."""
+    if not any(isinstance(f, _SourceFinder) for f in sys.meta_path):
+        sys.meta_path.insert(0, _SourceFinder())
+
+
+def select_implementation() -> None:
+    """Choose between the compiled and pure-Python modules."""
+    if os.environ.get("ARRAYAPI_PURE_PYTHON", "0") == "1":
+        use_pure_python()
+        return
+
+    try:
+        from array_api import _namespace  # noqa: F401
+    except ImportError:
+        # Discard partially imported compiled modules before falling back.
+        for name in tuple(sys.modules):
+            if name.startswith(PACKAGE + ".") and name != __name__:
+                del sys.modules[name]
+        use_pure_python()
@@ -2,24 +2,333 @@
 
 from __future__ import annotations
 
-__all__ = ["get_namespace"]
+__all__ = ["clear_namespace_cache", "get_namespace", "use_namespace"]
 
-from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+import sys
+from collections.abc import Callable
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+from array_api._conformance import clear_conformance_cache, conforms
+from array_api._types import BaseTrait
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from array_api._namespace_api import ArrayAPINamespace
 
 
-@runtime_checkable
-class BaseTrait(Protocol):
-    def __array_namespace__(
-        self, *, api_version: str | None = ...
-    ) -> ArrayAPINamespace: ...
+TraitsT = type | tuple[type, ...]
+_CacheTable = dict[type, "ArrayAPINamespace | None"]
+# ``(xs, array_traits, api_version) -> namespace``
+Resolver = Callable[
+    [tuple[Any, ...], TraitsT, "str | None"], "ArrayAPINamespace"
+]
+# ``(xs, array_traits, api_version, resolve) -> namespace``, where ``resolve``
+# is the next hook, or the namespace resolution itself.
+DispatchHook = Callable[
+    [tuple[Any, ...], TraitsT, "str | None", Resolver], "ArrayAPINamespace"
+]
+
+# Python scalars are never arrays, so dispatch skips them with a type check.
+_PYTHON_SCALARS: frozenset[type] = frozenset({bool, int, float, complex})
+
+# Maximum number of array types remembered per ``(array_traits, api_version)``.
+_NAMESPACE_CACHE_MAXSIZE: int = 128
+
+# Resolved namespaces, keyed on ``(array_traits, api_version)`` and then on the
+# array type. A value of `None` records that the type does not conform to the
+# traits, so non-arrays (e.g. Python scalars) are also rejected in O(1).
+_namespace_cache: dict[tuple[TraitsT, str | None], _CacheTable] = {}
+_namespace_cache_lock = Lock()
+
+
+def _cache_table(array_traits: TraitsT, api_version: str | None) -> _CacheTable:
+    """Return the type -> namespace table for the traits and API version."""
+    key = (array_traits, api_version)
+    table = _namespace_cache.get(key)
+    if table is None:
+        with _namespace_cache_lock:
+            table = _namespace_cache.setdefault(key, {})
+    return table
+
+
+def _resolve(
+    x: Any,  # noqa: ANN401
+    table: _CacheTable,
+    array_traits: TraitsT,
+    api_version: str | None,
+) -> ArrayAPINamespace | None:
+    """Return the namespace of ``x``, or `None` if it is not an array."""
+    cls = type(x)
+    try:
+        return table[cls]
+    except KeyError:
+        pass
+
+    traits = (
+        array_traits if isinstance(array_traits, tuple) else (array_traits,)
+    )
+    ns = (
+        x.__array_namespace__(api_version=api_version)
+        if all(conforms(x, trait) for trait in traits)
+        else None
+    )
+
+    with _namespace_cache_lock:
+        if len(table) >= _NAMESPACE_CACHE_MAXSIZE:  # evict the oldest entry
+            del table[next(iter(table))]
+        table[cls] = ns
+    return ns
+
+
+# The table for the default arguments, which almost every wrapper uses.
+_default_table = _cache_table(BaseTrait, None)
+
+# Hooks wrapping namespace resolution, outermost first, and their composition.
+# `_dispatch` is `None` when there are no hooks, so that the fast paths only
+# pay for a global lookup.
+_dispatch_hooks: list[DispatchHook] = []
+_dispatch: Resolver | None = None
+_dispatch_hooks_lock = Lock()
+
+
+def _chain(hook: DispatchHook, resolve: Resolver) -> Resolver:
+    """Compose ``hook`` around ``resolve``."""
+
+    def dispatch(
+        xs: tuple[Any, ...], array_traits: TraitsT, api_version: str | None
+    ) -> ArrayAPINamespace:
+        return hook(xs, array_traits, api_version, resolve)
+
+    return dispatch
+
+
+def _update_dispatch() -> None:
+    """Recompose the dispatch hooks. Must hold `_dispatch_hooks_lock`."""
+    global _dispatch  # noqa: PLW0603
+
+    resolve: Resolver | None = None
+    if _dispatch_hooks == [_pinned_namespace_hook]:
+        resolve = _pinned_dispatch  # the common case of `use_namespace` alone
+    elif _dispatch_hooks:
+        resolve = _get_namespace
+        for hook in reversed(_dispatch_hooks):
+            resolve = _chain(hook, resolve)
+    _dispatch = resolve
+
+
+def add_dispatch_hook(hook: DispatchHook, *, first: bool = True) -> None:
+    """
+    Wrap the namespace resolution of every wrapper with ``hook``.
+
+    Hooks are called as ``hook(xs, array_traits, api_version, resolve)``, where
+    ``xs`` are the inputs to :func:`get_namespace` and ``resolve`` takes the
+    first three arguments and returns the namespace. A hook may return any
+    object implementing the namespace, e.g. a proxy of the resolved one. A
+    proxy should have the namespace it wraps as its ``__wrapped__`` attribute,
+    so that its :func:`capabilities` are those of that namespace, rather than
+    of functions that may accept any arguments.
+
+    Parameters
+    ----------
+    hook : Callable
+        The hook to add.
+    first : bool, optional
+        Whether ``hook`` is called before the hooks already added, by default
+        `True`. If `False`, it is called after them, i.e. it wraps the
+        resolution itself.
+
+    """
+    with _dispatch_hooks_lock:
+        _dispatch_hooks.insert(0 if first else len(_dispatch_hooks), hook)
+        _update_dispatch()
+
+
+def remove_dispatch_hook(hook: DispatchHook) -> None:
+    """
+    Remove a hook added with :func:`add_dispatch_hook`.
+
+    Parameters
+    ----------
+    hook : Callable
+        The hook to remove.
+
+    Raises
+    ------
+    ValueError
+        If the hook was not added.
+
+    """
+    with _dispatch_hooks_lock:
+        _dispatch_hooks.remove(hook)
+        _update_dispatch()
+
+
+# The number of active `dispatch_hook_scope` per hook.
+_hook_scopes: dict[DispatchHook, int] = {}
+_hook_scopes_lock = Lock()
+
+
+@contextmanager
+def dispatch_hook_scope(
+    hook: DispatchHook, *, first: bool = True
+) -> Iterator[None]:
+    """
+    Add a dispatch hook for the duration of the scope.
+
+    Scopes of the same hook may be nested or overlap, e.g. across threads; the
+    hook is added once, while any of them is active. Hooks whose behaviour
+    depends on the scope should keep their state in a `contextvars.ContextVar`
+    and otherwise defer to ``resolve``.
+
+    Parameters
+    ----------
+    hook : Callable
+        The hook. See :func:`add_dispatch_hook`.
+    first : bool, optional
+        Where the hook is added. See :func:`add_dispatch_hook`.
+
+    Yields
+    ------
+    None
+
+    """
+    with _hook_scopes_lock:
+        count = _hook_scopes.get(hook, 0)
+        if count == 0:
+            add_dispatch_hook(hook, first=first)
+        _hook_scopes[hook] = count + 1
+    try:
+        yield
+    finally:
+        with _hook_scopes_lock:
+            count = _hook_scopes.pop(hook) - 1
+            if count:
+                _hook_scopes[hook] = count
+            else:
+                remove_dispatch_hook(hook)
+
+
+# The namespace set by `use_namespace` in the current context, and whether to
+# check it against the inputs.
+_pinned_namespace: ContextVar[tuple[ArrayAPINamespace, bool] | None] = (
+    ContextVar("array_api_pinned_namespace", default=None)
+)
+
+
+def _pinned_namespace_hook(
+    xs: tuple[Any, ...],
+    array_traits: TraitsT,
+    api_version: str | None,
+    resolve: Resolver,
+) -> ArrayAPINamespace:
+    """Dispatch hook returning the namespace set by `use_namespace`."""
+    pinned = _pinned_namespace.get()
+    if pinned is None:
+        return resolve(xs, array_traits, api_version)
+
+    xp, check = pinned
+    if check:
+        ns = resolve(xs, array_traits, api_version)
+        if ns is not xp and ns != xp:
+            msg = (
+                f"Namespace of the inputs {ns} is not the namespace {xp} in use"
+            )
+            raise ValueError(msg)
+    return xp
+
+
+def _pinned_dispatch(
+    xs: tuple[Any, ...], array_traits: TraitsT, api_version: str | None
+) -> ArrayAPINamespace:
+    """Compose `_pinned_namespace_hook` around the resolution, inlined."""
+    pinned = _pinned_namespace.get()
+    if pinned is not None and not pinned[1]:
+        return pinned[0]
+    return _pinned_namespace_hook(xs, array_traits, api_version, _get_namespace)
+
+
+@contextmanager
+def use_namespace(
+    xp: ArrayAPINamespace, /, *, check: bool = False
+) -> Iterator[ArrayAPINamespace]:
+    """
+    Dispatch every function to a namespace within a scope.
+
+    In the scope, the functions of `array_api` and `array_api.linalg` call the
+    functions of ``xp`` without inspecting their inputs, which removes the
+    dispatch overhead in loops where the inputs are known to be arrays of
+    ``xp``. The ``array_traits`` and ``api_version`` of :func:`get_namespace`
+    are ignored.
+
+    The scope is local to the current thread or `asyncio` task. Threads started
+    in the scope do not inherit it, while tasks created in it do.
+
+    Parameters
+    ----------
+    xp : ArrayAPINamespace
+        The namespace to use.
+    check : bool, optional
+        Whether to check that the inputs are arrays of ``xp``, by default
+        `False`. The check uses the cached namespaces of the input types.
+
+    Yields
+    ------
+    ArrayAPINamespace
+        ``xp``.
+
+    Raises
+    ------
+    ValueError
+        If ``check`` is `True` and the inputs of a function are not arrays of
+        ``xp``.
+
+    Examples
+    --------
+    >>> import array_api as ap
+    >>> with ap.use_namespace(xp):  # doctest: +SKIP
+    ...     for x in arrays:
+    ...         total = ap.add(total, ap.sum(x))
+
+    """
+    # Added last, so that other hooks, e.g. for lazy mode, still apply.
+    with dispatch_hook_scope(_pinned_namespace_hook, first=False):
+        token = _pinned_namespace.set((xp, check))
+        try:
+            yield xp
+        finally:
+            _pinned_namespace.reset(token)
+
+
+def clear_namespace_cache() -> None:
+    """
+    Clear the cache of resolved array API namespaces.
+
+    Namespaces are cached by the type of the array, so this must be called if
+    the namespace returned by ``__array_namespace__`` changes for a type that
+    has already been dispatched on, e.g. after monkeypatching a library. The
+    cached :func:`~array_api.capabilities` and
+    :func:`~array_api.validate_namespace` reports of namespaces are also
+    cleared.
+    """
+    with _namespace_cache_lock:
+        for table in _namespace_cache.values():
+            table.clear()
+    clear_conformance_cache()
+
+    # Only if imported, as they import the namespace protocols.
+    if (module := sys.modules.get("array_api._capabilities")) is not None:
+        module.clear_capabilities_cache()
+    if (module := sys.modules.get("array_api._validation")) is not None:
+        module.clear_validation_cache()
 
 
 def get_namespace(
     *xs: Any,  # noqa: ANN401
-    array_traits: type | tuple[type, ...] = BaseTrait,
+    array_traits: TraitsT = BaseTrait,
     api_version: str | None = None,
 ) -> ArrayAPINamespace:
     """
@@ -49,20 +358,36 @@ def get_namespace(
         If none of the inputs are array API conformant.  If the inputs are from
         multiple array API namespaces.
 
+    Notes
+    -----
+    Python scalars (`bool`, `int`, `float` and `complex`) are skipped without
+    checking them against ``array_traits``.
+
+    The namespace is cached by the type of each input, together with
+    ``array_traits`` and ``api_version``, so repeated calls with arrays of the
+    same class are resolved with dictionary lookups. The cache is bounded and
+    can be reset with :func:`clear_namespace_cache`.
+
     """
+    if _dispatch is not None:
+        return _dispatch(xs, array_traits, api_version)
+    return _get_namespace(xs, array_traits, api_version)
+
+
+def _get_namespace(
+    xs: tuple[Any, ...], array_traits: TraitsT, api_version: str | None
+) -> ArrayAPINamespace:
+    """Resolve the namespace of ``xs``, bypassing the dispatch hooks."""
+    table = _cache_table(array_traits, api_version)
+
     # `xs` contains one or more arrays.
-    namespaces: set[ArrayAPINamespace] = {
-        x.__array_namespace__(api_version=api_version)
-        for x in xs
-        if all(
-            isinstance(x, trait)
-            for trait in (
-                array_traits
-                if isinstance(array_traits, tuple)
-                else (array_traits,)
-            )
-        )
-    }
+    namespaces: set[ArrayAPINamespace] = set()
+    for x in xs:
+        if type(x) in _PYTHON_SCALARS:
+            continue
+        ns = _resolve(x, table, array_traits, api_version)
+        if ns is not None:
+            namespaces.add(ns)
 
     if not namespaces:
         msg = "Unrecognized array input"
@@ -72,3 +397,130 @@ def get_namespace(
         raise ValueError(msg)
 
     return namespaces.pop()
+
+
+def get_namespace1(
+    x: Any,  # noqa: ANN401
+    /,
+    *,
+    array_traits: TraitsT = BaseTrait,
+    api_version: str | None = None,
+) -> ArrayAPINamespace:
+    """
+    Get the array API namespace for a single array input.
+
+    This is a fast path of :func:`get_namespace` for one input.
+
+    Parameters
+    ----------
+    x : Any
+        Input array for which to get the array API namespace.
+    array_traits : type | tuple[type, ...], optional
+        The array traits to check for. See :func:`get_namespace`.
+    api_version : str | None, optional
+        The array API version, by default `None`.
+
+    Returns
+    -------
+    `~array_api._types.ArrayAPINamespace`
+        The array API namespace for the given array input.
+
+    Raises
+    ------
+    ValueError
+        If the input is not array API conformant.
+
+    """
+    if _dispatch is not None:
+        return _dispatch((x,), array_traits, api_version)
+
+    table = (
+        _default_table
+        if array_traits is BaseTrait and api_version is None
+        else _cache_table(array_traits, api_version)
+    )
+    try:
+        ns = table[type(x)]
+    except KeyError:
+        ns = _resolve(x, table, array_traits, api_version)
+
+    if ns is None:
+        msg = "Unrecognized array input"
+        raise ValueError(msg)
+    return ns
+
+
+def get_namespace2(
+    x1: Any,  # noqa: ANN401
+    x2: Any,  # noqa: ANN401
+    /,
+    *,
+    array_traits: TraitsT = BaseTrait,
+    api_version: str | None = None,
+) -> ArrayAPINamespace:
+    """
+    Get the array API namespace for two array inputs.
+
+    This is a fast path of :func:`get_namespace` for two inputs, e.g. the
+    operands of a binary elementwise function. Either input may be a Python
+    scalar, in which case the namespace is that of the other input. The scalar
+    is not converted to an array.
+
+    Parameters
+    ----------
+    x1, x2 : Any
+        Input arrays for which to get the array API namespace.
+    array_traits : type | tuple[type, ...], optional
+        The array traits to check for. See :func:`get_namespace`.
+    api_version : str | None, optional
+        The array API version, by default `None`.
+
+    Returns
+    -------
+    `~array_api._types.ArrayAPINamespace`
+        The array API namespace for the given array inputs.
+
+    Raises
+    ------
+    ValueError
+        If neither input is array API conformant.  If the inputs are from
+        different array API namespaces.
+
+    """
+    if _dispatch is not None:
+        return _dispatch((x1, x2), array_traits, api_version)
+
+    table = (
+        _default_table
+        if array_traits is BaseTrait and api_version is None
+        else _cache_table(array_traits, api_version)
+    )
+    cls = type(x1)
+    if cls in _PYTHON_SCALARS:
+        ns1 = None
+    else:
+        try:
+            ns1 = table[cls]
+        except KeyError:
+            ns1 = _resolve(x1, table, array_traits, api_version)
+
+    if type(x2) is cls:
+        ns2 = ns1
+    elif type(x2) in _PYTHON_SCALARS:
+        ns2 = None
+    else:
+        try:
+            ns2 = table[type(x2)]
+        except KeyError:
+            ns2 = _resolve(x2, table, array_traits, api_version)
+
+    if ns1 is None:
+        if ns2 is None:
+            msg = "Unrecognized array input"
+            raise ValueError(msg)
+        return ns2
+    if ns2 is not None and ns2 is not ns1 and ns2 != ns1:
+        namespaces = {ns1, ns2}
+        msg = f"Multiple namespaces for array inputs: {namespaces}"
+        raise ValueError(msg)
+    return ns1
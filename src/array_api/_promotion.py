@@ -0,0 +1,229 @@
+"""Promotion of arrays between namespaces with DLPack."""
+
+from __future__ import annotations
+
+__all__ = ["promote_namespaces"]
+
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from array_api._conformance import protocol_methods
+from array_api._namespace import _PYTHON_SCALARS, dispatch_hook_scope
+from array_api._namespace_api import ArrayAPINamespace
+from array_api.linalg import ArrayAPILinAlgNamespace
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from enum import Enum
+
+    from array_api._array import Array
+    from array_api._device import Device
+    from array_api._namespace import Resolver, TraitsT
+
+
+class _Policy(NamedTuple):
+    """The promotion set by `promote_namespaces`."""
+
+    target: ArrayAPINamespace | None
+
+
+_promotion: ContextVar[_Policy | None] = ContextVar(
+    "array_api_promotion", default=None
+)
+
+
+def _report(
+    source: ArrayAPINamespace,
+    target: ArrayAPINamespace,
+    *,
+    copied: bool,
+    seconds: float,
+) -> None:
+    """Report a conversion to the active `DispatchRecorder`, if any."""
+    # Only if imported, as otherwise no recorder can be active.
+    if (module := sys.modules.get("array_api._instrumentation")) is not None:
+        module.record_conversion(source, target, copied=copied, seconds=seconds)
+
+
+def _move(
+    x: Array,
+    source: ArrayAPINamespace,
+    target: ArrayAPINamespace,
+    device: tuple[tuple[Enum, int], Device] | None,
+) -> Array:
+    """
+    Move ``x`` to the namespace ``target`` with DLPack.
+
+    ``device`` is the DLPack device and the device of the arrays of ``target``.
+    The data is copied only if ``x`` is on another device; otherwise the array
+    shares its memory with ``x``.
+    """
+    start = perf_counter()
+    if device is None or x.__dlpack_device__() == device[0]:
+        copied = False
+        moved = target.from_dlpack(x)
+    else:
+        copied = True
+        moved = target.from_dlpack(  # type: ignore[call-arg]
+            x, device=device[1], copy=True
+        )
+    _report(source, target, copied=copied, seconds=perf_counter() - start)
+    return moved
+
+
+def _promoting(
+    func: Callable[..., Any], moved: dict[int, Array]
+) -> Callable[..., Any]:
+    """Wrap ``func`` to replace the arguments that were moved."""
+
+    def replace(arg: Any) -> Any:  # noqa: ANN401
+        if isinstance(arg, list | tuple):
+            return type(arg)(moved.get(id(a), a) for a in arg)
+        return moved.get(id(arg), arg)
+
+    def call(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        return func(*map(replace, args), **kwargs)
+
+    call.__wrapped__ = func  # type: ignore[attr-defined]
+    return call
+
+
+class _PromotingNamespace:
+    """Proxy of a namespace passing it the arguments moved to it."""
+
+    __slots__ = ("_moved", "_namespace", "_protocol")
+
+    def __init__(
+        self,
+        namespace: Any,  # noqa: ANN401
+        moved: dict[int, Array],
+        protocol: type = ArrayAPINamespace,
+    ) -> None:
+        self._namespace = namespace
+        # The moved arrays, by the `id` of the arrays they replace. The
+        # replaced arrays are arguments of the call, so the ids are not reused.
+        self._moved = moved
+        self._protocol = protocol
+
+    def __repr__(self) -> str:
+        return f"<promoting to {self._namespace!r}>"
+
+    @property
+    def __wrapped__(self) -> Any:  # noqa: ANN401
+        """The namespace proxied."""
+        return self._namespace
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        attr = getattr(self._namespace, name)
+        if self._protocol is ArrayAPINamespace and name == "linalg":
+            return _PromotingNamespace(
+                attr, self._moved, ArrayAPILinAlgNamespace
+            )
+        if name in protocol_methods(self._protocol):
+            return _promoting(attr, self._moved)
+        return attr
+
+
+def _promotion_hook(
+    xs: tuple[Any, ...],
+    array_traits: TraitsT,
+    api_version: str | None,
+    resolve: Resolver,
+) -> ArrayAPINamespace:
+    """Dispatch hook moving inputs in `promote_namespaces` scopes."""
+    policy = _promotion.get()
+    if policy is None:
+        return resolve(xs, array_traits, api_version)
+
+    # Inputs from one namespace, the common case, are resolved as usual.
+    target = policy.target
+    try:
+        ns = resolve(xs, array_traits, api_version)
+    except ValueError:
+        pass
+    else:
+        if target is None or ns is target or ns == target:
+            return ns
+
+    # Otherwise the inputs are resolved one by one, skipping non-arrays.
+    arrays: list[tuple[Any, ArrayAPINamespace]] = []
+    for x in xs:
+        if type(x) in _PYTHON_SCALARS:
+            continue
+        try:
+            arrays.append((x, resolve((x,), array_traits, api_version)))
+        except ValueError:
+            continue
+    if not arrays:
+        return resolve(xs, array_traits, api_version)  # raises
+    if target is None:
+        target = arrays[0][1]
+
+    device = next(
+        (
+            (x.__dlpack_device__(), x.device)
+            for x, ns in arrays
+            if ns is target or ns == target
+        ),
+        None,
+    )
+    moved = {
+        id(x): _move(x, ns, target, device)
+        for x, ns in arrays
+        if not (ns is target or ns == target)
+    }
+    return _PromotingNamespace(target, moved)  # type: ignore[return-value]
+
+
+@contextmanager
+def promote_namespaces(
+    target: ArrayAPINamespace | None = None, /
+) -> Iterator[None]:
+    """
+    Move inputs from other namespaces with DLPack within a scope.
+
+    By default, :func:`get_namespace` raises a `ValueError` if the inputs of a
+    function are arrays of different namespaces, e.g. of NumPy and PyTorch.
+    In the scope, the functions of `array_api` and `array_api.linalg` instead
+    move such inputs to one namespace, with its ``from_dlpack`` and the
+    ``__dlpack__`` and ``__dlpack_device__`` of the arrays. Moved arrays share
+    their memory with the inputs, unless the inputs are on a device other than
+    that of the arrays of the target namespace, in which case they are copied.
+    The conversions are reported to any active `DispatchRecorder`.
+
+    Inputs from one namespace are dispatched as usual, so the scope only adds
+    overhead to calls mixing namespaces. The scope is local to the current
+    thread or `asyncio` task.
+
+    Parameters
+    ----------
+    target : ArrayAPINamespace | None, optional
+        The namespace to move inputs to. By default, the namespace of the first
+        array input, e.g. ``x1`` of `array_api.add`.
+
+    Yields
+    ------
+    None
+
+    Raises
+    ------
+    BufferError
+        If an input cannot be moved, e.g. between devices that the target
+        namespace does not support.
+
+    Examples
+    --------
+    >>> import array_api as ap
+    >>> with ap.promote_namespaces():  # doctest: +SKIP
+    ...     y = ap.add(torch_array, numpy_array)  # a PyTorch tensor
+
+    """
+    with dispatch_hook_scope(_promotion_hook, first=False):
+        token = _promotion.set(_Policy(target))
+        try:
+            yield
+        finally:
+            _promotion.reset(token)
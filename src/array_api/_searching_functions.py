@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Literal, Protocol
 
-from array_api._namespace import get_namespace
+from array_api._namespace import get_namespace, get_namespace1, get_namespace2
 
 if TYPE_CHECKING:
     from array_api._array import Array
+    from array_api._types import PyScalar
 
-__all__ = ["argmax", "argmin", "nonzero"]
+__all__ = ["argmax", "argmin", "nonzero", "searchsorted", "where"]
+
+# The wrappers written by hand, with fallbacks, rather than generated to call
+# the function of the namespace. See ``tools/generate_wrappers.py``.
+_HANDWRITTEN: tuple[str, ...] = ("searchsorted",)
 
 
 def argmax(
@@ -45,7 +50,7 @@ def argmax(
         type.
 
     """
-    return get_namespace(x).argmax(x, axis=axis, keepdims=keepdims)
+    return get_namespace1(x).argmax(x, axis=axis, keepdims=keepdims)
 
 
 def argmin(
@@ -81,7 +86,7 @@ def argmin(
         type.
 
     """
-    return get_namespace(x).argmin(x, axis=axis, keepdims=keepdims)
+    return get_namespace1(x).argmin(x, axis=axis, keepdims=keepdims)
 
 
 def nonzero(x: Array, /) -> tuple[Array, ...]:
@@ -114,10 +119,74 @@ def nonzero(x: Array, /) -> tuple[Array, ...]:
         returned array must have the default array index data type.
 
     """
-    return get_namespace(x).nonzero(x)
+    return get_namespace1(x).nonzero(x)
 
 
-def where(condition: Array, x1: Array, x2: Array, /) -> Array:
+def searchsorted(
+    x1: Array,
+    x2: Array,
+    /,
+    *,
+    side: Literal["left", "right"] = "left",
+    sorter: Array | None = None,
+) -> Array:
+    """
+    Finds the indices into ``x1`` such that, if the corresponding elements in
+    ``x2`` were inserted before the indices, the order of ``x1``, when sorted
+    in ascending order, would be preserved.
+
+    The namespace's own ``searchsorted`` is used for a one-dimensional ``x1``
+    if it has one. Otherwise, and for batches, all of the queries are found
+    at once by a binary search of ``log2(N)`` steps, each a gather, a
+    comparison and an addition, or, for namespaces without ``take``, by
+    comparing them with every element of ``x1``.
+
+    Parameters
+    ----------
+    x1: array
+        input array. Should have a real-valued data type. If ``sorter`` is
+        ``None``, must be sorted in ascending order along its last axis, with
+        ``NaN`` values last. If ``x1`` has more than one dimension, each of
+        its rows along the last axis, of size ``N``, is searched for the
+        queries in the same row of ``x2``.
+    x2: array
+        array containing search values. Should have a real-valued data type.
+        If ``x1`` has more than one dimension, ``x2`` must have the same
+        leading dimensions, i.e. all but the last.
+    side: Literal['left', 'right']
+        argument controlling which index is returned if a value lands exactly
+        on an edge. If ``'left'``, for each ``x2_i``, the returned index ``i``
+        satisfies ``x1[i-1] < x2_i <= x1[i]``. If ``'right'``, it satisfies
+        ``x1[i-1] <= x2_i < x1[i]``. Default: ``'left'``.
+    sorter: Optional[array]
+        array of indices that sort ``x1`` in ascending order along its last
+        axis, typically the result of :func:`argsort`. Must have the same
+        shape as ``x1``. Default: ``None``.
+
+    Returns
+    -------
+    out: array
+        an array of indices with the same shape as ``x2``. The returned array
+        must have the default array index data type.
+
+    Raises
+    ------
+    ValueError
+        If ``side`` is neither ``'left'`` nor ``'right'``, if ``x1`` is
+        zero-dimensional, or if the leading dimensions of ``x1`` and ``x2``
+        differ.
+
+    """
+    from array_api._selection import searchsorted
+
+    return searchsorted(
+        get_namespace2(x1, x2), x1, x2, side=side, sorter=sorter
+    )
+
+
+def where(
+    condition: Array, x1: Array | PyScalar, x2: Array | PyScalar, /
+) -> Array:
     """
     Returns elements chosen from ``x1`` or ``x2`` depending on
     ``condition``.
@@ -164,4 +233,6 @@ class HasSearchingFunctions(Protocol):
     def nonzero(x: Array, /) -> tuple[Array, ...]: ...
 
     @staticmethod
-    def where(condition: Array, x1: Array, x2: Array, /) -> Array: ...
+    def where(
+        condition: Array, x1: Array | PyScalar, x2: Array | PyScalar, /
+    ) -> Array: ...
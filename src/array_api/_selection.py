@@ -0,0 +1,414 @@
+"""Partial sorts and searches of sorted arrays, with fallbacks."""
+
+from __future__ import annotations
+
+__all__: list[str] = []
+
+from math import isqrt, prod
+from typing import TYPE_CHECKING
+
+from array_api._capabilities import capabilities
+from array_api._instrumentation import recorded
+from array_api._lazy import materialize
+from array_api._sorting_functions import _argsort, _sort
+
+if TYPE_CHECKING:
+    from types import EllipsisType
+
+    from array_api._array import Array
+    from array_api._capabilities import Capabilities
+    from array_api._namespace_api import ArrayAPINamespace
+
+# Size of an axis below which the fallback sorts rather than selects.
+_SELECT_MIN_SIZE: int = 1 << 10
+
+
+def _axis_size(x: Array, axis: int) -> tuple[int, int]:
+    """Return the non-negative ``axis`` of ``x`` and its size."""
+    if not -x.ndim <= axis < x.ndim:
+        msg = (
+            f"axis {axis} is out of bounds for an array of {x.ndim} dimensions"
+        )
+        raise ValueError(msg)
+    axis %= x.ndim
+    n = x.shape[axis]
+    if n is None:
+        msg = "the size of the axis must be known"
+        raise ValueError(msg)
+    return axis, n
+
+
+def _rank(kth: int, n: int) -> int:
+    """Return the non-negative rank ``kth`` of an axis of size ``n``."""
+    if not -n <= kth < n:
+        msg = f"kth {kth} is out of bounds for an axis of size {n}"
+        raise ValueError(msg)
+    return kth % n
+
+
+def _to_last(xp: ArrayAPINamespace, x: Array, axis: int) -> Array:
+    """Move the ``axis`` of ``x`` to the end."""
+    if axis == x.ndim - 1:
+        return x
+    axes = (*(a for a in range(x.ndim) if a != axis), axis)
+    return xp.permute_dims(x, axes)
+
+
+def _from_last(xp: ArrayAPINamespace, x: Array, axis: int) -> Array:
+    """Move the last axis of ``x`` to ``axis``, inverting `_to_last`."""
+    if axis == x.ndim - 1:
+        return x
+    axes = (*range(axis), x.ndim - 1, *range(axis, x.ndim - 1))
+    return xp.permute_dims(x, axes)
+
+
+def _can_gather(caps: Capabilities) -> bool:
+    return caps.supports("take_along_axis", "axis") or caps.supports("take")
+
+
+def _take_along_axis(
+    xp: ArrayAPINamespace,
+    caps: Capabilities,
+    x: Array,
+    indices: Array,
+    axis: int,
+) -> Array:
+    """Gather ``x`` at ``indices`` along ``axis``, of the same other sizes."""
+    if caps.supports("take_along_axis", "axis"):
+        return xp.take_along_axis(x, indices, axis=axis)  # type: ignore[attr-defined, no-any-return]
+
+    # `take` of the flattened array, with the offsets of the rows.
+    x = _to_last(xp, x, axis)
+    indices = _to_last(xp, indices, axis)
+    shape: tuple[int, ...] = indices.shape  # type: ignore[assignment]
+    n: int = x.shape[-1]  # type: ignore[assignment]
+    rows = xp.reshape(indices, (-1, shape[-1]))
+    starts = xp.arange(0, rows.shape[0] * n, n, dtype=rows.dtype)  # type: ignore[operator]
+    flat = xp.reshape(rows + xp.reshape(starts, (-1, 1)), (-1,))
+    out = xp.take(xp.reshape(x, (-1,)), flat)  # type: ignore[attr-defined]
+    return _from_last(xp, xp.reshape(out, shape), axis)
+
+
+def _select(
+    xp: ArrayAPINamespace, caps: Capabilities, x: Array, kth: int
+) -> Array:
+    """
+    Return the indices that partition the rows of ``x`` at ``kth``.
+
+    The element of rank ``kth`` of each row is the one of that rank among the
+    candidates between two elements of a sorted sample of the row, of about
+    ``4 n**0.75`` elements, and the row is partitioned by comparison with it.
+    The candidates and the partition are gathered with stable sorts of small
+    integer keys, which NumPy does in linear time with a radix sort. If the
+    candidates of a row miss the rank, e.g. as its sample is not
+    representative or it has NaNs, the rows are sorted instead.
+    """
+    n: int = x.shape[1]  # type: ignore[assignment]
+    int64, uint8 = xp.int64, xp.uint8  # type: ignore[attr-defined]
+    sample = xp.sort(x[:, :: isqrt(n)], axis=1)
+    s: int = sample.shape[1]  # type: ignore[assignment]
+    rank = kth * s // n
+    margin = 2 * isqrt(s) + 1  # about 4 standard deviations of the rank
+    lower, upper = rank - margin, rank + margin
+    lo = (
+        xp.min(x, axis=1, keepdims=True)
+        if lower < 0
+        else sample[:, lower : lower + 1]
+    )
+    hi = (
+        xp.max(x, axis=1, keepdims=True)
+        if upper >= s
+        else sample[:, upper : upper + 1]
+    )
+
+    is_candidate = (x >= lo) & (x <= hi)
+    below = xp.sum(xp.astype(x < lo, int64), axis=1)
+    count = xp.sum(xp.astype(is_candidate, int64), axis=1)
+    if not bool(xp.all((below <= kth) & (below + count > kth))):
+        return xp.argsort(x, axis=1, stable=False)
+
+    # The candidates of each row come first, padded with `hi`, which is not
+    # less than any of them.
+    key = xp.astype(~is_candidate, uint8)
+    order = xp.argsort(key, axis=1, stable=True)
+    m = int(xp.max(count))
+    candidates = _take_along_axis(xp, caps, x, order[:, :m], 1)
+    candidates = xp.where(
+        xp.arange(m) < xp.reshape(count, (-1, 1)), candidates, hi
+    )
+    value = _take_along_axis(
+        xp,
+        caps,
+        xp.sort(candidates, axis=1),
+        xp.reshape(-below + kth, (-1, 1)),
+        1,
+    )
+
+    # 0 for the elements less than the value, 1 for those equal and 2 for the
+    # greater ones and NaNs.
+    key = xp.astype(~(x < value), uint8) + xp.astype(~(x <= value), uint8)
+    return xp.argsort(key, axis=1, stable=True)
+
+
+def _argpartition(
+    xp: ArrayAPINamespace,
+    x: Array,
+    kth: int,
+    axis: int,
+    *,
+    descending: bool,
+) -> Array:
+    """Implement `array_api.argpartition` in the namespace ``xp``."""
+    caps = capabilities(xp)
+    axis, n = _axis_size(x, axis)
+    kth = _rank(kth, n)
+    if descending:
+        # The descending partition at `kth` is the reversed ascending one.
+        indices = _argpartition(xp, x, n - 1 - kth, axis, descending=False)
+        return xp.flip(indices, axis=axis)
+
+    if caps.supports("argpartition", "axis"):
+        return xp.argpartition(x, kth, axis=axis)  # type: ignore[attr-defined, no-any-return]
+    if n < _SELECT_MIN_SIZE or not _can_gather(caps):
+        return xp.argsort(x, axis=axis, stable=False)
+
+    y = _to_last(xp, x, axis)
+    indices = _select(xp, caps, xp.reshape(y, (-1, n)), kth)
+    indices = xp.reshape(indices, y.shape)  # type: ignore[arg-type]
+    return _from_last(xp, indices, axis)
+
+
+def _partition(
+    xp: ArrayAPINamespace,
+    x: Array,
+    kth: int,
+    axis: int,
+    *,
+    descending: bool,
+) -> Array:
+    """Implement `array_api.partition` in the namespace ``xp``."""
+    caps = capabilities(xp)
+    axis, n = _axis_size(x, axis)
+    kth = _rank(kth, n)
+    if caps.supports("partition", "axis"):
+        if descending:
+            out = xp.partition(x, n - 1 - kth, axis=axis)  # type: ignore[attr-defined]
+            return xp.flip(out, axis=axis)
+        return xp.partition(x, kth, axis=axis)  # type: ignore[attr-defined, no-any-return]
+    if not _can_gather(caps):
+        return _sort(xp, caps, x, axis, descending=descending, stable=False)
+
+    indices = _argpartition(xp, x, kth, axis, descending=descending)
+    return _take_along_axis(xp, caps, x, indices, axis)
+
+
+def _topk(
+    xp: ArrayAPINamespace,
+    x: Array,
+    k: int,
+    axis: int,
+    *,
+    descending: bool,
+) -> tuple[Array, Array]:
+    """Implement `array_api.topk` in the namespace ``xp``."""
+    caps = capabilities(xp)
+    axis, n = _axis_size(x, axis)
+    if not 0 <= k <= n:
+        msg = f"k {k} is out of bounds for an axis of size {n}"
+        raise ValueError(msg)
+
+    # Only a `topk` known to have these keywords is that of `array_api`, e.g.
+    # not `torch.topk`, whose signature cannot be determined.
+    native = caps.keywords.get("topk")
+    if native is not None and native.issuperset(("axis", "descending")):
+        values, indices = xp.topk(x, k, axis=axis, descending=descending)  # type: ignore[attr-defined]
+        return values, indices
+
+    # The first k along `axis`.
+    first: tuple[slice | EllipsisType, ...] = (
+        *(slice(None),) * axis,
+        slice(k),
+        ...,
+    )
+    if not _can_gather(caps):
+        indices = _argsort(
+            xp, caps, x, axis, descending=descending, stable=True
+        )
+        values = _sort(xp, caps, x, axis, descending=descending, stable=True)
+        return values[first], indices[first]
+    if k == 0:
+        values = x[first]
+        return values, xp.argsort(values, axis=axis)
+
+    partitioned = _argpartition(xp, x, k - 1, axis, descending=descending)
+    indices = partitioned[first]
+    values = _take_along_axis(xp, caps, x, indices, axis)
+    order = _argsort(xp, caps, values, axis, descending=descending, stable=True)
+    return (
+        _take_along_axis(xp, caps, values, order, axis),
+        _take_along_axis(xp, caps, indices, order, axis),
+    )
+
+
+def argpartition(
+    xp: ArrayAPINamespace,
+    x: Array,
+    kth: int,
+    axis: int,
+    *,
+    descending: bool,
+) -> Array:
+    """Call `_argpartition`, recording it and evaluating a deferred ``x``."""
+    func = recorded("argpartition", _argpartition, xp)
+    return func(xp, materialize(x), kth, axis, descending=descending)
+
+
+def partition(
+    xp: ArrayAPINamespace,
+    x: Array,
+    kth: int,
+    axis: int,
+    *,
+    descending: bool,
+) -> Array:
+    """Call `_partition`, recording it and evaluating a deferred ``x``."""
+    func = recorded("partition", _partition, xp)
+    return func(xp, materialize(x), kth, axis, descending=descending)
+
+
+def topk(
+    xp: ArrayAPINamespace,
+    x: Array,
+    k: int,
+    axis: int,
+    *,
+    descending: bool,
+) -> tuple[Array, Array]:
+    """Call `_topk`, recording it and evaluating a deferred ``x``."""
+    func = recorded("topk", _topk, xp)
+    return func(xp, materialize(x), k, axis, descending=descending)
+
+
+def _before(x: Array, q: Array, side: str, *, nan: bool) -> Array:
+    """Whether the sorted elements ``x`` come before the queries ``q``."""
+    before = x < q if side == "left" else x <= q
+    if not nan:
+        return before
+    # NaNs are sorted last, and so after every other element.
+    q_nan = q != q  # noqa: PLR0124
+    if side == "left":
+        return before | (q_nan & (x == x))  # noqa: PLR0124
+    return before | q_nan
+
+
+def _search(
+    xp: ArrayAPINamespace,
+    caps: Capabilities,
+    x: Array,
+    q: Array,
+    side: str,
+) -> Array:
+    """
+    Return the insertion indices of the rows of ``q`` in the rows of ``x``.
+
+    All of the queries are found by a branchless binary search, whose
+    ``log2(n)`` steps are each a gather from the flattened rows, a comparison
+    and an addition, of all of them. Without a gather, the queries are
+    compared with all of the elements of their rows at once instead.
+    """
+    n: int = x.shape[1]  # type: ignore[assignment]
+    int64 = xp.int64  # type: ignore[attr-defined]
+    nan = bool(xp.any(q != q))  # noqa: PLR0124
+    if n == 0 or not _can_gather(caps):
+        before = _before(
+            xp.expand_dims(x, axis=1),
+            xp.expand_dims(q, axis=2),
+            side,
+            nan=nan,
+        )
+        return xp.sum(xp.astype(before, int64), axis=2)
+
+    # The rows are searched as one, at the offsets of the flattened rows.
+    r, m = q.shape
+    flat, q = xp.reshape(x, (-1,)), xp.reshape(q, (-1,))
+    offsets = xp.arange(0, r * n, n, dtype=int64)  # type: ignore[operator]
+    offsets = xp.reshape(
+        xp.broadcast_to(xp.reshape(offsets, (r, 1)), (r, m)), (-1,)  # type: ignore[arg-type]
+    )
+
+    def gather(indices: Array) -> Array:
+        if caps.supports("take"):
+            return xp.take(flat, indices)  # type: ignore[attr-defined, no-any-return]
+        return _take_along_axis(xp, caps, flat, indices, 0)
+
+    # The insertion index is in `[base, base + length]`.
+    base, length = offsets, n
+    while length > 1:
+        half = length // 2
+        before = _before(gather(base + half), q, side, nan=nan)
+        base = base + xp.astype(before, int64) * half
+        length -= half
+    before = _before(gather(base), q, side, nan=nan)
+    index = base - offsets + xp.astype(before, int64)
+    return xp.reshape(index, (r, m))  # type: ignore[arg-type]
+
+
+def _searchsorted(
+    xp: ArrayAPINamespace,
+    x1: Array,
+    x2: Array,
+    *,
+    side: str,
+    sorter: Array | None,
+) -> Array:
+    """Implement `array_api.searchsorted` in the namespace ``xp``."""
+    if side not in {"left", "right"}:
+        msg = f"side must be 'left' or 'right', not {side!r}"
+        raise ValueError(msg)
+    if x1.ndim == 0:
+        msg = "x1 must have at least one dimension"
+        raise ValueError(msg)
+    batch = x1.shape[:-1]
+    if x1.ndim > 1 and x2.shape[:-1] != batch:
+        msg = (
+            f"the leading dimensions of x2 {x2.shape} must be those of x1 "
+            f"{x1.shape}"
+        )
+        raise ValueError(msg)
+
+    caps = capabilities(xp)
+    if x1.ndim == 1 and caps.supports("searchsorted", "side"):
+        if sorter is None:
+            return xp.searchsorted(x1, x2, side=side)  # type: ignore[attr-defined, no-any-return]
+        return xp.searchsorted(x1, x2, side=side, sorter=sorter)  # type: ignore[attr-defined, no-any-return]
+
+    if sorter is not None:
+        x1 = _take_along_axis(xp, caps, x1, sorter, x1.ndim - 1)
+    n: int = x1.shape[-1]  # type: ignore[assignment]
+    shape: tuple[int, ...] = x2.shape  # type: ignore[assignment]
+    if x1.ndim == 1:  # the queries of all shapes are a single row
+        rows, queries = xp.reshape(x1, (1, n)), xp.reshape(x2, (1, prod(shape)))
+    else:
+        r = prod(shape[:-1])
+        rows = xp.reshape(x1, (r, n))
+        queries = xp.reshape(x2, (r, shape[-1]))
+    return xp.reshape(_search(xp, caps, rows, queries, side), shape)
+
+
+def searchsorted(
+    xp: ArrayAPINamespace,
+    x1: Array,
+    x2: Array,
+    *,
+    side: str,
+    sorter: Array | None,
+) -> Array:
+    """Call `_searchsorted`, recording it and evaluating deferred arrays."""
+    func = recorded("searchsorted", _searchsorted, xp)
+    return func(
+        xp,
+        materialize(x1),
+        materialize(x2),
+        side=side,
+        sorter=materialize(sorter),
+    )
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Protocol
 
-from array_api._namespace import get_namespace
+from array_api._namespace import get_namespace1
 
 if TYPE_CHECKING:
     from array_api._array import Array
@@ -83,7 +83,7 @@ def unique_all(x: Array, /) -> tuple[Array, Array, Array, Array]:
             implementations.
 
     """
-    return get_namespace(x).unique_all(x)
+    return get_namespace1(x).unique_all(x)
 
 
 def unique_counts(x: Array, /) -> tuple[Array, Array]:
@@ -142,7 +142,7 @@ def unique_counts(x: Array, /) -> tuple[Array, Array]:
             implementations.
 
     """
-    return get_namespace(x).unique_counts(x)
+    return get_namespace1(x).unique_counts(x)
 
 
 def unique_inverse(x: Array, /) -> tuple[Array, Array]:
@@ -202,7 +202,7 @@ def unique_inverse(x: Array, /) -> tuple[Array, Array]:
             implementations.
 
     """
-    return get_namespace(x).unique_inverse(x)
+    return get_namespace1(x).unique_inverse(x)
 
 
 def unique_values(x: Array, /) -> Array:
@@ -250,7 +250,7 @@ def unique_values(x: Array, /) -> Array:
             implementations.
 
     """
-    return get_namespace(x).unique_values(x)
+    return get_namespace1(x).unique_values(x)
 
 
 ####################################################################################################
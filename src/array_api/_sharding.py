@@ -0,0 +1,370 @@
+"""Elementwise functions sharded over processes through shared memory."""
+
+from __future__ import annotations
+
+__all__ = ["map_shards", "sharded_elementwise"]
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+from importlib import import_module
+from itertools import pairwise
+from math import prod
+from multiprocessing.shared_memory import SharedMemory
+from threading import Lock
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import array_api
+from array_api._conformance import protocol_methods
+from array_api._elementwise_functions import HasElementwiseFunctions
+from array_api._namespace import (
+    _PYTHON_SCALARS,
+    dispatch_hook_scope,
+    get_namespace,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from array_api._array import Array
+    from array_api._namespace import Resolver, TraitsT
+    from array_api._namespace_api import ArrayAPINamespace
+
+# Number of elements below which elementwise functions are not sharded, by
+# default. Sharding copies the inputs to and the output from shared memory,
+# and takes about a millisecond of inter-process communication per call.
+_MIN_SIZE: int = 1 << 22
+
+
+class _Buffer(NamedTuple):
+    """An array in shared memory, as sent to the workers."""
+
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+
+class _Shard(NamedTuple):
+    """A slice of the leading axis, computed by a worker."""
+
+    namespace: str
+    func: Callable[..., Any]
+    args: tuple[_Buffer | bool | int | float | complex, ...]
+    out: _Buffer
+    start: int
+    stop: int
+
+
+# The process pools, per number of workers, kept for the life of the process.
+_executors: dict[int, ProcessPoolExecutor] = {}
+_executors_lock = Lock()
+
+
+def _executor(max_workers: int) -> ProcessPoolExecutor:
+    executor = _executors.get(max_workers)
+    if executor is None:
+        with _executors_lock:
+            executor = _executors.get(max_workers)
+            if executor is None:
+                executor = _executors[max_workers] = ProcessPoolExecutor(
+                    max_workers
+                )
+    return executor
+
+
+def _close(shm: SharedMemory) -> None:
+    # Views of the memory may be alive, e.g. in a traceback, in which case the
+    # memory is unmapped when they are collected.
+    with suppress(BufferError):
+        shm.close()
+
+
+def _to_numpy(x: Any) -> Any:  # noqa: ANN401
+    """Return a NumPy view of the array ``x`` on the CPU."""
+    import numpy as np
+
+    try:
+        return np.from_dlpack(x)
+    except (AttributeError, TypeError, BufferError):
+        return np.asarray(x)
+
+
+def _compute(shard: _Shard, shms: dict[str, SharedMemory]) -> None:
+    import numpy as np
+
+    def view(buffer: _Buffer) -> Any:  # noqa: ANN401
+        shm = shms[buffer.name]
+        return np.ndarray(buffer.shape, buffer.dtype, buffer=shm.buf)
+
+    def shard_of(buffer: _Buffer) -> Any:  # noqa: ANN401
+        # Arrays broadcast along the leading axis are passed whole.
+        x = view(buffer)
+        if x.ndim == len(shard.out.shape) and x.shape[0] != 1:
+            x = x[shard.start : shard.stop]
+        return xp.asarray(x)
+
+    xp = import_module(shard.namespace)
+    args = [
+        shard_of(arg) if isinstance(arg, _Buffer) else arg for arg in shard.args
+    ]
+    out = view(shard.out)
+    out[shard.start : shard.stop] = _to_numpy(shard.func(*args))
+
+
+def _run_shard(shard: _Shard) -> None:
+    """Compute a shard in a worker."""
+    buffers = [arg for arg in shard.args if isinstance(arg, _Buffer)]
+    # The workers share the resource tracker of the parent, which unlinks.
+    shms = {b.name: SharedMemory(b.name) for b in (*buffers, shard.out)}
+    try:
+        _compute(shard, shms)
+    finally:
+        for shm in shms.values():
+            _close(shm)
+
+
+def _share(x: Any, shms: list[SharedMemory]) -> _Buffer:  # noqa: ANN401
+    """Copy ``x`` to new shared memory."""
+    import numpy as np
+
+    host = _to_numpy(x)
+    shm = SharedMemory(create=True, size=max(host.nbytes, 1))
+    shms.append(shm)
+    np.ndarray(host.shape, host.dtype, buffer=shm.buf)[...] = host
+    return _Buffer(shm.name, host.shape, host.dtype.str)
+
+
+def _map_shards(
+    xp: ArrayAPINamespace,
+    func: Callable[..., Any],
+    args: tuple[Any, ...],
+    max_workers: int,
+    shms: list[SharedMemory],
+) -> Array:
+    import numpy as np
+
+    namespace = getattr(xp, "__name__", None)
+    if namespace is None:
+        msg = f"namespace {xp!r} cannot be imported by the workers"
+        raise ValueError(msg)
+
+    is_array = [type(arg) not in _PYTHON_SCALARS for arg in args]
+    arrays = [a for a, b in zip(args, is_array, strict=True) if b]
+    shape: tuple[int, ...] = tuple(
+        xp.broadcast_arrays(*arrays)[0].shape  # type: ignore[arg-type]
+    )
+    n = min(max_workers, shape[0]) if shape else 0
+    if n < 2:  # noqa: PLR2004
+        return func(*args)  # type: ignore[no-any-return]
+
+    # The output dtype is that of the function of an element.
+    probe = func(
+        *(
+            a[(slice(0, 1),) * a.ndim] if b else a
+            for a, b in zip(args, is_array, strict=True)
+        )
+    )
+    dtype = _to_numpy(probe).dtype
+
+    # Arrays are shared as they are, and broadcast by ``func`` in the workers.
+    shared = iter([_share(x, shms) for x in arrays])
+    buffers = tuple(
+        next(shared) if b else a for a, b in zip(args, is_array, strict=True)
+    )
+    out = SharedMemory(create=True, size=max(prod(shape) * dtype.itemsize, 1))
+    shms.append(out)
+    out_buffer = _Buffer(out.name, shape, dtype.str)
+
+    bounds = [i * shape[0] // n for i in range(n + 1)]
+    shards = [
+        _Shard(namespace, func, buffers, out_buffer, start, stop)
+        for start, stop in pairwise(bounds)
+    ]
+    # Consume the results, to raise the first error of a shard.
+    list(_executor(max_workers).map(_run_shard, shards))
+
+    result = np.ndarray(shape, out_buffer.dtype, buffer=out.buf)
+    return xp.asarray(result, copy=True)
+
+
+def map_shards(
+    func: Callable[..., Any],
+    /,
+    *args: Any,  # noqa: ANN401
+    max_workers: int | None = None,
+) -> Array:
+    """
+    Compute an elementwise function in shards, in worker processes.
+
+    The array arguments are broadcast and copied to shared memory, and their
+    leading axis is split into one shard per worker. Each worker of a
+    persistent process pool views its shard of the inputs in shared memory,
+    calls ``func`` with arrays of their namespace, and writes the result into
+    a shared output, from which the result is copied. Only the names, shapes
+    and data types of the arrays are sent to the workers, never their data.
+
+    This uses several cores for functions that hold the GIL, such as chains
+    of `array_api` elementwise functions on small dtypes or backends written in
+    Python. It needs NumPy, for the views of shared memory, and the arrays
+    must support DLPack, or conversion with `numpy.asarray`, on the CPU.
+
+    Parameters
+    ----------
+    func : Callable[..., Array]
+        An elementwise function, e.g. `array_api.exp`, or a function of
+        elementwise functions. It must be picklable, i.e. defined at the top
+        level of a module.
+    *args : Array | bool | int | float | complex
+        The arguments of ``func``, of which at least one is an array with at
+        least one dimension.
+    max_workers : int | None, optional
+        The number of processes, and of shards. By default, the number of
+        CPUs.
+
+    Returns
+    -------
+    Array
+        The result of ``func``, an array of the namespace of the arguments.
+
+    Raises
+    ------
+    ValueError
+        If the arrays are of different namespaces, or of a namespace that is
+        not a module.
+
+    Examples
+    --------
+    >>> import array_api as ap
+    >>> y = ap.map_shards(ap.logaddexp, x1, x2)  # doctest: +SKIP
+
+    """
+    xp = get_namespace(*args)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    shms: list[SharedMemory] = []
+    try:
+        return _map_shards(xp, func, args, max_workers, shms)
+    finally:
+        for shm in shms:
+            _close(shm)
+            shm.unlink()
+
+
+class _Policy(NamedTuple):
+    """The sharding set by `sharded_elementwise`."""
+
+    max_workers: int
+    min_size: int
+
+
+_sharding: ContextVar[_Policy | None] = ContextVar(
+    "array_api_sharding", default=None
+)
+
+
+def _sharded(name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap the elementwise ``func`` to shard large inputs."""
+    wrapper = getattr(array_api, name)
+
+    def call(*args: Any) -> Any:  # noqa: ANN401
+        policy = _sharding.get()
+        shapes = [arg.shape for arg in args if type(arg) not in _PYTHON_SCALARS]
+        if (
+            policy is None
+            or not all(shapes)  # 0-dimensional
+            or any(None in s for s in shapes)
+            or max(prod(s) for s in shapes) < policy.min_size
+        ):
+            return func(*args)
+        # The workers call the wrapper, which is picklable by reference.
+        token = _sharding.set(None)
+        try:
+            return map_shards(wrapper, *args, max_workers=policy.max_workers)
+        finally:
+            _sharding.reset(token)
+
+    return call
+
+
+class _ShardingNamespace:
+    """Proxy of a namespace sharding its elementwise functions."""
+
+    __slots__ = ("_namespace",)
+
+    def __init__(self, namespace: Any) -> None:  # noqa: ANN401
+        self._namespace = namespace
+
+    def __repr__(self) -> str:
+        return f"<sharded {self._namespace!r}>"
+
+    @property
+    def __wrapped__(self) -> Any:  # noqa: ANN401
+        """The namespace proxied."""
+        return self._namespace
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        attr = getattr(self._namespace, name)
+        if name in protocol_methods(HasElementwiseFunctions):
+            return _sharded(name, attr)
+        return attr
+
+
+def _sharding_hook(
+    xs: tuple[Any, ...],
+    array_traits: TraitsT,
+    api_version: str | None,
+    resolve: Resolver,
+) -> ArrayAPINamespace:
+    """Dispatch hook sharding elementwise functions in scopes."""
+    ns = resolve(xs, array_traits, api_version)
+    policy = _sharding.get()
+    if policy is None or policy.max_workers < 2:  # noqa: PLR2004
+        return ns
+    return _ShardingNamespace(ns)  # type: ignore[return-value]
+
+
+@contextmanager
+def sharded_elementwise(
+    max_workers: int | None = None, *, min_size: int = _MIN_SIZE
+) -> Iterator[None]:
+    """
+    Shard large elementwise functions over processes within a scope.
+
+    In the scope, the elementwise functions of `array_api`, e.g.
+    `array_api.exp` or `array_api.logaddexp`, compute inputs of at least
+    ``min_size`` elements with :func:`map_shards`. Each call copies its inputs
+    to, and its output from, shared memory, so chains of elementwise functions
+    are better sharded as one function with :func:`map_shards`.
+
+    The scope is local to the current thread or `asyncio` task.
+
+    Parameters
+    ----------
+    max_workers : int | None, optional
+        The number of processes, and of shards. By default, the number of
+        CPUs. With 1, functions are not sharded.
+    min_size : int, optional
+        The number of elements below which inputs are not sharded, by default
+        ``2**22``.
+
+    Yields
+    ------
+    None
+
+    Examples
+    --------
+    >>> import array_api as ap
+    >>> with ap.sharded_elementwise():  # doctest: +SKIP
+    ...     y = ap.exp(x)
+
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    with dispatch_hook_scope(_sharding_hook, first=False):
+        token = _sharding.set(_Policy(max_workers, min_size))
+        try:
+            yield
+        finally:
+            _sharding.reset(token)
@@ -4,12 +4,62 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Protocol
 
-from array_api._namespace import get_namespace
+from array_api._namespace import get_namespace1
 
 if TYPE_CHECKING:
     from array_api._array import Array
+    from array_api._capabilities import Capabilities
+    from array_api._namespace_api import ArrayAPINamespace
 
-__all__ = ["sort", "argsort"]
+__all__ = ["sort", "argsort", "argpartition", "partition", "topk"]
+
+# The wrappers written by hand, with fallbacks, rather than generated to call
+# the function of the namespace. See ``tools/generate_wrappers.py``.
+_HANDWRITTEN: tuple[str, ...] = (
+    "argpartition",
+    "argsort",
+    "partition",
+    "sort",
+    "topk",
+)
+
+
+def _argsort(
+    xp: ArrayAPINamespace,
+    caps: Capabilities,
+    x: Array,
+    axis: int,
+    *,
+    descending: bool,
+    stable: bool,
+) -> Array:
+    """`argsort`, also for namespaces without ``descending``, e.g. NumPy."""
+    kwargs = {"stable": stable} if caps.supports("argsort", "stable") else {}
+    if caps.supports("argsort", "descending"):
+        return xp.argsort(x, axis=axis, descending=descending, **kwargs)
+    if not descending:
+        return xp.argsort(x, axis=axis, **kwargs)
+    # Reversed, so that equal elements keep their order.
+    n: int = x.shape[axis]  # type: ignore[assignment]
+    indices = xp.argsort(xp.flip(x, axis=axis), axis=axis, **kwargs)
+    return -xp.flip(indices, axis=axis) + (n - 1)
+
+
+def _sort(
+    xp: ArrayAPINamespace,
+    caps: Capabilities,
+    x: Array,
+    axis: int,
+    *,
+    descending: bool,
+    stable: bool,
+) -> Array:
+    """`sort`, also for namespaces without ``descending``, e.g. NumPy."""
+    kwargs = {"stable": stable} if caps.supports("sort", "stable") else {}
+    if caps.supports("sort", "descending"):
+        return xp.sort(x, axis=axis, descending=descending, **kwargs)
+    out = xp.sort(x, axis=axis, **kwargs)
+    return xp.flip(out, axis=axis) if descending else out
 
 
 def argsort(
@@ -23,6 +73,11 @@ def argsort(
     """
     Returns the indices that sort an array ``x`` along a specified axis.
 
+    For namespaces whose ``argsort`` has no ``descending`` keyword argument,
+    e.g. NumPy, the reversed array is sorted in ascending order. For those
+    without ``stable``, it is not passed, so the sort is as stable as the
+    namespace's default.
+
     Parameters
     ----------
     x : array
@@ -48,8 +103,11 @@ def argsort(
         ``x``. The returned array must have the default array index data type.
 
     """
-    return get_namespace(x).argsort(
-        x, axis=axis, descending=descending, stable=stable
+    from array_api._capabilities import capabilities
+
+    xp = get_namespace1(x)
+    return _argsort(
+        xp, capabilities(xp), x, axis, descending=descending, stable=stable
     )
 
 
@@ -64,6 +122,11 @@ def sort(
     """
     Returns a sorted copy of an input array ``x``.
 
+    For namespaces whose ``sort`` has no ``descending`` keyword argument, e.g.
+    NumPy, the array is sorted in ascending order and reversed. For those
+    without ``stable``, it is not passed, so the sort is as stable as the
+    namespace's default.
+
     Parameters
     ----------
     x: array
@@ -89,11 +152,154 @@ def sort(
         shape as ``x``.
 
     """
-    return get_namespace(x).sort(
-        x, axis=axis, descending=descending, stable=stable
+    from array_api._capabilities import capabilities
+
+    xp = get_namespace1(x)
+    return _sort(
+        xp, capabilities(xp), x, axis, descending=descending, stable=stable
     )
 
 
+def argpartition(
+    x: Array, kth: int, /, *, axis: int = -1, descending: bool = False
+) -> Array:
+    """
+    Returns the indices that partially sort an array ``x`` along a specified
+    axis, such that the element at index ``kth`` is in its sorted position.
+
+    The namespace's own ``argpartition`` is used if it has one, and otherwise a
+    selection built from comparisons and sorts of small integer keys, which
+    takes time linear in the size of ``x`` for backends that sort such keys
+    with a radix sort, e.g. NumPy, rather than the
+    ``O(n log n)`` of :func:`argsort`.
+
+    Parameters
+    ----------
+    x: array
+        input array. Should have a real-valued data type.
+    kth: int
+        index along ``axis`` of the element in its sorted position. Negative
+        indices count from the end of the axis.
+    axis: int
+        axis along which to partition. If set to ``-1``, the function must
+        partition along the last axis. Default: ``-1``.
+    descending: bool
+        sort order. If ``True``, the indices of elements greater than or
+        equal to the element at ``kth`` come first, and those of smaller
+        elements after it. If ``False``, the indices of elements less than or
+        equal to the element at ``kth`` come first. Default: ``False``.
+
+    Returns
+    -------
+    out : array
+        an array of indices. The returned array must have the same shape as
+        ``x``. The order of the indices on either side of ``kth``, and the
+        position of ``NaN`` values, are implementation-dependent.
+
+    Raises
+    ------
+    ValueError
+        If ``axis`` or ``kth`` is out of bounds.
+
+    """
+    from array_api._selection import argpartition
+
+    return argpartition(get_namespace1(x), x, kth, axis, descending=descending)
+
+
+def partition(
+    x: Array, kth: int, /, *, axis: int = -1, descending: bool = False
+) -> Array:
+    """
+    Returns a partially sorted copy of an input array ``x``, in which the
+    element at index ``kth`` is in its sorted position.
+
+    The namespace's own ``partition`` is used if it has one, and otherwise the
+    elements at the indices of :func:`argpartition`.
+
+    Parameters
+    ----------
+    x: array
+        input array. Should have a real-valued data type.
+    kth: int
+        index along ``axis`` of the element in its sorted position. Negative
+        indices count from the end of the axis.
+    axis: int
+        axis along which to partition. If set to ``-1``, the function must
+        partition along the last axis. Default: ``-1``.
+    descending: bool
+        sort order. If ``True``, the elements greater than or equal to the
+        element at ``kth`` come first, and the smaller elements after it. If
+        ``False``, the elements less than or equal to the element at ``kth``
+        come first. Default: ``False``.
+
+    Returns
+    -------
+    out : array
+        a partially sorted array. The returned array must have the same data
+        type and shape as ``x``. The order of the elements on either side of
+        ``kth``, and the position of ``NaN`` values, are
+        implementation-dependent.
+
+    Raises
+    ------
+    ValueError
+        If ``axis`` or ``kth`` is out of bounds.
+
+    """
+    from array_api._selection import partition
+
+    return partition(get_namespace1(x), x, kth, axis, descending=descending)
+
+
+def topk(
+    x: Array, k: int, /, *, axis: int = -1, descending: bool = True
+) -> tuple[Array, Array]:
+    """
+    Returns the ``k`` greatest, or least, elements of an input array ``x``
+    along a specified axis, and their indices.
+
+    The namespace's own ``topk`` is used if it has one with the ``axis`` and
+    ``descending`` keyword arguments, and otherwise :func:`argpartition`,
+    after which only the ``k`` elements are sorted.
+
+    Parameters
+    ----------
+    x: array
+        input array. Should have a real-valued data type.
+    k: int
+        number of elements to return. Must be at most the size of ``axis``.
+    axis: int
+        axis along which to select. If set to ``-1``, the function must
+        select along the last axis. Default: ``-1``.
+    descending: bool
+        sort order. If ``True``, the ``k`` greatest elements are returned, in
+        descending order. If ``False``, the ``k`` least elements are returned,
+        in ascending order. Default: ``True``.
+
+    Returns
+    -------
+    out: Tuple[array, array]
+        a tuple ``(values, indices)`` whose
+
+        - first element must be an array of the selected elements, sorted. The
+          array must have the same data type as ``x``, and the same shape
+          except that ``axis`` has size ``k``.
+        - second element must be an array of the indices of the selected
+          elements along ``axis``. The array must have the same shape as
+          ``values``.
+
+    Raises
+    ------
+    ValueError
+        If ``axis`` or ``k`` is out of bounds.
+
+    """
+    from array_api._selection import topk
+
+    return topk(get_namespace1(x), x, k, axis, descending=descending)
+
+
 ####################################################################################################
 
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Protocol
 
-from array_api._namespace import get_namespace
+from array_api._namespace import get_namespace1
 
 if TYPE_CHECKING:
     from array_api._array import Array
@@ -19,7 +19,7 @@ def max(
     x: Array,
     /,
     *,
-    axis: int | tuple[int, ...] | None = None,
+    axis: AxisT = None,
     keepdims: bool = False,
 ) -> Array:
     """
@@ -67,14 +67,14 @@ def max(
         array must have the same data type as ``x``.
 
     """
-    return get_namespace(x).max(x, axis=axis, keepdims=keepdims)
+    return get_namespace1(x).max(x, axis=axis, keepdims=keepdims)
 
 
 def mean(
     x: Array,
     /,
     *,
-    axis: int | tuple[int, ...] | None = None,
+    axis: AxisT = None,
     keepdims: bool = False,
 ) -> Array:
     """
@@ -123,14 +123,14 @@ def mean(
             data type.
 
     """
-    return get_namespace(x).mean(x, axis=axis, keepdims=keepdims)
+    return get_namespace1(x).mean(x, axis=axis, keepdims=keepdims)
 
 
 def min(
     x: Array,
     /,
     *,
-    axis: int | tuple[int, ...] | None = None,
+    axis: AxisT = None,
     keepdims: bool = False,
 ) -> Array:
     """
@@ -178,14 +178,14 @@ def min(
         array must have the same data type as ``x``.
 
     """
-    return get_namespace(x).min(x, axis=axis, keepdims=keepdims)
+    return get_namespace1(x).min(x, axis=axis, keepdims=keepdims)
 
 
 def prod(
     x: Array,
     /,
     *,
-    axis: int | tuple[int, ...] | None = None,
+    axis: AxisT = None,
     dtype: DType | None = None,
     keepdims: bool = False,
 ) -> Array:
@@ -255,14 +255,14 @@ def prod(
         described by the ``dtype`` parameter above.
 
     """
-    return get_namespace(x).prod(x, axis=axis, dtype=dtype, keepdims=keepdims)
+    return get_namespace1(x).prod(x, axis=axis, dtype=dtype, keepdims=keepdims)
 
 
 def std(
     x: Array,
     /,
     *,
-    axis: int | tuple[int, ...] | None = None,
+    axis: AxisT = None,
     correction: float = 0.0,
     keepdims: bool = False,
 ) -> Array:
@@ -327,7 +327,7 @@ def std(
             data type.
 
     """
-    return get_namespace(x).std(
+    return get_namespace1(x).std(
         x, axis=axis, correction=correction, keepdims=keepdims
     )
 
@@ -336,7 +336,7 @@ def sum(
     x: Array,
     /,
     *,
-    axis: int | tuple[int, ...] | None = None,
+    axis: AxisT = None,
     dtype: DType | None = None,
     keepdims: bool = False,
 ) -> Array:
@@ -406,14 +406,14 @@ def sum(
         parameter above.
 
     """
-    return get_namespace(x).sum(x, axis=axis, dtype=dtype, keepdims=keepdims)
+    return get_namespace1(x).sum(x, axis=axis, dtype=dtype, keepdims=keepdims)
 
 
 def var(
     x: Array,
     /,
     *,
-    axis: int | tuple[int, ...] | None = None,
+    axis: AxisT = None,
     correction: float = 0.0,
     keepdims: bool = False,
 ) -> Array:
@@ -475,7 +475,7 @@ def var(
         default floating-point data type.
 
     """
-    return get_namespace(x).var(
+    return get_namespace1(x).var(
         x, axis=axis, correction=correction, keepdims=keepdims
     )
 
@@ -0,0 +1,124 @@
+"""Transfer of arrays between devices."""
+
+from __future__ import annotations
+
+__all__ = ["to_device_many"]
+
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from array_api._namespace import get_namespace
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from array_api._array import Array
+    from array_api._device import Device
+
+ArrayT = TypeVar("ArrayT", bound="Array")
+
+# The threads copying from each device, kept for the life of the process, so
+# that calls do not pay for starting them. Devices are few, so one pool serves
+# every call; the copies from more devices than this wait for a thread.
+_MAX_WORKERS: int = 16
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor  # noqa: PLW0603
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    _MAX_WORKERS, thread_name_prefix="array_api_transfer"
+                )
+    return _executor
+
+
+def _group_by_device(arrays: list[ArrayT]) -> list[tuple[Any, list[int]]]:
+    """Return the devices of ``arrays`` and the indices of those on each."""
+    # Devices are compared with ``==``, as they need not be hashable.
+    groups: list[tuple[Any, list[int]]] = []
+    for i, x in enumerate(arrays):
+        device = x.device
+        for source, indices in groups:
+            if source == device:
+                indices.append(i)
+                break
+        else:
+            groups.append((device, [i]))
+    return groups
+
+
+def to_device_many(
+    arrays: Iterable[ArrayT],
+    device: Device,
+    /,
+    *,
+    stream: int | Any | None = None,  # noqa: ANN401
+) -> list[ArrayT]:
+    """
+    Copy arrays to a device.
+
+    This is :meth:`Array.to_device` for many arrays, e.g. the parameters of a
+    model. The namespace of the arrays is resolved once, and the arrays are
+    grouped by the device they are on. Arrays already on ``device`` are not
+    copied. The arrays of each other device are copied in turn, with
+    ``stream`` if given, so backends that copy asynchronously on a stream can
+    enqueue the copies without waiting for each. The copies from different
+    devices are made concurrently, in a pool of threads kept between calls, so
+    that they overlap for backends that release the GIL while copying.
+
+    Parameters
+    ----------
+    arrays : Iterable[Array]
+        The arrays to copy. They must be arrays of one namespace.
+    device : Device
+        The device to copy the arrays to.
+    stream : int | Any | None, optional
+        The stream on which to enqueue the copies. See
+        :meth:`Array.to_device`. By default the copies are enqueued on the
+        default stream, and the argument is not passed.
+
+    Returns
+    -------
+    list[Array]
+        The arrays on ``device``, in the order of ``arrays``.
+
+    Raises
+    ------
+    ValueError
+        If the arrays are not all arrays of one namespace.
+
+    Examples
+    --------
+    >>> import array_api as ap
+    >>> params = ap.to_device_many(params, "cuda:1")  # doctest: +SKIP
+
+    """
+    arrays = list(arrays)
+    if not arrays:
+        return []
+    get_namespace(*arrays)  # the arrays must be of one namespace
+
+    kwargs = {} if stream is None else {"stream": stream}
+    out: list[ArrayT] = list(arrays)
+
+    def copy(indices: list[int]) -> None:
+        for i in indices:
+            out[i] = arrays[i].to_device(device, **kwargs)
+
+    copies = [
+        indices
+        for source, indices in _group_by_device(arrays)
+        if source != device
+    ]
+    if len(copies) == 1:
+        copy(copies[0])
+    elif copies:
+        # Consume the results, to raise the first error of a copy.
+        list(_get_executor().map(copy, copies))
+    return out
@@ -0,0 +1,292 @@
+"""Functions mapped over nested containers of arrays."""
+
+from __future__ import annotations
+
+__all__ = ["tree_map"]
+
+from collections.abc import Callable
+from itertools import islice
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+import array_api
+from array_api import _namespace
+from array_api._conformance import protocol_methods
+from array_api._namespace import _PYTHON_SCALARS, get_namespace
+from array_api._namespace_api import ArrayAPINamespace
+from array_api._searching_functions import (
+    _HANDWRITTEN as _HANDWRITTEN_SEARCHING,
+)
+from array_api._sorting_functions import _HANDWRITTEN as _HANDWRITTEN_SORTING
+from array_api.linalg import ArrayAPILinAlgNamespace
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+# The structure of a tree: `None` for a leaf, and otherwise the type of the
+# node, its keys if a `dict`, and the structures of its children. Being nested
+# tuples, structures are compared and hashed like values.
+TreeDef = tuple[type, tuple[Any, ...] | None, tuple[Any, ...]] | None
+Builder = Callable[["Iterator[Any]"], Any]
+
+# The wrappers that are written by hand, e.g. with fallbacks, which differ from
+# the function of the namespace, so are not replaced by it.
+_HANDWRITTEN: frozenset[str] = frozenset(
+    (*_HANDWRITTEN_SEARCHING, *_HANDWRITTEN_SORTING)
+)
+
+# Maximum number of tree structures remembered.
+_TREEDEF_CACHE_MAXSIZE: int = 128
+
+# The builders of trees from their leaves, per structure.
+_builders: dict[TreeDef, Builder] = {}
+_builders_lock = Lock()
+
+
+# Whether each type is a node: `dict`, `list`, `tuple`, named tuples and
+# `NoneType`. Other types are added as they are seen.
+_node_types: dict[type, bool] = {
+    dict: True,
+    list: True,
+    tuple: True,
+    type(None): True,
+}
+
+
+def _is_node_type(cls: type) -> bool:
+    is_node = _node_types.get(cls)
+    if is_node is None:  # not locked, as the value is always the same
+        is_node = _node_types[cls] = issubclass(cls, tuple) and hasattr(
+            cls, "_fields"
+        )
+    return is_node
+
+
+def _flatten(tree: Any, leaves: list[Any]) -> TreeDef:  # noqa: ANN401
+    """Append the leaves of ``tree`` to ``leaves`` and return its structure."""
+    cls = type(tree)
+    if cls is dict:
+        keys: tuple[Any, ...] | None = tuple(tree)
+        values = tree.values()
+    elif _is_node_type(cls):
+        keys = None
+        values = tree or ()  # `None` is an empty node, as in JAX
+    else:
+        leaves.append(tree)
+        return None
+
+    # Leaf children are handled inline, as most children are leaves.
+    children: list[TreeDef] = []
+    for value in values:
+        is_node = _node_types.get(type(value))
+        if is_node or (is_node is None and _is_node_type(type(value))):
+            children.append(_flatten(value, leaves))
+        else:
+            leaves.append(value)
+            children.append(None)
+    return (cls, keys, tuple(children))
+
+
+def _flatten_like(
+    tree: Any, treedef: TreeDef, leaves: list[Any]  # noqa: ANN401
+) -> bool:
+    """
+    Append the leaves of ``tree`` to ``leaves``, in the order of ``treedef``.
+
+    Returns whether ``tree`` has the structure ``treedef``, up to the order of
+    the keys of its dicts.
+    """
+    if treedef is None:
+        leaves.append(tree)
+        return not _is_node_type(type(tree))
+
+    cls, keys, children = treedef
+    if type(tree) is not cls:
+        return False
+    values: Any
+    if keys is None:
+        values = tree or ()
+    elif tree.keys() == set(keys):  # type: ignore[attr-defined]
+        values = [tree[k] for k in keys]  # type: ignore[index]
+    else:
+        return False
+    return len(values) == len(children) and all(
+        _flatten_like(value, child, leaves)
+        for value, child in zip(values, children, strict=False)
+    )
+
+
+def _make_leaves_builder(
+    cls: type, keys: tuple[Any, ...] | None, n: int
+) -> Builder:
+    """Make the function building a node of ``n`` leaves."""
+    # The node is built from a slice of the leaves, without a call per leaf.
+    if keys is not None:
+        return lambda leaves: dict(zip(keys, islice(leaves, n), strict=True))
+    if cls is list or cls is tuple:
+        return lambda leaves: cls(islice(leaves, n))
+    return lambda leaves: cls._make(islice(leaves, n))  # type: ignore[attr-defined]
+
+
+def _make_builder(treedef: TreeDef) -> Builder:
+    """Make the function building a tree of ``treedef`` from its leaves."""
+    if treedef is None:
+        return next
+
+    cls, keys, children = treedef
+    if cls is type(None):
+        return lambda _: None
+    if not any(children):  # a node of leaves, the most common
+        return _make_leaves_builder(cls, keys, len(children))
+
+    builders = tuple(map(_builder, children))
+    if keys is not None:
+        return lambda leaves: {
+            k: b(leaves) for k, b in zip(keys, builders, strict=True)
+        }
+    if cls is list or cls is tuple:
+        return lambda leaves: cls(b(leaves) for b in builders)
+    return lambda leaves: cls(*(b(leaves) for b in builders))  # named tuples
+
+
+def _builder(treedef: TreeDef) -> Builder:
+    """Return the cached function building a tree of ``treedef``."""
+    try:
+        return _builders[treedef]
+    except KeyError:
+        pass
+
+    builder = _make_builder(treedef)
+    with _builders_lock:
+        if len(_builders) >= _TREEDEF_CACHE_MAXSIZE:
+            del _builders[next(iter(_builders))]
+        _builders[treedef] = builder
+    return builder
+
+
+def _namespace_function(
+    func: Callable[..., Any], xp: Any  # noqa: ANN401
+) -> Callable[..., Any]:
+    """Return the function of ``xp`` that ``func`` calls, if a wrapper."""
+    name = getattr(func, "__name__", "")
+    if name in _HANDWRITTEN:
+        return func
+    if (
+        name in protocol_methods(ArrayAPINamespace)
+        and getattr(array_api, name, None) is func
+    ):
+        return getattr(xp, name)  # type: ignore[no-any-return]
+    if (
+        name in protocol_methods(ArrayAPILinAlgNamespace)
+        and getattr(array_api.linalg, name, None) is func
+    ):
+        return getattr(xp.linalg, name)  # type: ignore[no-any-return]
+    return func
+
+
+def _stackable(leaves: list[Any]) -> bool:
+    """Check whether ``leaves`` are arrays of one shape and data type."""
+    first = leaves[0]
+    if type(first) in _PYTHON_SCALARS or not hasattr(first, "shape"):
+        return False
+    shape, dtype = first.shape, first.dtype
+    return all(
+        type(x) not in _PYTHON_SCALARS
+        and getattr(x, "shape", None) == shape
+        and getattr(x, "dtype", None) == dtype
+        for x in leaves
+    )
+
+
+def tree_map(
+    func: Callable[..., Any],
+    tree: Any,  # noqa: ANN401
+    /,
+    *rest: Any,  # noqa: ANN401
+    stack: bool = False,
+) -> Any:  # noqa: ANN401
+    """
+    Map a function over the leaves of nested containers of arrays.
+
+    The containers, or nodes, are `dict`, `list`, `tuple` and named tuples, and
+    `None` is an empty node. Everything else is a leaf. Dicts have the same
+    structure if they have the same keys, in any order, and the result has the
+    keys in the order of ``tree``. The trees are flattened once and the
+    namespace of all their leaves is resolved once. If ``func`` is a function of
+    `array_api` or `array_api.linalg` that only calls the function of the
+    namespace, e.g. `array_api.multiply` but not `array_api.sort`, which has a
+    fallback, the function of the namespace is called on the leaves instead,
+    so that it is not dispatched once per leaf. The function rebuilding a tree
+    from its leaves is cached per tree structure.
+
+    Parameters
+    ----------
+    func : Callable[..., Any]
+        The function, called with a leaf of each tree.
+    tree : Any
+        The tree whose structure the result has.
+    *rest : Any
+        Other trees, of the same structure as ``tree``, whose leaves are passed
+        to ``func`` after those of ``tree``.
+    stack : bool, optional
+        Whether to call ``func`` once, on the leaves of each tree stacked along
+        a new first axis, if the leaves of each tree are arrays of one shape and
+        data type, by default `False`. The result is then split along its first
+        axis. This is only correct for functions that act independently on
+        each element, or along the trailing axes, such as the elementwise
+        functions. Stacking copies the leaves, so it pays off for backends
+        where the overhead of a call dominates, e.g. kernel launches on a GPU.
+
+    Returns
+    -------
+    Any
+        A tree of the structure of ``tree``, whose leaves are the results of
+        ``func``.
+
+    Raises
+    ------
+    ValueError
+        If the trees have different structures, or their leaves are arrays of
+        different namespaces or are not arrays.
+
+    Examples
+    --------
+    >>> import array_api as ap
+    >>> params = {"w": w, "b": (b1, b2)}  # doctest: +SKIP
+    >>> ap.tree_map(ap.multiply, params, grads)  # doctest: +SKIP
+    {'w': Array(...), 'b': (Array(...), Array(...))}
+
+    """
+    leaves: list[Any] = []
+    treedef = _flatten(tree, leaves)
+    all_leaves = [leaves]
+    for other in rest:
+        other_leaves: list[Any] = []
+        if _flatten(other, other_leaves) != treedef:
+            # The keys of dicts may be in another order.
+            other_leaves.clear()
+            if not _flatten_like(other, treedef, other_leaves):
+                msg = f"tree {other!r} has a different structure from {tree!r}"
+                raise ValueError(msg)
+        all_leaves.append(other_leaves)
+    if not leaves:
+        return _builder(treedef)(iter(()))
+
+    # Namespaces are resolved by type, so one leaf per type suffices, unless
+    # dispatch hooks, e.g. of `promote_namespaces`, need all the inputs.
+    inputs: Iterable[Any] = (x for ls in all_leaves for x in ls)
+    if _namespace._dispatch is None:  # noqa: SLF001
+        inputs = {type(x): x for x in inputs}.values()
+    xp = get_namespace(*inputs)
+    func = _namespace_function(func, xp)
+
+    if stack and len(leaves) > 1 and all(map(_stackable, all_leaves)):
+        out = func(*(xp.stack(ls) for ls in all_leaves))
+        unstack = getattr(xp, "unstack", None)
+        if unstack is not None:
+            results = list(unstack(out))
+        else:
+            results = [out[i, ...] for i in range(len(leaves))]
+    else:
+        results = [func(*args) for args in zip(*all_leaves, strict=True)]
+    return _builder(treedef)(iter(results))
@@ -14,12 +14,16 @@ __all__ = [
     "iinfo_object",
 ]
 
-from typing import Any, Protocol, TypeVar
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar, runtime_checkable
+
+if TYPE_CHECKING:
+    from array_api._namespace_api import ArrayAPINamespace
 
 SupportsBufferProtocol = Any
 PyCapsule = Any
 _T_co = TypeVar("_T_co", covariant=True)
 AxisT = int | tuple[int, ...] | None
+PyScalar = bool | int | float | complex
 
 
 class finfo_object(Protocol):  # noqa: N801
@@ -46,3 +50,12 @@ class NestedSequence(Protocol[_T_co]):
     def __getitem__(self, key: int, /) -> _T_co | NestedSequence[_T_co]: ...
 
     def __len__(self, /) -> int: ...
+
+
+@runtime_checkable
+class BaseTrait(Protocol):
+    """Runtime-checkable protocol for objects with an array API namespace."""
+
+    def __array_namespace__(
+        self, *, api_version: str | None = ...
+    ) -> ArrayAPINamespace: ...
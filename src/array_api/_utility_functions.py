@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Protocol
 
-from array_api._namespace import get_namespace
+from array_api._namespace import get_namespace1
 
 if TYPE_CHECKING:
     from array_api._array import Array
@@ -17,7 +17,7 @@ def all(
     x: Array,
     /,
     *,
-    axis: int | tuple[int, ...] | None = None,
+    axis: AxisT = None,
     keepdims: bool = False,
 ) -> Array:
     """
@@ -65,14 +65,14 @@ def all(
         type of ``bool``.
 
     """
-    return get_namespace(x).all(x, axis=axis, keepdims=keepdims)
+    return get_namespace1(x).all(x, axis=axis, keepdims=keepdims)
 
 
 def any(
     x: Array,
     /,
     *,
-    axis: int | tuple[int, ...] | None = None,
+    axis: AxisT = None,
     keepdims: bool = False,
 ) -> Array:
     """
@@ -120,7 +120,7 @@ def any(
         type of ``bool``.
 
     """
-    return get_namespace(x).any(x, axis=axis, keepdims=keepdims)
+    return get_namespace1(x).any(x, axis=axis, keepdims=keepdims)
 
 
 ####################################################################################################
@@ -0,0 +1,186 @@
+"""Memoized validation of array API namespaces."""
+
+from __future__ import annotations
+
+__all__ = ["NamespaceReport", "validate_namespace"]
+
+import weakref
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+from array_api._conformance import protocol_members, protocol_methods
+from array_api._namespace_api import ArrayAPINamespace
+from array_api.linalg import ArrayAPILinAlgNamespace
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+# Maximum number of namespaces that cannot be weakly referenced remembered.
+_VALIDATION_CACHE_MAXSIZE: int = 64
+
+_MISSING = object()
+
+# The reports, by the `id` of the namespace, with a weak reference to the
+# namespace, or the namespace itself if it cannot be weakly referenced, so
+# that the `id` is not reused while it is cached.
+_reports: dict[int, tuple[Callable[[], Any], NamespaceReport]] = {}
+_strong: dict[int, None] = {}  # the ids of the namespaces held, in order
+_reports_lock = Lock()
+
+# The protocols of the functions and constants of a namespace, e.g.
+# `HasCreationFunctions`.
+_PROTOCOLS: tuple[type, ...] = tuple(
+    base
+    for base in ArrayAPINamespace.__bases__
+    if protocol_members(base)  # not `Protocol` itself
+)
+
+
+def _missing(namespace: Any, proto: type) -> frozenset[str]:  # noqa: ANN401
+    """Return the members of ``proto`` that ``namespace`` does not have."""
+    methods = protocol_methods(proto)
+    return frozenset(
+        name
+        for name in protocol_members(proto)
+        if (value := getattr(namespace, name, _MISSING)) is _MISSING
+        # Functions can be blocked by setting them to None.
+        or (name in methods and not callable(value))
+    )
+
+
+class NamespaceReport:
+    """
+    The members of `ArrayAPINamespace` that a namespace does not have.
+
+    Use :func:`validate_namespace` to get the memoized report of a namespace.
+
+    Attributes
+    ----------
+    missing : Mapping[str, frozenset[str]]
+        The missing functions and constants, by the name of the protocol of
+        `ArrayAPINamespace` that they are members of, e.g.
+        ``"HasCreationFunctions"``. Only protocols with missing members are
+        included. Functions that are not callable, e.g. set to `None`, are
+        missing.
+    linalg_missing : frozenset[str] | None
+        The missing functions of the ``linalg`` extension, or `None` if the
+        namespace does not have the extension.
+
+    """
+
+    __slots__ = ("linalg_missing", "missing")
+
+    def __init__(self, xp: Any) -> None:  # noqa: ANN401
+        missing = {proto.__name__: _missing(xp, proto) for proto in _PROTOCOLS}
+        self.missing: Mapping[str, frozenset[str]] = {
+            name: members for name, members in missing.items() if members
+        }
+        linalg = getattr(xp, "linalg", None)
+        self.linalg_missing = (
+            None
+            if linalg is None
+            else _missing(linalg, ArrayAPILinAlgNamespace)
+        )
+
+    def __repr__(self) -> str:
+        missing = {
+            name: sorted(members) for name, members in self.missing.items()
+        }
+        linalg = (
+            None if self.linalg_missing is None else sorted(self.linalg_missing)
+        )
+        return f"NamespaceReport(missing={missing}, linalg_missing={linalg})"
+
+    def __bool__(self) -> bool:
+        return self.conforms
+
+    @property
+    def conforms(self) -> bool:
+        """Whether the namespace has every member of `ArrayAPINamespace`."""
+        return not self.missing
+
+    def raise_for_missing(self) -> None:
+        """
+        Raise an error if the namespace does not conform.
+
+        Raises
+        ------
+        TypeError
+            If the namespace does not have every member of
+            `ArrayAPINamespace`, listing the missing members.
+
+        """
+        if self.missing:
+            names = sorted(m for ms in self.missing.values() for m in ms)
+            msg = f"namespace does not conform to ArrayAPINamespace: {names}"
+            raise TypeError(msg)
+
+
+def _forget(key: int, ref: weakref.ref[Any]) -> None:
+    """Remove the report of a collected namespace."""
+    # Not locked, as collection may happen while the lock is held.
+    entry = _reports.get(key)
+    if entry is not None and entry[0] is ref:
+        _reports.pop(key, None)
+
+
+def validate_namespace(xp: ArrayAPINamespace, /) -> NamespaceReport:
+    """
+    Check the functions and constants of a namespace once.
+
+    `ArrayAPINamespace` is not runtime-checkable, and an `isinstance` check
+    against a runtime-checkable version of it looks up each of its well over
+    100 members on every call, taking hundreds of microseconds. Instead, the
+    report is memoized by the identity of the namespace, so validating it
+    again, e.g. at each call of a library function, is a dictionary lookup.
+    Namespaces are weakly referenced where possible, so that the report is
+    discarded with the namespace.
+
+    Parameters
+    ----------
+    xp : ArrayAPINamespace
+        The namespace, e.g. from :func:`get_namespace`.
+
+    Returns
+    -------
+    NamespaceReport
+        The members of `ArrayAPINamespace` that ``xp`` does not have. It is
+        true if there are none.
+
+    Examples
+    --------
+    >>> import array_api as ap
+    >>> import numpy as np
+    >>> ap.validate_namespace(np).conforms
+    True
+
+    """
+    key = id(xp)
+    try:
+        ref, report = _reports[key]
+    except KeyError:
+        pass
+    else:
+        if ref() is xp:
+            return report
+
+    report = NamespaceReport(xp)
+    with _reports_lock:
+        try:
+            ref = weakref.ref(xp, lambda r: _forget(key, r))
+        except TypeError:  # e.g. objects with `__slots__`
+            ref = lambda: xp  # noqa: E731
+            if len(_strong) >= _VALIDATION_CACHE_MAXSIZE:
+                oldest = next(iter(_strong))
+                del _strong[oldest]
+                _reports.pop(oldest, None)
+            _strong[key] = None
+        _reports[key] = (ref, report)
+    return report
+
+
+def clear_validation_cache() -> None:
+    """Clear the memoized reports."""
+    with _reports_lock:
+        _reports.clear()
+        _strong.clear()
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Literal
 
-from array_api._namespace import get_namespace
+from array_api._namespace import get_namespace1, get_namespace2
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -73,7 +73,7 @@ def cholesky(x: Array, /, *, upper: bool = False) -> Array:
         ``x``.
 
     """
-    return get_namespace(x).linalg.cholesky(x, upper=upper)
+    return get_namespace1(x).linalg.cholesky(x, upper=upper)
 
 
 def cross(x1: Array, x2: Array, /, *, axis: int = -1) -> Array:
@@ -103,7 +103,7 @@ def cross(x1: Array, x2: Array, /, *, axis: int = -1) -> Array:
         data type determined by :ref:`type-promotion`.
 
     """
-    return get_namespace(x1, x2).linalg.cross(x1, x2, axis=axis)
+    return get_namespace2(x1, x2).linalg.cross(x1, x2, axis=axis)
 
 
 def det(x: Array, /) -> Array:
@@ -126,7 +126,7 @@ def det(x: Array, /) -> Array:
         same data type as ``x``.
 
     """
-    return get_namespace(x).linalg.det(x)
+    return get_namespace1(x).linalg.det(x)
 
 
 def diagonal(x: Array, /, *, offset: int = 0) -> Array:
@@ -156,7 +156,7 @@ def diagonal(x: Array, /, *, offset: int = 0) -> Array:
         data type as ``x``.
 
     """
-    return get_namespace(x).linalg.diagonal(x, offset=offset)
+    return get_namespace1(x).linalg.diagonal(x, offset=offset)
 
 
 def eigh(x: Array, /) -> tuple[Array]:
@@ -206,7 +206,7 @@ def eigh(x: Array, /) -> tuple[Array]:
         implementation-dependent.
 
     """
-    return get_namespace(x).linalg.eigh(x)
+    return get_namespace1(x).linalg.eigh(x)
 
 
 def eigvalsh(x: Array, /) -> Array:
@@ -243,7 +243,7 @@ def eigvalsh(x: Array, /) -> Array:
         implementation-dependent.
 
     """
-    return get_namespace(x).linalg.eigvalsh(x)
+    return get_namespace1(x).linalg.eigvalsh(x)
 
 
 def inv(x: Array, /) -> Array:
@@ -265,12 +265,12 @@ def inv(x: Array, /) -> Array:
         must have the same shape as ``x``.
 
     """
-    return get_namespace(x).linalg.inv(x)
+    return get_namespace1(x).linalg.inv(x)
 
 
 def matmul(x1: Array, x2: Array, /) -> Array:
     """Alias for :func:`~array_api.linear_algebra_functions.matmul`."""
-    return get_namespace(x1, x2).linalg.matmul(x1, x2)
+    return get_namespace2(x1, x2).linalg.matmul(x1, x2)
 
 
 def matrix_norm(
@@ -344,7 +344,7 @@ def matrix_norm(
         type determined by :ref:`type-promotion`.
 
     """
-    return get_namespace(x).linalg.matrix_norm(x, keepdims=keepdims, ord=ord)
+    return get_namespace1(x).linalg.matrix_norm(x, keepdims=keepdims, ord=ord)
 
 
 def matrix_power(x: Array, n: int, /) -> Array:
@@ -372,7 +372,7 @@ def matrix_power(x: Array, n: int, /) -> Array:
         and a floating-point data type determined by :ref:`type-promotion`.
 
     """
-    return get_namespace(x).linalg.matrix_power(x, n)
+    return get_namespace1(x).linalg.matrix_power(x, n)
 
 
 def matrix_rank(x: Array, /, *, rtol: float | Array | None = None) -> Array:
@@ -408,14 +408,14 @@ def matrix_rank(x: Array, /, *, rtol: float | Array | None = None) -> Array:
         ``shape(x)[:-2]``).
 
     """
-    return get_namespace(x).linalg.matrix_rank(x, rtol=rtol)
+    return get_namespace1(x).linalg.matrix_rank(x, rtol=rtol)
 
 
 def matrix_transpose(x: Array, /) -> Array:
     """
     Alias for :func:`~array_api.linear_algebra_functions.matrix_transpose`.
     """
-    return get_namespace(x).linalg.matrix_transpose(x)
+    return get_namespace1(x).linalg.matrix_transpose(x)
 
 
 def outer(x1: Array, x2: Array, /) -> Array:
@@ -439,7 +439,7 @@ def outer(x1: Array, x2: Array, /) -> Array:
         :ref:`type-promotion`.
 
     """
-    return get_namespace(x1, x2).linalg.outer(x1, x2)
+    return get_namespace2(x1, x2).linalg.outer(x1, x2)
 
 
 def pinv(x: Array, /, *, rtol: float | Array | None = None) -> Array:
@@ -475,7 +475,7 @@ def pinv(x: Array, /, *, rtol: float | Array | None = None) -> Array:
         except the innermost two dimensions must be transposed).
 
     """
-    return get_namespace(x).linalg.pinv(x, rtol=rtol)
+    return get_namespace1(x).linalg.pinv(x, rtol=rtol)
 
 
 def qr(
@@ -536,7 +536,7 @@ def qr(
         :ref:`type-promotion`.
 
     """
-    return get_namespace(x).linalg.qr(x, mode=mode)
+    return get_namespace1(x).linalg.qr(x, mode=mode)
 
 
 def slogdet(x: Array, /) -> tuple[Array, Array]:
@@ -583,7 +583,7 @@ def slogdet(x: Array, /) -> tuple[Array, Array]:
             errors).
 
     """
-    return get_namespace(x).linalg.slogdet(x)
+    return get_namespace1(x).linalg.slogdet(x)
 
 
 def solve(x1: Array, x2: Array, /) -> Array:
@@ -620,7 +620,7 @@ def solve(x1: Array, x2: Array, /) -> Array:
         data type determined by :ref:`type-promotion`.
 
     """
-    return get_namespace(x1, x2).linalg.solve(x1, x2)
+    return get_namespace2(x1, x2).linalg.solve(x1, x2)
 
 
 def svd(
@@ -679,7 +679,7 @@ def svd(
         ``x``.
 
     """
-    return get_namespace(x).linalg.svd(x, full_matrices=full_matrices)
+    return get_namespace1(x).linalg.svd(x, full_matrices=full_matrices)
 
 
 def svdvals(x: Array, /) -> Array:
@@ -705,7 +705,7 @@ def svdvals(x: Array, /) -> Array:
         the same floating-point data type as ``x``.
 
     """
-    return get_namespace(x).linalg.svdvals(x)
+    return get_namespace1(x).linalg.svdvals(x)
 
 
 def tensordot(
@@ -716,7 +716,7 @@ def tensordot(
     axes: int | tuple[Sequence[int], Sequence[int]] = 2,
 ) -> Array:
     """Alias for :func:`~array_api.linear_algebra_functions.tensordot`."""
-    return get_namespace(x1, x2).linalg.tensordot(x1, x2, axes=axes)
+    return get_namespace2(x1, x2).linalg.tensordot(x1, x2, axes=axes)
 
 
 def trace(x: Array, /, *, offset: int = 0) -> Array:
@@ -754,13 +754,12 @@ def trace(x: Array, /, *, offset: int = 0) -> Array:
         The returned array must have the same data type as ``x``.
 
     """
-    return get_namespace(x).linalg.trace(x, offset=offset)
+    return get_namespace1(x).linalg.trace(x, offset=offset)
 
 
 def vecdot(x1: Array, x2: Array, /, *, axis: int = -1) -> Array:
     """Alias for :func:`~array_api.linear_algebra_functions.vecdot`."""
-    xp = get_namespace(x1, x2)
-    return xp.linalg.vecdot(x1, x2, axis=axis)
+    return get_namespace2(x1, x2).linalg.vecdot(x1, x2, axis=axis)
 
 
 def vector_norm(
@@ -837,7 +836,7 @@ def vector_norm(
         floating-point data type determined by :ref:`type-promotion`.
 
     """
-    return get_namespace(x).linalg.vector_norm(
+    return get_namespace1(x).linalg.vector_norm(
         x,
         axis=axis,
         keepdims=keepdims,
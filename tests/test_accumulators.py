@@ -0,0 +1,92 @@
+"""Tests of statistics accumulated over chunks of arrays."""
+
+from __future__ import annotations
+
+from itertools import pairwise
+from typing import Any
+
+import numpy as np
+import pytest
+
+import array_api as ap
+
+ACCUMULATORS = {
+    "all": ap.AllAccumulator,
+    "any": ap.AnyAccumulator,
+    "max": ap.MaxAccumulator,
+    "mean": ap.MeanAccumulator,
+    "min": ap.MinAccumulator,
+    "prod": ap.ProdAccumulator,
+    "std": ap.StdAccumulator,
+    "sum": ap.SumAccumulator,
+    "var": ap.VarAccumulator,
+}
+# Uneven chunks along the first axis, which every case reduces.
+BOUNDS = (0, 1, 6, 7, 20)
+
+
+def _cases() -> list[tuple[str, dict[str, Any]]]:
+    cases = []
+    for name in ACCUMULATORS:
+        for axis in (None, 0, (0, 2), (-1, 0)):
+            for keepdims in (False, True):
+                kwargs = {"axis": axis, "keepdims": keepdims}
+                cases.append((name, kwargs))
+                if name in {"var", "std"}:
+                    cases.append((name, {**kwargs, "correction": 1}))
+    return cases
+
+
+def _array(name: str) -> Any:  # noqa: ANN401
+    x = np.random.default_rng(0).normal(size=(20, 3, 4))
+    if name in {"all", "any"}:
+        return x > 1.5
+    if name == "prod":
+        return 1 + x / 10
+    return x
+
+
+@pytest.mark.parametrize(("name", "kwargs"), _cases())
+def test_chunks(name: str, kwargs: dict[str, Any]) -> None:
+    x = _array(name)
+    acc = ACCUMULATORS[name](**kwargs)
+    for start, stop in pairwise(BOUNDS):
+        acc.update(x[start:stop])
+    expected = getattr(ap, name)(x, **kwargs)
+    np.testing.assert_allclose(acc.result(), expected, rtol=1e-12)
+    assert acc.result().shape == expected.shape
+
+
+@pytest.mark.parametrize(("name", "kwargs"), _cases())
+def test_merge(name: str, kwargs: dict[str, Any]) -> None:
+    x = _array(name)
+    accs = [ACCUMULATORS[name](**kwargs) for _ in range(3)]
+    accs[0].update(x[:7])
+    accs[1].update(x[7:8]).update(x[8:])
+    # The last accumulator is empty, and merged both ways.
+    acc = accs[0].merge(accs[2]).merge(accs[1])
+    acc = accs[2].merge(acc)
+    np.testing.assert_allclose(
+        acc.result(), getattr(ap, name)(x, **kwargs), rtol=1e-12
+    )
+
+
+def test_single_chunk_is_exact() -> None:
+    x = _array("var")
+    for name in ("mean", "var", "std", "sum", "prod", "min", "max"):
+        acc = ACCUMULATORS[name](axis=1).update(x)
+        np.testing.assert_array_equal(
+            acc.result(), getattr(ap, name)(x, axis=1)
+        )
+
+
+def test_errors() -> None:
+    with pytest.raises(ValueError, match="not accumulated"):
+        ap.SumAccumulator().result()
+    with pytest.raises(ValueError, match="cannot merge"):
+        ap.VarAccumulator(correction=1).merge(ap.VarAccumulator())
+    acc = ap.SumAccumulator(axis=0).update(np.ones((2, 3)))
+    with pytest.raises(ValueError, match="dimensions"):
+        acc.update(np.ones(3))
+    with pytest.raises(ValueError, match="shape"):
+        acc.update(np.ones((2, 4)))
@@ -0,0 +1,89 @@
+"""Tests of the capabilities of namespaces, and of the wrappers using them."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+import array_api as ap
+from array_api._sorting_functions import _argsort, _sort
+
+
+class _Proxy:
+    """A proxy of NumPy, whose functions take any arguments."""
+
+    def __init__(self) -> None:
+        self.__wrapped__ = np
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        func = getattr(np, name)
+        return lambda *args, **kwargs: func(*args, **kwargs)
+
+
+def test_keywords() -> None:
+    caps = ap.capabilities(np)
+    assert caps.supports("sort", "axis", "stable")
+    assert not caps.supports("sort", "descending")
+    assert not caps.supports("no_such_function")
+
+
+def test_unknown_keywords_are_assumed_supported() -> None:
+    class Namespace:
+        @staticmethod
+        def sort(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            return np.sort(*args, **kwargs)
+
+    assert ap.capabilities(Namespace()).supports("sort", "descending")
+
+
+def test_proxy_has_the_capabilities_of_the_wrapped_namespace() -> None:
+    assert ap.capabilities(_Proxy()) is ap.capabilities(np)
+
+
+def test_sort_without_descending() -> None:
+    x = np.asarray([[3.0, 1.0, 2.0], [0.0, 5.0, 4.0]])
+    np.testing.assert_array_equal(ap.sort(x), np.sort(x))
+    np.testing.assert_array_equal(
+        ap.sort(x, axis=0, descending=True), np.sort(x, axis=0)[::-1]
+    )
+
+
+def test_argsort_without_descending_is_stable() -> None:
+    x = np.asarray([1, 3, 1, 2, 3])
+    np.testing.assert_array_equal(ap.argsort(x), [0, 2, 3, 1, 4])
+    np.testing.assert_array_equal(
+        ap.argsort(x, descending=True), [1, 4, 3, 0, 2]
+    )
+
+
+def test_argsort_while_recording() -> None:
+    x = np.asarray([1, 3, 1, 2, 3])
+    with ap.DispatchRecorder() as recorder:
+        indices = ap.argsort(x, descending=True)
+    np.testing.assert_array_equal(indices, [1, 4, 3, 0, 2])
+    assert recorder.as_dict()["argsort"]["calls"] == 1
+
+
+def test_sort_without_stable() -> None:
+    class Namespace:
+        flip = staticmethod(np.flip)
+
+        @staticmethod
+        def sort(x: Any, /, *, axis: int = -1) -> Any:  # noqa: ANN401
+            return np.sort(x, axis=axis)
+
+        @staticmethod
+        def argsort(x: Any, /, *, axis: int = -1) -> Any:  # noqa: ANN401
+            return np.argsort(x, axis=axis, kind="stable")
+
+    xp = Namespace()
+    caps = ap.capabilities(xp)
+    x = np.asarray([1, 3, 1, 2, 3])
+    np.testing.assert_array_equal(
+        _sort(xp, caps, x, -1, descending=True, stable=True), [3, 3, 2, 1, 1]
+    )
+    np.testing.assert_array_equal(
+        _argsort(xp, caps, x, -1, descending=True, stable=True),
+        [1, 4, 3, 0, 2],
+    )
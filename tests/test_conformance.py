@@ -0,0 +1,76 @@
+"""Tests of the protocol conformance checks."""
+
+from __future__ import annotations
+
+import ast
+import sys
+from importlib import import_module
+from pathlib import Path
+
+import pytest
+
+import array_api as ap
+from array_api._conformance import protocol_members
+
+SRC = Path(ap.__file__).parent
+
+
+def _protocols() -> list[type]:
+    """Return the protocols defined by the package."""
+    protocols: list[type] = []
+    for path in sorted(SRC.rglob("*.py")):
+        parts = path.relative_to(SRC.parent).with_suffix("").parts
+        module = import_module(".".join(p for p in parts if p != "__init__"))
+        protocols.extend(
+            obj
+            for obj in vars(module).values()
+            if isinstance(obj, type)
+            and obj.__module__ == module.__name__
+            and getattr(obj, "_is_protocol", False)
+        )
+    return protocols
+
+
+def _declared(proto: type) -> set[str]:
+    """Return the members declared in the source of ``proto`` and its bases."""
+    names: set[str] = set()
+    for cls in proto.__mro__:
+        if not cls.__module__.startswith("array_api."):
+            continue
+        # The source, also of modules compiled with mypyc.
+        module = sys.modules[cls.__module__]
+        path = Path(module.__file__ or "")
+        path = path.parent / f"{path.name.partition('.')[0]}.py"
+        tree = ast.parse(path.read_text())
+        body = next(
+            node.body
+            for node in ast.walk(tree)
+            if isinstance(node, ast.ClassDef) and node.name == cls.__name__
+        )
+        declared: set[str] = set()
+        for node in body:
+            if isinstance(node, ast.FunctionDef):
+                declared.add(node.name)
+            elif isinstance(node, ast.AnnAssign) and isinstance(
+                node.target, ast.Name
+            ):
+                declared.add(node.target.id)
+        # A class defining ``__eq__`` has a ``__hash__`` of None.
+        if "__eq__" in declared:
+            declared.add("__hash__")
+        names |= declared
+    return names
+
+
+PROTOCOLS = _protocols()
+
+
+def test_protocols_found() -> None:
+    assert ap.ArrayAPINamespace in PROTOCOLS
+    assert ap.Array in PROTOCOLS
+
+
+@pytest.mark.parametrize("proto", PROTOCOLS, ids=lambda p: p.__name__)
+def test_protocol_members(proto: type) -> None:
+    """The members are those declared, with or without mypyc."""
+    assert protocol_members(proto) == _declared(proto)
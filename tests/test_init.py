@@ -0,0 +1,45 @@
+"""Tests of the lazily imported names of the package."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from importlib import import_module
+
+import pytest
+
+import array_api as ap
+
+_PUBLIC_NAMES = (
+    "import array_api, json; "
+    "print(json.dumps([n for n in vars(array_api) if not n.startswith('_')]))"
+)
+
+
+@pytest.mark.parametrize("module", sorted(ap._SUBMODULE_ALL))  # noqa: SLF001
+def test_submodule_all(module: str) -> None:
+    names = ap._SUBMODULE_ALL[module]  # noqa: SLF001
+    assert len(set(names)) == len(names)
+    assert set(names) == set(import_module(f"array_api.{module}").__all__)
+
+
+def _public_names(*, eager: bool) -> set[str]:
+    env = {**os.environ, "ARRAYAPI_EAGER_IMPORT": "1" if eager else "0"}
+    out = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", _PUBLIC_NAMES],
+        env=env,
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return set(json.loads(out))
+
+
+def test_eager_import() -> None:
+    eager, lazy = _public_names(eager=True), _public_names(eager=False)
+    # Submodules, e.g. `linalg`, are set as they are imported.
+    submodules = ap._SUBMODULES  # noqa: SLF001
+    assert eager - lazy - submodules == set(ap.__all__)
+    assert all(hasattr(ap, name) for name in ap.__all__)
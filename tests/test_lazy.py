@@ -0,0 +1,69 @@
+"""Tests of deferred elementwise functions."""
+
+from __future__ import annotations
+
+from contextlib import nullcontext
+
+import numpy as np
+import pytest
+
+import array_api as ap
+from array_api import _lazy
+
+
+def test_mixed_with_arrays_while_recording() -> None:
+    x = np.arange(3.0)
+    with ap.DispatchRecorder() as recorder, ap.lazy():
+        y = ap.add(ap.multiply(x, 2.0), x)
+        out = ap.sum(y)
+    assert out == 9.0
+    assert recorder.as_dict()["sum"]["calls"] == 1
+
+
+def test_multiple_namespaces() -> None:
+    array_api_strict = pytest.importorskip("array_api_strict")
+    with ap.lazy():
+        y = ap.multiply(np.arange(3.0), 2.0)
+        with pytest.raises(ValueError, match="Multiple namespaces"):
+            ap.add(y, array_api_strict.asarray([1.0, 2.0, 3.0]))
+
+
+def test_array_copy() -> None:
+    x = np.arange(3.0)
+    with ap.lazy():
+        y = ap.multiply(x, 2.0)
+    value = y.compute()
+    assert np.asarray(y) is value
+    assert np.asarray(y, copy=False) is value
+    copied = np.asarray(y, copy=True)
+    assert copied is not value
+    np.testing.assert_array_equal(copied, value)
+    with pytest.raises(ValueError, match="copy"):
+        np.asarray(y, dtype=np.float32, copy=False)
+
+
+def test_out_check_cached_per_backend_function() -> None:
+    x = np.arange(3.0)
+    _lazy._accepts_out.cache_clear()  # noqa: SLF001
+    with ap.DispatchRecorder(), ap.lazy():
+        for _ in range(100):
+            ap.add(ap.multiply(x, 2.0), 1.0).compute()
+    assert _lazy._accepts_out.cache_info().currsize <= 2  # noqa: SLF001
+
+
+@pytest.mark.parametrize("module", ["numpy", "array_api_strict"])
+def test_recorded_like_eager(module: str) -> None:
+    xp = pytest.importorskip(module)
+    x, y, z = (xp.asarray([1.0, 2.0, 3.0]) for _ in range(3))
+
+    def run(*, deferred: bool) -> dict[str, int]:
+        # The recorder is started first, so that it records the evaluation
+        # rather than the deferral.
+        with (
+            ap.DispatchRecorder() as recorder,
+            ap.lazy() if deferred else nullcontext(),
+        ):
+            ap.sum(ap.add(ap.multiply(x, y), ap.exp(z)))
+        return {n: s["calls"] for n, s in recorder.as_dict().items()}
+
+    assert run(deferred=True) == run(deferred=False)
@@ -0,0 +1,102 @@
+"""Tests of arrays memory-mapped from files."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pytest
+
+import array_api as ap
+from array_api import _memmap
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from numpy.typing import NDArray
+
+NAMES = ("sum", "prod", "min", "max", "mean", "var", "std", "all", "any")
+AXES = (None, 0, 1, -1, (0, 2), (1, 2))
+
+
+@pytest.fixture
+def data(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> NDArray[Any]:
+    """An array in a file of many windows, with an uneven last one."""
+    monkeypatch.setattr(_memmap, "_WINDOW_BYTES", 1 << 10)
+    x = 1 + np.random.default_rng(0).normal(size=(50, 3, 5)) / 10
+    np.save(tmp_path / "x.npy", x)
+    return x
+
+
+@pytest.mark.parametrize("keepdims", [False, True])
+@pytest.mark.parametrize("axis", AXES)
+@pytest.mark.parametrize("name", NAMES)
+def test_reductions(
+    data: NDArray[Any],
+    tmp_path: Path,
+    name: str,
+    axis: int | tuple[int, ...] | None,
+    keepdims: bool,  # noqa: FBT001
+) -> None:
+    x = ap.open_memmap(tmp_path / "x.npy")
+    assert x.size * x.dtype.itemsize > _memmap._WINDOW_BYTES  # noqa: SLF001
+    if name in {"all", "any"}:
+        x, data = x > 1.1, data > 1.1
+    result = getattr(ap, name)(x, axis=axis, keepdims=keepdims)
+    expected = getattr(np, name)(data, axis=axis, keepdims=keepdims)
+    assert isinstance(result, ap.MemmapArray)
+    assert result.shape == expected.shape
+    np.testing.assert_allclose(np.asarray(result), expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize("name", ["var", "std"])
+def test_correction(data: NDArray[Any], tmp_path: Path, name: str) -> None:
+    x = ap.open_memmap(tmp_path / "x.npy")
+    for axis in (None, 0, 1):
+        np.testing.assert_allclose(
+            np.asarray(getattr(ap, name)(x, axis=axis, correction=1)),
+            getattr(np, name)(data, axis=axis, ddof=1),
+            rtol=1e-12,
+        )
+
+
+def test_elementwise(data: NDArray[Any], tmp_path: Path) -> None:
+    x = ap.open_memmap(tmp_path / "x.npy")
+    np.testing.assert_allclose(np.asarray(ap.exp(x)), np.exp(data))
+    np.testing.assert_allclose(
+        np.asarray(ap.logaddexp(x, x[0])), np.logaddexp(data, data[0])
+    )
+    np.testing.assert_allclose(np.asarray(x * 2 - x), data)
+
+
+@pytest.mark.parametrize("axis", [0, -1])
+def test_sort_descending(data: NDArray[Any], tmp_path: Path, axis: int) -> None:
+    data = np.round(data, decimals=1)  # with ties
+    np.save(tmp_path / "ties.npy", data)
+    x = ap.open_memmap(tmp_path / "ties.npy")
+    expected = np.flip(np.sort(data, axis=axis), axis=axis)
+    result = ap.sort(x, axis=axis, descending=True)
+    np.testing.assert_array_equal(np.asarray(result), expected)
+    indices = np.asarray(ap.argsort(x, axis=axis, descending=True))
+    np.testing.assert_array_equal(
+        np.take_along_axis(data, indices, axis=axis), expected
+    )
+    # Equal elements keep their order.
+    stable = np.argsort(-data, axis=axis, stable=True)
+    np.testing.assert_array_equal(indices, stable)
+
+
+def test_array_copy(data: NDArray[Any], tmp_path: Path) -> None:
+    x = ap.open_memmap(tmp_path / "x.npy", mode="c")
+    assert np.shares_memory(np.asarray(x), x._data)  # noqa: SLF001
+    assert not np.shares_memory(np.array(x, copy=True), x._data)  # noqa: SLF001
+    np.testing.assert_array_equal(np.array(x, copy=True), data)
+    with pytest.raises(ValueError, match="copy"):
+        np.array(x, dtype=np.float32, copy=False)
+
+
+def test_validate_namespace() -> None:
+    x = ap.MemmapArray(np.zeros(3))
+    report = ap.validate_namespace(x.__array_namespace__())
+    assert report.conforms, report
+    assert report.linalg_missing == frozenset()
@@ -0,0 +1,104 @@
+"""Tests of reductions split into threads."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pytest
+
+import array_api as ap
+from array_api import _parallel
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+NAMES = ("sum", "prod", "min", "max", "mean", "var", "std", "all", "any")
+# The shapes, and axes of each, cover splits along kept and reduced axes.
+CASES = [
+    ((40, 30), None),
+    ((40, 30), 0),
+    ((40, 30), 1),
+    ((40, 30), -1),
+    ((3, 200), 1),
+    ((6, 5, 8), (0, 2)),
+    ((6, 5, 8), (1,)),
+]
+
+
+def _array(name: str, shape: tuple[int, ...]) -> Any:  # noqa: ANN401
+    x = np.random.default_rng(0).normal(size=shape)
+    if name in {"all", "any"}:
+        return x > 1
+    if name == "prod":
+        return 1 + x / 100
+    return x
+
+
+@pytest.fixture
+def splits(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """Record the axes along which inputs are split."""
+    axes: list[int] = []
+    split: Callable[..., Any] = _parallel._split  # noqa: SLF001
+
+    def spy(x: Any, axis: int, n: int) -> Any:  # noqa: ANN401
+        axes.append(axis)
+        return split(x, axis, n)
+
+    monkeypatch.setattr(_parallel, "_split", spy)
+    return axes
+
+
+@pytest.mark.parametrize("keepdims", [False, True])
+@pytest.mark.parametrize(("shape", "axis"), CASES)
+@pytest.mark.parametrize("name", NAMES)
+def test_like_serial(
+    name: str,
+    shape: tuple[int, ...],
+    axis: int | tuple[int, ...] | None,
+    keepdims: bool,  # noqa: FBT001
+    splits: list[int],
+) -> None:
+    x = _array(name, shape)
+    func = getattr(ap, name)
+    expected = func(x, axis=axis, keepdims=keepdims)
+    with ap.parallel_reductions(4, min_size=100):
+        result = func(x, axis=axis, keepdims=keepdims)
+    assert len(splits) == 1
+    assert result.shape == expected.shape
+    assert result.dtype == expected.dtype
+    np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize("name", ["var", "std"])
+def test_correction(name: str, splits: list[int]) -> None:
+    x = _array(name, (40, 30))
+    func = getattr(ap, name)
+    for axis in (None, 0, 1):
+        with ap.parallel_reductions(4, min_size=100):
+            result = func(x, axis=axis, correction=1)
+        np.testing.assert_allclose(
+            result, func(x, axis=axis, correction=1), rtol=1e-12
+        )
+    assert len(splits) == 3
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_below_threshold(name: str, splits: list[int]) -> None:
+    x = _array(name, (40, 30))
+    func = getattr(ap, name)
+    expected = func(x, axis=0), func(x)
+    with ap.parallel_reductions(4, min_size=x.size + 1):
+        np.testing.assert_array_equal(func(x, axis=0), expected[0])
+        np.testing.assert_array_equal(func(x), expected[1])
+    with ap.parallel_reductions(1, min_size=1):
+        np.testing.assert_array_equal(func(x), expected[1])
+    assert splits == []
+
+
+def test_scope_is_restored(splits: list[int]) -> None:
+    x = _array("sum", (40, 30))
+    with ap.parallel_reductions(4, min_size=100):
+        ap.sum(x)
+    ap.sum(x)
+    assert len(splits) == 1
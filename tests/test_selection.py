@@ -0,0 +1,78 @@
+"""Tests of partial sorts and searches of sorted arrays."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+import array_api as ap
+from array_api import _capabilities, _selection
+
+
+class _WithoutGather:
+    """NumPy, without its partitions and gathers, so that sorts are used."""
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        if name in {"argpartition", "partition", "take", "take_along_axis"}:
+            raise AttributeError(name)
+        return getattr(np, name)
+
+
+def test_fallbacks_without_descending() -> None:
+    xp = _WithoutGather()
+    x = np.asarray([[3.0, 1.0, 4.0, 1.0, 5.0], [9.0, 2.0, 6.0, 5.0, 3.0]])
+    values, indices = _selection.topk(xp, x, 2, -1, descending=True)
+    np.testing.assert_array_equal(values, [[5.0, 4.0], [9.0, 6.0]])
+    np.testing.assert_array_equal(indices, [[4, 2], [0, 2]])
+
+    out = _selection.partition(xp, x, 1, 0, descending=True)
+    np.testing.assert_array_equal(out, np.sort(x, axis=0)[::-1])
+
+
+def test_deferred_arrays() -> None:
+    x = np.random.default_rng(0).random((3, 100))
+    expected = np.sort(2 * x, axis=1)[:, ::-1]
+    with ap.lazy():
+        y = ap.multiply(x, 2.0)
+        values, indices = ap.topk(y, 3)
+        partitioned = ap.partition(y, 10, descending=True)
+        order = ap.argpartition(y, 10)
+    np.testing.assert_array_equal(values, expected[:, :3])
+    np.testing.assert_array_equal(np.take_along_axis(2 * x, indices, 1), values)
+    np.testing.assert_array_equal(partitioned[:, 10], expected[:, 10])
+    np.testing.assert_array_equal(
+        np.take_along_axis(2 * x, order, 1)[:, 10], expected[:, -11]
+    )
+
+
+def test_recorded() -> None:
+    x = np.random.default_rng(0).random((3, 100))
+    with ap.DispatchRecorder() as recorder:
+        values, _ = ap.topk(x, 3)
+        ap.topk(x, 3, descending=False)
+        ap.partition(x, 10)
+        ap.argpartition(x, 10, descending=True)
+    np.testing.assert_array_equal(values, np.sort(x, axis=1)[:, :-4:-1])
+    calls = {name: s["calls"] for name, s in recorder.as_dict().items()}
+    assert calls == {"topk": 2, "partition": 1, "argpartition": 1}
+
+
+def test_capabilities_of_proxies_are_those_of_the_namespace() -> None:
+    x = np.random.default_rng(0).random(100)
+    _capabilities.clear_capabilities_cache()
+    with ap.DispatchRecorder(), ap.lazy():
+        for _ in range(3):
+            ap.topk(x, 3)
+    assert list(_capabilities._capabilities_cache) == [id(np)]  # noqa: SLF001
+
+
+def test_searchsorted_deferred_and_recorded() -> None:
+    rng = np.random.default_rng(0)
+    edges, x = np.sort(rng.random((4, 10)), axis=1), rng.random((4, 5))
+    with ap.DispatchRecorder() as recorder, ap.lazy():
+        out = ap.searchsorted(ap.multiply(edges, 1.0), x, side="right")
+    for row, e, v in zip(out, edges, x, strict=True):
+        np.testing.assert_array_equal(row, np.searchsorted(e, v, "right"))
+    assert recorder.as_dict()["searchsorted"]["calls"] == 1
+    assert set(recorder.as_dict()) == {"multiply", "searchsorted"}
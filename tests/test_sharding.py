@@ -0,0 +1,101 @@
+"""Tests of elementwise functions sharded over processes."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import textwrap
+from typing import Any
+
+import numpy as np
+import pytest
+
+import array_api as ap
+from array_api import _sharding
+
+# A leading axis that no number of shards below divides.
+SHAPE = (11, 5)
+
+
+@pytest.fixture
+def shards(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """Record the number of shards of each call."""
+    calls: list[int] = []
+    map_shards = _sharding._map_shards  # noqa: SLF001
+
+    def spy(*args: Any) -> Any:  # noqa: ANN401
+        calls.append(args[3])  # max_workers
+        return map_shards(*args)
+
+    monkeypatch.setattr(_sharding, "_map_shards", spy)
+    return calls
+
+
+@pytest.mark.parametrize("max_workers", [2, 3])
+def test_exp(max_workers: int, shards: list[int]) -> None:
+    x = np.random.default_rng(0).normal(size=SHAPE)
+    with ap.sharded_elementwise(max_workers, min_size=1):
+        result = ap.exp(x)
+    assert shards == [max_workers]
+    assert result.dtype == x.dtype
+    np.testing.assert_array_equal(result, ap.exp(x))
+
+
+@pytest.mark.parametrize("max_workers", [2, 3])
+def test_logaddexp(max_workers: int, shards: list[int]) -> None:
+    rng = np.random.default_rng(0)
+    x1 = rng.normal(size=SHAPE)
+    x2 = rng.normal(size=SHAPE[1:]).astype(np.float32)
+    with ap.sharded_elementwise(max_workers, min_size=1):
+        result = ap.logaddexp(x1, x2)
+        broadcast = ap.logaddexp(x1[:1], x1)
+    assert shards == [max_workers, max_workers]
+    np.testing.assert_array_equal(result, ap.logaddexp(x1, x2))
+    np.testing.assert_array_equal(broadcast, ap.logaddexp(x1[:1], x1))
+
+
+def test_below_threshold(shards: list[int]) -> None:
+    x = np.linspace(0, 1, 10)
+    with ap.sharded_elementwise(2, min_size=x.size + 1):
+        np.testing.assert_array_equal(ap.exp(x), np.exp(x))
+    with ap.sharded_elementwise(1, min_size=1):
+        np.testing.assert_array_equal(ap.exp(x), np.exp(x))
+    assert shards == []
+
+
+def test_pool_is_reused() -> None:
+    x = np.linspace(0, 1, 10)
+    with ap.sharded_elementwise(2, min_size=1):
+        ap.exp(x)
+        executor = _sharding._executors[2]  # noqa: SLF001
+        processes = set(executor._processes)  # noqa: SLF001
+        ap.exp(x)
+        ap.logaddexp(x, x)
+    assert _sharding._executors[2] is executor  # noqa: SLF001
+    assert set(executor._processes) == processes  # noqa: SLF001
+
+
+def test_exit() -> None:
+    """The workers, and the shared memory, are released at exit."""
+    code = textwrap.dedent(
+        """
+        import numpy as np
+        import array_api as ap
+
+        x = np.linspace(0, 1, 10)
+        with ap.sharded_elementwise(2, min_size=1):
+            y = ap.exp(x)
+        np.testing.assert_array_equal(y, np.exp(x))
+        print("done")
+        """
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout == "done\n"
+    assert result.stderr == ""
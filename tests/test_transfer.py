@@ -0,0 +1,126 @@
+"""Tests of the transfer of arrays between devices."""
+
+from __future__ import annotations
+
+import sys
+import threading
+from typing import Any, ClassVar
+
+import numpy as np
+import pytest
+
+import array_api as ap
+from array_api import _transfer
+
+
+class StandInDevice:
+    """A CPU device, standing in for e.g. a GPU."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, StandInDevice) and other.name == self.name
+
+    __hash__ = None  # devices need not be hashable
+
+
+class StandInArray:
+    """A NumPy array on a `StandInDevice`, which records its copies."""
+
+    # (index, source device, target device, stream, thread) of each copy.
+    copies: ClassVar[list[tuple[int, str, str, Any, int]]] = []
+
+    def __init__(self, index: int, device: StandInDevice) -> None:
+        self.index = index
+        self.array = np.full(3, index)
+        self.device = device
+
+    def __array_namespace__(
+        self, *, api_version: str | None = None
+    ) -> Any:  # noqa: ANN401
+        return sys.modules[__name__]
+
+    def to_device(
+        self,
+        device: StandInDevice,
+        /,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> StandInArray:
+        self.copies.append(
+            (
+                self.index,
+                self.device.name,
+                device.name,
+                kwargs,
+                threading.get_ident(),
+            )
+        )
+        return StandInArray(self.index, device)
+
+
+@pytest.fixture(autouse=True)
+def _clear_copies() -> None:
+    StandInArray.copies.clear()
+
+
+def _arrays(*devices: str) -> list[StandInArray]:
+    return [StandInArray(i, StandInDevice(d)) for i, d in enumerate(devices)]
+
+
+def test_empty() -> None:
+    assert ap.to_device_many([], StandInDevice("cpu")) == []
+
+
+def test_order() -> None:
+    arrays = _arrays("gpu:0", "gpu:1", "cpu", "gpu:0", "gpu:1")
+    out = ap.to_device_many(iter(arrays), StandInDevice("cpu"))
+    assert [x.index for x in out] == [0, 1, 2, 3, 4]
+    assert all(x.device == StandInDevice("cpu") for x in out)
+
+
+def test_same_device_is_not_copied() -> None:
+    arrays = _arrays("cpu", "gpu:0", "cpu")
+    out = ap.to_device_many(arrays, StandInDevice("cpu"))
+    assert out[0] is arrays[0]
+    assert out[2] is arrays[2]
+    assert [c[0] for c in StandInArray.copies] == [1]
+
+
+def test_grouped_by_device() -> None:
+    arrays = _arrays("gpu:0", "gpu:1", "gpu:0", "gpu:1", "gpu:0")
+    ap.to_device_many(arrays, StandInDevice("cpu"))
+    for source, indices in (("gpu:0", [0, 2, 4]), ("gpu:1", [1, 3])):
+        copies = [c for c in StandInArray.copies if c[1] == source]
+        # Each device's arrays are copied in turn, in one thread.
+        assert [c[0] for c in copies] == indices
+        assert len({c[4] for c in copies}) == 1
+
+
+def test_stream() -> None:
+    arrays = _arrays("gpu:0", "gpu:1")
+    ap.to_device_many(arrays, StandInDevice("cpu"), stream=7)
+    assert [c[3] for c in StandInArray.copies] == [{"stream": 7}] * 2
+
+    StandInArray.copies.clear()
+    ap.to_device_many(arrays, StandInDevice("cpu"))
+    assert [c[3] for c in StandInArray.copies] == [{}, {}]
+
+
+def test_mixed_namespaces() -> None:
+    arrays = [*_arrays("gpu:0"), np.zeros(3)]
+    with pytest.raises(ValueError, match="namespace"):
+        ap.to_device_many(arrays, StandInDevice("cpu"))
+    assert StandInArray.copies == []
+
+
+def test_threads_are_reused() -> None:
+    arrays = _arrays("gpu:0", "gpu:1", "gpu:2")
+    threads = set()
+    for _ in range(3):
+        StandInArray.copies.clear()
+        ap.to_device_many(arrays, StandInDevice("cpu"))
+        threads |= {c[4] for c in StandInArray.copies}
+    executor = _transfer._executor  # noqa: SLF001
+    assert executor is not None
+    assert threads <= {t.ident for t in executor._threads}  # noqa: SLF001
@@ -0,0 +1,65 @@
+"""Tests of functions mapped over nested containers of arrays."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import numpy as np
+import pytest
+
+import array_api as ap
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class Pair(NamedTuple):
+    first: object
+    second: object
+
+
+def test_tree_map() -> None:
+    x, y = np.arange(3.0), np.ones(3)
+    out = ap.tree_map(
+        ap.add,
+        {"w": x, "b": Pair(x, [y, None])},
+        {"w": y, "b": Pair(y, [x, None])},
+    )
+    assert list(out) == ["w", "b"]
+    assert type(out["b"]) is Pair
+    assert out["b"].second[1] is None
+    for leaf in (out["w"], out["b"].first, out["b"].second[0]):
+        np.testing.assert_array_equal(leaf, x + y)
+
+
+def test_dict_key_order() -> None:
+    x, y = np.arange(3.0), np.ones(3)
+    out = ap.tree_map(ap.subtract, {"a": x, "b": [x, y]}, {"b": [y, x], "a": y})
+    assert list(out) == ["a", "b"]
+    np.testing.assert_array_equal(out["a"], x - y)
+    np.testing.assert_array_equal(out["b"][0], x - y)
+    np.testing.assert_array_equal(out["b"][1], y - x)
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        {"a": np.ones(3), "c": np.ones(3)},
+        {"a": np.ones(3)},
+        {"a": np.ones(3), "b": (np.ones(3),)},
+        {"a": [np.ones(3)], "b": np.ones(3)},
+        [np.ones(3), np.ones(3)],
+    ],
+)
+def test_different_structure(other: object) -> None:
+    tree = {"b": np.ones(3), "a": np.ones(3)}
+    with pytest.raises(ValueError, match="different structure"):
+        ap.tree_map(ap.add, tree, other)
+
+
+@pytest.mark.parametrize("func", [ap.argsort, ap.sort, ap.exp])
+def test_like_calls_per_leaf(func: Callable[..., Any]) -> None:
+    rng = np.random.default_rng(0)
+    leaves = [rng.integers(0, 3, 5000).astype(float) for _ in range(2)]
+    for out, leaf in zip(ap.tree_map(func, leaves), leaves, strict=True):
+        np.testing.assert_array_equal(out, func(leaf))
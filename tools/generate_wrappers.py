@@ -0,0 +1,259 @@
+# ruff: noqa: INP001
+"""
+Generate the wrappers and namespace protocols from ``wrapper_specs.py``.
+
+The signature and body of each wrapper, and the ``@staticmethod`` stub of each
+function in the namespace protocols, are rewritten from the specs. Docstrings
+are written by hand and are kept as they are, as are the wrappers listed in
+the ``_HANDWRITTEN`` of their module, whose protocol stubs are still generated.
+The generated code is checked in, so that mypyc and type checkers see ordinary
+functions.
+
+Usage::
+
+    python tools/generate_wrappers.py          # rewrite the modules
+    python tools/generate_wrappers.py --check  # fail if they are out of date
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import sys
+from pathlib import Path
+
+import black
+from wrapper_specs import MODULES, Module, Spec
+
+SRC = Path(__file__).parents[1] / "src" / "array_api"
+MODE = black.Mode(line_length=80)
+
+
+def dispatch(spec: Spec) -> str:
+    """
+    Return the call getting the namespace of a spec.
+
+    The specialized ``get_namespace1`` and ``get_namespace2`` are used for one
+    and two arrays, which avoids packing the arguments into a tuple.
+    """
+    arrays = ", ".join(spec.arrays)
+    variadic = any(a.startswith("*") for a in spec.arrays)
+    if not variadic and len(spec.arrays) in (1, 2):
+        return f"get_namespace{len(spec.arrays)}({arrays})"
+    return f"get_namespace({arrays})"
+
+
+def call(spec: Spec, attribute: str | None, *, exploded: bool) -> str:
+    """
+    Return the call of the namespace function of a spec.
+
+    Positional-only parameters are passed positionally and variadic ones are
+    unpacked. All others are passed by keyword, which does not repack them.
+    """
+    func = ast.parse(f"def f({spec.params}): pass").body[0]
+    assert isinstance(func, ast.FunctionDef)  # noqa: S101
+    args = func.args
+    passed = [a.arg for a in args.posonlyargs]
+    passed += [f"{a.arg}={a.arg}" for a in args.args]
+    if args.vararg is not None:
+        passed.append(f"*{args.vararg.arg}")
+    passed += [f"{a.arg}={a.arg}" for a in args.kwonlyargs]
+    name = spec.name if attribute is None else f"{attribute}.{spec.name}"
+    comma = "," if exploded else ""
+    return f"{dispatch(spec)}.{name}({', '.join(passed)}{comma})"
+
+
+def signature(spec: Spec, *, exploded: bool) -> str:
+    """Return the ``def`` line of a spec, without the trailing colon."""
+    comma = "," if exploded else ""
+    return f"def {spec.name}({spec.params}{comma}) -> {spec.returns}"
+
+
+# Black puts each argument on its own line if there is a trailing comma after
+# the last one. Whether there is one is left to the authors of the modules, so
+# the generated code keeps whatever the existing code has.
+
+
+def _exploded(source: str, nodes: list[ast.AST]) -> bool:
+    """Check for a trailing comma after the last of ``nodes``."""
+    last = max(nodes, key=lambda n: (n.end_lineno, n.end_col_offset))
+    lines = source.splitlines(keepends=True)
+    line, col = last.end_lineno, last.end_col_offset
+    assert line is not None  # noqa: S101
+    assert col is not None  # noqa: S101
+    rest = lines[line - 1][col:] + "".join(lines[line:])
+    # Up to the closing parenthesis, skipping the marker of positional-only
+    # parameters, which follows the last of them.
+    rest = "".join(rest[: rest.index(")")].split()).replace(",/", "")
+    return rest == ","
+
+
+def _exploded_signature(source: str, node: ast.FunctionDef) -> bool:
+    args = node.args
+    return _exploded(
+        source,
+        [
+            *args.posonlyargs,
+            *args.args,
+            *filter(None, (args.vararg,)),
+            *args.kwonlyargs,
+            *args.defaults,
+            *filter(None, args.kw_defaults),
+        ],
+    )
+
+
+def _exploded_call(source: str, node: ast.FunctionDef) -> bool:
+    ret = node.body[-1]
+    if not (isinstance(ret, ast.Return) and isinstance(ret.value, ast.Call)):
+        return False
+    return _exploded(source, [*ret.value.args, *ret.value.keywords])
+
+
+def _docstring(lines: list[str], node: ast.FunctionDef, path: Path) -> str:
+    if ast.get_docstring(node) is None:
+        msg = f"{path}: {node.name} has no docstring"
+        raise LookupError(msg)
+    doc = node.body[0]
+    return "".join(lines[doc.lineno - 1 : doc.end_lineno]).rstrip("\n")
+
+
+def _check_names(
+    path: Path, kind: str, found: set[str], specified: set[str]
+) -> None:
+    if unknown := found - specified:
+        msg = f"{path}: {kind}s without a spec: {sorted(unknown)}"
+        raise LookupError(msg)
+    if missing := specified - found:
+        msg = f"{path}: specs without a {kind}: {sorted(missing)}"
+        raise LookupError(msg)
+
+
+def _replace(lines: list[str], spans: list[tuple[int, int, str]]) -> str:
+    """Replace the 1-indexed, inclusive line spans of ``lines``."""
+    for start, end, text in sorted(spans, reverse=True):
+        lines[start - 1 : end] = [text]
+    return "".join(lines)
+
+
+def _handwritten(tree: ast.Module) -> set[str]:
+    """Return the names in the ``_HANDWRITTEN`` of a module, if it has one."""
+    for node in tree.body:
+        if (
+            isinstance(node, ast.AnnAssign)
+            and isinstance(node.target, ast.Name)
+            and node.target.id == "_HANDWRITTEN"
+            and node.value is not None
+        ):
+            return set(ast.literal_eval(node.value))
+    return set()
+
+
+def generate_wrappers(module: Module, source: str, path: Path) -> str:
+    """Return ``source`` with the wrappers of ``module`` generated."""
+    lines = source.splitlines(keepends=True)
+    tree = ast.parse(source)
+    handwritten = _handwritten(tree)
+    functions = {
+        n.name: n
+        for n in tree.body
+        if isinstance(n, ast.FunctionDef)
+        and not n.name.startswith("_")
+        and n.name not in handwritten
+    }
+    specs = {
+        s.name: s
+        for s in module.specs
+        if s.arrays and s.name not in handwritten
+    }
+    _check_names(path, "function", set(functions), set(specs))
+
+    spans = []
+    for name, node in functions.items():
+        spec = specs[name]
+        sig = signature(spec, exploded=_exploded_signature(source, node))
+        body = call(
+            spec, module.attribute, exploded=_exploded_call(source, node)
+        )
+        text = f"{sig}:\n{_docstring(lines, node, path)}\n    return {body}\n"
+        assert node.end_lineno is not None  # noqa: S101
+        spans.append((node.lineno, node.end_lineno, text))
+    return _replace(lines, spans)
+
+
+def generate_protocol(module: Module, source: str, path: Path) -> str:
+    """Return ``source`` with the protocol stubs of ``module`` generated."""
+    lines = source.splitlines(keepends=True)
+    for protocol in ast.parse(source).body:
+        if (
+            isinstance(protocol, ast.ClassDef)
+            and protocol.name == module.protocol
+        ):
+            break
+    else:
+        msg = f"{path}: no protocol {module.protocol}"
+        raise LookupError(msg)
+
+    stubs = {
+        n.name: n
+        for n in protocol.body
+        if isinstance(n, ast.FunctionDef)
+        and any(
+            isinstance(d, ast.Name) and d.id == "staticmethod"
+            for d in n.decorator_list
+        )
+    }
+    specs = {s.name: s for s in module.specs}
+    _check_names(path, "stub", set(stubs), set(specs))
+
+    spans = []
+    for name, node in stubs.items():
+        sig = signature(specs[name], exploded=_exploded_signature(source, node))
+        text = f"    @staticmethod\n    {sig}: ...\n"
+        assert node.end_lineno is not None  # noqa: S101
+        spans.append((node.decorator_list[0].lineno, node.end_lineno, text))
+    return _replace(lines, spans)
+
+
+def generate() -> dict[Path, str]:
+    """Return the generated source of each module."""
+    sources: dict[Path, str] = {}
+    for module in MODULES:
+        path = SRC / module.path
+        source = sources.get(path) or path.read_text()
+        sources[path] = generate_wrappers(module, source, path)
+
+        path = SRC / (module.protocol_path or module.path)
+        source = sources.get(path) or path.read_text()
+        sources[path] = generate_protocol(module, source, path)
+    return {
+        path: black.format_str(source, mode=MODE)
+        for path, source in sources.items()
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Generate the wrappers, or check that they are up to date."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="fail if a module is out of date, without rewriting it",
+    )
+    check = parser.parse_args(argv).check
+
+    stale = []
+    for path, source in generate().items():
+        if path.read_text() != source:
+            stale.append(path)
+            if not check:
+                path.write_text(source)
+
+    for path in stale:
+        verb = "out of date" if check else "regenerated"
+        print(f"{path.relative_to(SRC.parents[1])}: {verb}")  # noqa: T201
+    return int(check and bool(stale))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,397 @@
+# ruff: noqa: INP001
+"""
+The functions of the array API standard, from which the wrappers are made.
+
+Each function is specified by its parameters and return annotation, as they
+appear in a ``def``, and by the parameters whose namespace it dispatches on.
+Functions that do not dispatch, e.g. ``arange``, only appear in the namespace
+protocols. See ``generate_wrappers.py``.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+
+class Spec(NamedTuple):
+    """The specification of a function."""
+
+    name: str
+    params: str
+    returns: str = "Array"
+    # The parameters to dispatch on. Empty for functions without a wrapper.
+    # A leading ``*`` unpacks a variadic or sequence parameter.
+    arrays: tuple[str, ...] = ("x",)
+
+
+class Module(NamedTuple):
+    """A module of wrappers and the protocol with their signatures."""
+
+    path: str  # relative to ``src/array_api``
+    protocol: str
+    specs: tuple[Spec, ...]
+    protocol_path: str | None = None  # if not ``path``
+    attribute: str | None = None  # of the namespace holding the functions
+
+
+def unary(name: str) -> Spec:
+    """Specify an elementwise function of one array."""
+    return Spec(name, "x: Array, /")
+
+
+def binary(name: str) -> Spec:
+    """Specify an elementwise function of two arrays or Python scalars."""
+    return Spec(
+        name,
+        "x1: Array | PyScalar, x2: Array | PyScalar, /",
+        arrays=("x1", "x2"),
+    )
+
+
+_LIKE = (
+    "x: Array, /, *, dtype: DType | None = None, device: Device | None = None"
+)
+_CREATION = "*, dtype: DType | None = None, device: Device | None = None"
+_REDUCTION = "x: Array, /, *, axis: AxisT = None, keepdims: bool = False"
+_SORT = (
+    "x: Array, /, *, axis: int = -1, descending: bool = False, "
+    "stable: bool = True"
+)
+_AXES = "axes: int | tuple[Sequence[int], Sequence[int]] = 2"
+
+MODULES = (
+    Module(
+        "_creation_functions.py",
+        "HasCreationFunctions",
+        (
+            Spec(
+                "arange",
+                "start: float, /, stop: float | None = None, step: float = 1, "
+                + _CREATION,
+                arrays=(),
+            ),
+            Spec(
+                "asarray",
+                "obj: Array | bool | float | NestedSequence[bool | float] "
+                "| SupportsBufferProtocol, /, "
+                + _CREATION
+                + ", copy: bool | None = None",
+                arrays=(),
+            ),
+            Spec("empty_like", _LIKE),
+            Spec(
+                "eye",
+                "n_rows: int, n_cols: int | None = None, /, *, k: int = 0, "
+                "dtype: DType | None = None, device: Device | None = None",
+                arrays=(),
+            ),
+            Spec("from_dlpack", "x: object, /", arrays=()),
+            Spec(
+                "full",
+                "shape: int | tuple[int, ...], fill_value: float, " + _CREATION,
+                arrays=(),
+            ),
+            Spec(
+                "full_like",
+                "x: Array, /, fill_value: float, " + _CREATION,
+            ),
+            Spec(
+                "linspace",
+                "start: float, stop: float, /, num: int, "
+                + _CREATION
+                + ", endpoint: bool = True",
+                arrays=(),
+            ),
+            Spec(
+                "meshgrid",
+                "*arrays: Array, indexing: str = 'xy'",
+                "list[Array]",
+                arrays=("*arrays",),
+            ),
+            Spec(
+                "ones", "shape: int | tuple[int, ...], " + _CREATION, arrays=()
+            ),
+            Spec("ones_like", _LIKE),
+            Spec("tril", "x: Array, /, *, k: int = 0"),
+            Spec("triu", "x: Array, /, *, k: int = 0"),
+            Spec(
+                "zeros", "shape: int | tuple[int, ...], " + _CREATION, arrays=()
+            ),
+            Spec("zeros_like", _LIKE),
+        ),
+    ),
+    Module(
+        "_data_type_functions.py",
+        "HasDataTypeFunctions",
+        (
+            Spec("astype", "x: Array, dtype: DType, /, *, copy: bool = True"),
+            Spec(
+                "broadcast_arrays",
+                "*arrays: Array",
+                "list[Array]",
+                arrays=("*arrays",),
+            ),
+            Spec("broadcast_to", "x: Array, /, shape: tuple[int, ...]"),
+            Spec("can_cast", "from_: DType | Array, to: DType, /", "bool", ()),
+            Spec("finfo", "type: DType | Array, /", "finfo_object", ()),
+            Spec("iinfo", "type: DType | Array, /", "iinfo_object", ()),
+            Spec(
+                "result_type", "*arrays_and_dtypes: Array | DType", "DType", ()
+            ),
+        ),
+    ),
+    Module(
+        "_elementwise_functions.py",
+        "HasElementwiseFunctions",
+        (
+            unary("abs"),
+            unary("acos"),
+            unary("acosh"),
+            binary("add"),
+            unary("asin"),
+            unary("asinh"),
+            unary("atan"),
+            binary("atan2"),
+            unary("atanh"),
+            binary("bitwise_and"),
+            binary("bitwise_left_shift"),
+            unary("bitwise_invert"),
+            binary("bitwise_or"),
+            binary("bitwise_right_shift"),
+            binary("bitwise_xor"),
+            unary("ceil"),
+            unary("cos"),
+            unary("cosh"),
+            binary("divide"),
+            binary("equal"),
+            unary("exp"),
+            unary("expm1"),
+            unary("floor"),
+            binary("floor_divide"),
+            binary("greater"),
+            binary("greater_equal"),
+            unary("isfinite"),
+            unary("isinf"),
+            unary("isnan"),
+            binary("less"),
+            binary("less_equal"),
+            unary("log"),
+            unary("log1p"),
+            unary("log2"),
+            unary("log10"),
+            binary("logaddexp"),
+            binary("logical_and"),
+            unary("logical_not"),
+            binary("logical_or"),
+            binary("logical_xor"),
+            binary("multiply"),
+            unary("negative"),
+            binary("not_equal"),
+            unary("positive"),
+            binary("pow"),
+            binary("remainder"),
+            unary("round"),
+            unary("sign"),
+            unary("sin"),
+            unary("sinh"),
+            unary("square"),
+            unary("sqrt"),
+            binary("subtract"),
+            unary("tan"),
+            unary("tanh"),
+            unary("trunc"),
+        ),
+    ),
+    Module(
+        "_linear_algebra_functions.py",
+        "HasLinearAlgebraFunctions",
+        (
+            Spec("matmul", "x1: Array, x2: Array, /", arrays=("x1", "x2")),
+            Spec("matrix_transpose", "x: Array, /"),
+            Spec(
+                "tensordot",
+                "x1: Array, x2: Array, /, *, " + _AXES,
+                arrays=("x1", "x2"),
+            ),
+            Spec(
+                "vecdot",
+                "x1: Array, x2: Array, /, *, axis: int = -1",
+                arrays=("x1", "x2"),
+            ),
+        ),
+    ),
+    Module(
+        "_manipulation_functions.py",
+        "HasManipulationFunctions",
+        (
+            Spec(
+                "concat",
+                "arrays: tuple[Array, ...] | list[Array], /, *, "
+                "axis: int | None = 0",
+                arrays=("*arrays",),
+            ),
+            Spec("expand_dims", "x: Array, /, *, axis: int = 0"),
+            Spec("flip", "x: Array, /, *, axis: AxisT = None"),
+            Spec("permute_dims", "x: Array, /, axes: tuple[int, ...]"),
+            Spec(
+                "reshape",
+                "x: Array, /, shape: tuple[int, ...], *, "
+                "copy: bool | None = None",
+            ),
+            Spec(
+                "roll",
+                "x: Array, /, shift: int | tuple[int, ...], *, "
+                "axis: AxisT = None",
+            ),
+            Spec("squeeze", "x: Array, /, axis: int | tuple[int, ...]"),
+            Spec(
+                "stack",
+                "arrays: tuple[Array, ...] | list[Array], /, *, axis: int = 0",
+                arrays=("*arrays",),
+            ),
+        ),
+    ),
+    Module(
+        "_searching_functions.py",
+        "HasSearchingFunctions",
+        (
+            Spec(
+                "argmax",
+                "x: Array, /, *, axis: int | None = None, "
+                "keepdims: bool = False",
+            ),
+            Spec(
+                "argmin",
+                "x: Array, /, *, axis: int | None = None, "
+                "keepdims: bool = False",
+            ),
+            Spec("nonzero", "x: Array, /", "tuple[Array, ...]"),
+            Spec(
+                "where",
+                "condition: Array, "
+                "x1: Array | PyScalar, x2: Array | PyScalar, /",
+                arrays=("condition", "x1", "x2"),
+            ),
+        ),
+    ),
+    Module(
+        "_set_functions.py",
+        "HasSetFunctions",
+        (
+            Spec(
+                "unique_all", "x: Array, /", "tuple[Array, Array, Array, Array]"
+            ),
+            Spec("unique_counts", "x: Array, /", "tuple[Array, Array]"),
+            Spec("unique_inverse", "x: Array, /", "tuple[Array, Array]"),
+            Spec("unique_values", "x: Array, /"),
+        ),
+    ),
+    Module(
+        "_sorting_functions.py",
+        "HasSortingFunctions",
+        (
+            Spec("argsort", _SORT),
+            Spec("sort", _SORT),
+        ),
+    ),
+    Module(
+        "_statistical_functions.py",
+        "HasStatisticalFunctions",
+        (
+            Spec("max", _REDUCTION),
+            Spec("mean", _REDUCTION),
+            Spec("min", _REDUCTION),
+            Spec(
+                "prod",
+                "x: Array, /, *, axis: AxisT = None, "
+                "dtype: DType | None = None, keepdims: bool = False",
+            ),
+            Spec(
+                "std",
+                "x: Array, /, *, axis: AxisT = None, correction: float = 0.0, "
+                "keepdims: bool = False",
+            ),
+            Spec(
+                "sum",
+                "x: Array, /, *, axis: AxisT = None, "
+                "dtype: DType | None = None, keepdims: bool = False",
+            ),
+            Spec(
+                "var",
+                "x: Array, /, *, axis: AxisT = None, correction: float = 0.0, "
+                "keepdims: bool = False",
+            ),
+        ),
+    ),
+    Module(
+        "_utility_functions.py",
+        "HasUtilityFunctions",
+        (
+            Spec("all", _REDUCTION),
+            Spec("any", _REDUCTION),
+        ),
+    ),
+    Module(
+        "linalg/_core.py",
+        "ArrayAPILinAlgNamespace",
+        (
+            Spec("cholesky", "x: Array, /, *, upper: bool = False"),
+            Spec(
+                "cross",
+                "x1: Array, x2: Array, /, *, axis: int = -1",
+                arrays=("x1", "x2"),
+            ),
+            Spec("det", "x: Array, /"),
+            Spec("diagonal", "x: Array, /, *, offset: int = 0"),
+            Spec("eigh", "x: Array, /", "tuple[Array]"),
+            Spec("eigvalsh", "x: Array, /"),
+            Spec("inv", "x: Array, /"),
+            Spec("matmul", "x1: Array, x2: Array, /", arrays=("x1", "x2")),
+            Spec(
+                "matrix_norm",
+                "x: Array, /, *, keepdims: bool = False, "
+                "ord: float | Literal['fro', 'nuc'] | None = 'fro'",
+            ),
+            Spec("matrix_power", "x: Array, n: int, /"),
+            Spec(
+                "matrix_rank",
+                "x: Array, /, *, rtol: float | Array | None = None",
+            ),
+            Spec("matrix_transpose", "x: Array, /"),
+            Spec("outer", "x1: Array, x2: Array, /", arrays=("x1", "x2")),
+            Spec("pinv", "x: Array, /, *, rtol: float | Array | None = None"),
+            Spec(
+                "qr",
+                "x: Array, /, *, "
+                "mode: Literal['reduced', 'complete'] = 'reduced'",
+                "tuple[Array, Array]",
+            ),
+            Spec("slogdet", "x: Array, /", "tuple[Array, Array]"),
+            Spec("solve", "x1: Array, x2: Array, /", arrays=("x1", "x2")),
+            Spec(
+                "svd",
+                "x: Array, /, *, full_matrices: bool = True",
+                "Array | tuple[Array, ...]",
+            ),
+            Spec("svdvals", "x: Array, /"),
+            Spec(
+                "tensordot",
+                "x1: Array, x2: Array, /, *, " + _AXES,
+                arrays=("x1", "x2"),
+            ),
+            Spec("trace", "x: Array, /, *, offset: int = 0"),
+            Spec(
+                "vecdot",
+                "x1: Array, x2: Array, /, *, axis: int = -1",
+                arrays=("x1", "x2"),
+            ),
+            Spec(
+                "vector_norm",
+                "x: Array, /, *, axis: int | tuple[int, ...] | None = None, "
+                "keepdims: bool = False, ord: float = 2",
+            ),
+        ),
+        protocol_path="linalg/_namespace.py",
+        attribute="linalg",
+    ),
+)